@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Cleanup script to fix archive section formatting."""
 
+import re
 import sys
 from pathlib import Path
 
@@ -8,11 +9,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from learnbase.core.to_learn_manager import ToLearnManager
 
+# The header timestamp changes on every render, so ignore it when comparing
+TIMESTAMP_LINE = re.compile(r'^> Last updated: .*$', re.MULTILINE)
+
 
 def main():
     """Re-parse and re-write to clean up formatting."""
     manager = ToLearnManager()
 
+    current = manager.file_path.read_text(encoding='utf-8')
+
     # Read current data
     data = manager._parse_file()
 
@@ -20,6 +26,12 @@ def main():
     print(f"Found {len(data['detailed'])} detailed topics")
     print(f"Found {len(data['archived'])} archived topics")
 
+    # Skip the rewrite when the file is already in canonical form
+    cleaned = manager._render_file(data)
+    if TIMESTAMP_LINE.sub('', cleaned) == TIMESTAMP_LINE.sub('', current):
+        print("\n✓ File already clean, nothing to rewrite")
+        return
+
     # Re-write (this will fix the formatting)
     manager._write_file(data)
 
@@ -6,6 +6,7 @@ Usage:
     python scripts/migrate_to_learn.py
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -28,14 +29,22 @@ def main():
         return
 
     # Check if there are any .md files to migrate
-    md_files = list(old_dir.glob("*.md"))
-    if not md_files:
+    # scandir's DirEntry caches the file type, so no per-file stat() is needed
+    with os.scandir(old_dir) as it:
+        md_entries = [
+            e for e in it
+            if e.name.endswith(".md") and not e.name.startswith(".")
+            and e.is_file(follow_symlinks=False)
+        ]
+    if not md_entries:
         print(f"No markdown files found in {old_dir}")
         return
 
-    print(f"Found {len(md_files)} files to migrate:")
-    for f in md_files:
-        print(f"  - {f.name}")
+    print(f"Found {len(md_entries)} files to migrate:")
+    for e in md_entries:
+        print(f"  - {e.name}")
+
+    md_files = [Path(e.path) for e in md_entries]
 
     print("\nStarting migration...")
 
@@ -44,7 +53,7 @@ def main():
 
     # Run migration
     try:
-        summary = manager.migrate_from_old_files(old_dir)
+        summary = manager.migrate_from_old_files(old_dir, md_files)
 
         print("\n" + "="*60)
         print("Migration Summary")
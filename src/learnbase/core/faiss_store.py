@@ -0,0 +1,289 @@
+"""FAISS-backed vector store for note search.
+
+An alternative to the ChromaDB collection for corpora that fit in memory.
+FaissCollection implements the subset of the ChromaDB collection API that
+RAGManager uses (upsert, update, get, delete, query, count), so the manager
+drives either backend through the same code. Unlike ChromaDB, writes stay in
+memory until flush(), so a batch of writes costs one save. Every public
+method is safe to call from any thread.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import faiss
+    import numpy as np
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Embeds a batch of documents as L2-normalized float32 rows
+EmbedFn = Callable[[List[str]], Any]
+
+
+def _matches(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """
+    Evaluate a ChromaDB-style metadata filter.
+
+    Supports equality ({"key": value}) and the comparison operators
+    RAGManager uses ({"key": {"$gte": value}}); several keys must all match.
+    """
+    if not where:
+        return True
+    for key, condition in where.items():
+        value = metadata.get(key)
+        if isinstance(condition, dict):
+            for op, operand in condition.items():
+                if value is None:
+                    return False
+                if op == "$gte" and not value >= operand:
+                    return False
+                if op == "$gt" and not value > operand:
+                    return False
+                if op == "$lte" and not value <= operand:
+                    return False
+                if op == "$lt" and not value < operand:
+                    return False
+                if op == "$eq" and value != operand:
+                    return False
+                if op == "$ne" and value == operand:
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FaissCollection:
+    """Cosine search over an in-memory FAISS index with on-disk persistence."""
+
+    INDEX_FILE = "notes.faiss"
+    META_FILE = "notes.json"
+
+    # Vectors needed to train the int8 quantizer; smaller stores stay exact
+    QUANTIZE_MIN_VECTORS = 256
+
+    def __init__(self, path: Path, embed: EmbedFn, exact_precision: bool = False):
+        """
+        Open or create the store in a directory.
+
+        Args:
+            path: Directory holding the index and its metadata sidecar
+            embed: Function embedding a list of documents (normalized rows)
+            exact_precision: If True, keep float32 vectors. Otherwise the
+                index switches to int8 scalar quantization (4x smaller,
+                faster scans, slightly approximate scores) once it holds
+                QUANTIZE_MIN_VECTORS vectors to train on.
+
+        Raises:
+            ImportError: If faiss or numpy is not installed
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("faiss not installed. Install with: pip install faiss-cpu")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._embed = embed
+        self.exact_precision = exact_precision
+
+        # filename -> FAISS int64 id, and filename -> metadata
+        self._ids: Dict[str, int] = {}
+        self._metadatas: Dict[str, Dict[str, Any]] = {}
+        self._next_id = 0
+        self._index = None
+        # Set by writes not yet saved to disk
+        self._dirty = False
+        # Guards the index and both dicts. Writes arrive on RAGManager's
+        # index worker while queries run on the caller's thread; embedding
+        # happens outside the lock.
+        self._lock = threading.Lock()
+        self._load()
+
+    def _new_index(self, dim: int):
+        """Build an empty index for vectors of the given dimension."""
+        # Inner product on normalized vectors is cosine similarity; the ID
+        # map allows replacing and deleting single notes
+        return faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+
+    def _maybe_quantize(self) -> None:
+        """
+        Move a large enough float32 index to int8 scalar quantization.
+
+        The quantizer learns per-dimension ranges from the stored vectors,
+        which are re-added with their ids to the new index. Called with the
+        lock held.
+        """
+        if self.exact_precision or self._index is None:
+            return
+        inner = faiss.downcast_index(self._index.index)
+        if isinstance(inner, faiss.IndexScalarQuantizer) or self._index.ntotal < self.QUANTIZE_MIN_VECTORS:
+            return
+
+        vectors = inner.reconstruct_n(0, self._index.ntotal)
+        faiss_ids = faiss.vector_to_array(self._index.id_map)
+        quantized = faiss.IndexScalarQuantizer(
+            inner.d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        quantized.train(vectors)
+        index = faiss.IndexIDMap2(quantized)
+        index.add_with_ids(vectors, faiss_ids)
+        self._index = index
+        logger.info(f"Quantized FAISS index to int8 ({len(faiss_ids)} vectors)")
+
+    def _load(self) -> None:
+        """Read the index and sidecar from disk, if present."""
+        index_path = self.path / self.INDEX_FILE
+        meta_path = self.path / self.META_FILE
+        if not index_path.exists() or not meta_path.exists():
+            return
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            self._index = faiss.read_index(str(index_path))
+            self._ids = sidecar["ids"]
+            self._metadatas = sidecar["metadatas"]
+            self._next_id = sidecar["next_id"]
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            logger.error(f"Failed to load FAISS index from {self.path}, starting empty: {e}")
+            self._index = None
+            self._ids, self._metadatas, self._next_id = {}, {}, 0
+
+    def flush(self) -> None:
+        """Save pending writes to disk, if there are any."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def _save(self) -> None:
+        """Write the index and sidecar, each replaced atomically."""
+        if self._index is not None:
+            tmp_index = self.path / f"{self.INDEX_FILE}.tmp"
+            faiss.write_index(self._index, str(tmp_index))
+            os.replace(tmp_index, self.path / self.INDEX_FILE)
+
+        tmp_meta = self.path / f"{self.META_FILE}.tmp"
+        sidecar = {"ids": self._ids, "metadatas": self._metadatas, "next_id": self._next_id}
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_meta, self.path / self.META_FILE)
+
+    def _remove(self, ids: List[str]) -> None:
+        """Drop vectors and metadata for the given ids, without saving (lock held)."""
+        stale = [self._ids.pop(i) for i in ids if i in self._ids]
+        for i in ids:
+            self._metadatas.pop(i, None)
+        if stale and self._index is not None:
+            self._index.remove_ids(np.asarray(stale, dtype='int64'))
+
+    def upsert(self, ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Embed documents and add or replace them by id (saved on flush())."""
+        vectors = np.ascontiguousarray(self._embed(documents), dtype='float32')
+        with self._lock:
+            if self._index is None:
+                self._index = self._new_index(vectors.shape[1])
+
+            self._remove(ids)
+            new_ids = np.arange(self._next_id, self._next_id + len(ids), dtype='int64')
+            self._next_id += len(ids)
+            self._index.add_with_ids(vectors, new_ids)
+            for filename, faiss_id, metadata in zip(ids, new_ids.tolist(), metadatas):
+                self._ids[filename] = faiss_id
+                self._metadatas[filename] = metadata
+            self._maybe_quantize()
+            self._dirty = True
+
+    def update(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Replace metadata for existing ids without re-embedding (saved on flush())."""
+        with self._lock:
+            for filename, metadata in zip(ids, metadatas):
+                if filename in self._ids:
+                    self._metadatas[filename] = metadata
+                    self._dirty = True
+
+    def get(self, ids: Optional[List[str]] = None, include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Return ids and metadatas for the ids that are stored (all when ids is None)."""
+        with self._lock:
+            found = list(self._ids) if ids is None else [i for i in ids if i in self._ids]
+            return {"ids": found, "metadatas": [self._metadatas[i] for i in found]}
+
+    def delete(self, ids: List[str]) -> None:
+        """Remove ids from the store (saved on flush())."""
+        with self._lock:
+            self._remove(ids)
+            self._dirty = True
+
+    def count(self) -> int:
+        """Number of stored notes."""
+        with self._lock:
+            return len(self._ids)
+
+    def reset(self) -> None:
+        """Remove every note, keeping the store usable."""
+        with self._lock:
+            self._index = None
+            self._ids, self._metadatas, self._next_id = {}, {}, 0
+            self._dirty = False
+            for name in (self.INDEX_FILE, self.META_FILE):
+                try:
+                    (self.path / name).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def query(
+        self,
+        query_texts: List[str],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Find the nearest notes to each query text.
+
+        Returns ChromaDB-shaped results: per query, lists of ids, metadatas
+        and cosine distances (1 - similarity), nearest first.
+        """
+        results: Dict[str, List[List[Any]]] = {"ids": [], "metadatas": [], "distances": []}
+        empty = {key: [[] for _ in query_texts] for key in results}
+        with self._lock:
+            if self._index is None or not self._ids:
+                return empty
+
+        # Embed without the lock, so writes are not held up by queries
+        vectors = np.ascontiguousarray(self._embed(query_texts), dtype='float32')
+
+        with self._lock:
+            # Emptied by a write while embedding
+            if self._index is None or not self._ids:
+                return empty
+
+            by_faiss_id = {faiss_id: filename for filename, faiss_id in self._ids.items()}
+            # Filters are applied after search, so search everything when filtering
+            k = len(self._ids) if where else min(n_results, len(self._ids))
+            scores, faiss_ids = self._index.search(vectors, k)
+
+            for row_scores, row_ids in zip(scores, faiss_ids):
+                ids: List[str] = []
+                metadatas: List[Dict[str, Any]] = []
+                distances: List[float] = []
+                for score, faiss_id in zip(row_scores.tolist(), row_ids.tolist()):
+                    filename = by_faiss_id.get(faiss_id)
+                    if filename is None:
+                        continue
+                    metadata = self._metadatas[filename]
+                    if not _matches(metadata, where):
+                        continue
+                    ids.append(filename)
+                    metadatas.append(metadata)
+                    distances.append(1.0 - score)
+                    if len(ids) == n_results:
+                        break
+                results["ids"].append(ids)
+                results["metadatas"].append(metadatas)
+                results["distances"].append(distances)
+        return results
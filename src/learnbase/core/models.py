@@ -1,11 +1,16 @@
 """Data models for LearnBase."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, Dict, List, Any, Literal, cast
+from datetime import date, datetime
+from typing import Optional, Dict, Iterable, List, Any, Literal, Tuple, ClassVar, Callable, cast
 from pathlib import Path
 import re
-import frontmatter
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
 
 from .parsers import (
     parse_datetime,
@@ -26,114 +31,318 @@ from .parsers import (
 EMA_NEW_WEIGHT = 0.7  # Weight given to the new score
 EMA_OLD_WEIGHT = 0.3  # Weight given to the previous average
 
+
+def _check_unit_score(value: Any, label: str) -> float:
+    """
+    Validate a score in [0.0, 1.0] and return it as a float.
+
+    Args:
+        value: Value to check
+        label: Name used in error messages (e.g. "Confidence score")
+
+    Raises:
+        ValueError: If value is not numeric or out of range
+    """
+    if isinstance(value, (int, float)) and 0.0 <= value <= 1.0:
+        return float(value)
+    if not isinstance(value, (int, float)):
+        raise ValueError(f"{label} must be numeric, got {type(value).__name__}")
+    raise ValueError(f"{label} must be between 0.0 and 1.0, got {value}")
+
+
+# Frontmatter fence: "---" on its own line (same rule as python-frontmatter)
+_FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+
+def _load_frontmatter(filepath: Path) -> Tuple[Dict[str, Any], str]:
+    """
+    Read a markdown file and split it into (metadata, content).
+
+    Reads the file once and parses the YAML block directly (with the libyaml
+    C loader when available). Files without frontmatter yield empty metadata
+    and the full text.
+
+    Args:
+        filepath: Path to the markdown file
+
+    Returns:
+        Tuple of (metadata dict, stripped markdown content)
+    """
+    text = filepath.read_text(encoding='utf-8').strip()
+
+    if not _FM_BOUNDARY.match(text):
+        return {}, text
+
+    parts = _FM_BOUNDARY.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+
+    _, fm, content = parts
+    metadata = yaml.load(fm, Loader=_YAMLLoader)
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    return metadata, content.strip()
+
+
+def _load_frontmatter_header(filepath: Path) -> Dict[str, Any]:
+    """
+    Parse only the frontmatter block of a markdown file.
+
+    Stops reading at the closing '---', so the markdown body is never read.
+
+    Args:
+        filepath: Path to the markdown file
+
+    Returns:
+        Metadata dict (empty if the file has no complete frontmatter block)
+    """
+    fm_lines = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+        if not _FM_BOUNDARY.match(line.lstrip()):
+            return {}
+
+        for line in f:
+            if _FM_BOUNDARY.match(line):
+                break
+            fm_lines.append(line)
+        else:
+            return {}
+
+    metadata = yaml.load(''.join(fm_lines), Loader=_YAMLLoader)
+    return metadata if isinstance(metadata, dict) else {}
+
+
+# Strings YAML would emit unquoted and load back as the same string
+_PLAIN_YAML_STR = re.compile(r"[A-Za-z_][A-Za-z0-9_ .-]*")
+_YAML_RESERVED_WORDS = frozenset({'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+
+
+def _yaml_scalar(value: Any) -> Optional[str]:
+    """
+    Format a scalar as a YAML value, or return None if it needs the full dumper.
+
+    Matches what yaml.safe_dump would emit for the common cases so files stay
+    diff-stable; anything unusual is left to the dumper.
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value or value in (float('inf'), float('-inf')):
+            return None
+        text = repr(value).lower()
+        if '.' not in text and 'e' in text:
+            text = text.replace('e', '.0e', 1)
+        return text
+    if isinstance(value, str):
+        if (_PLAIN_YAML_STR.fullmatch(value) and not value.endswith(' ')
+                and value.lower() not in _YAML_RESERVED_WORDS):
+            return value
+        if value.isprintable():
+            return "'" + value.replace("'", "''") + "'"
+        return None
+    return None
+
+
+def _dump_frontmatter(metadata: Dict[str, Any]) -> str:
+    """
+    Serialize frontmatter metadata as block-style YAML with sorted keys.
+
+    Scalars and empty containers are written directly; only non-empty lists
+    and dicts (and rare scalars) go through the YAML dumper, one value at a time.
+
+    Args:
+        metadata: Frontmatter fields (str/number/bool/None/list/dict values)
+
+    Returns:
+        YAML text without the '---' delimiters or a trailing newline
+    """
+    lines = []
+    for key in sorted(metadata):
+        value = metadata[key]
+        text = _yaml_scalar(value)
+        if text is not None:
+            lines.append(f"{key}: {text}")
+        elif isinstance(value, (list, dict)) and not value:
+            lines.append(f"{key}: {'[]' if isinstance(value, list) else '{}'}")
+        elif isinstance(value, (list, dict)):
+            dumped = yaml.dump(
+                value, Dumper=_YAMLDumper, default_flow_style=False, allow_unicode=True
+            ).rstrip('\n')
+            if isinstance(value, dict):
+                dumped = '\n'.join('  ' + line if line else line for line in dumped.split('\n'))
+            lines.append(f"{key}:\n{dumped}")
+        else:
+            dumped = yaml.dump(
+                {key: value}, Dumper=_YAMLDumper, default_flow_style=False, allow_unicode=True
+            )
+            lines.append(dumped.rstrip('\n'))
+    return '\n'.join(lines)
+
+
+class _SlugCharTable(dict):
+    """
+    str.translate table that keeps alphanumerics and whitespace, drops the rest.
+
+    Entries are filled in per code point on first lookup, so the table only
+    ever holds characters that have actually appeared in titles.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_CHARS = _SlugCharTable()
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _iso_or_none(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# (frontmatter key, attribute name, optional transform)
+_MetaFields = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
 # ================================================================
 # NOTE - Parent class
 # ================================================================
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Base class for a note"""
     filename: str
     title: str
     body: str
 
+    # Last to_markdown_file() result, keyed on the serialized state that produced it
+    _markdown_cache: Optional[Tuple[Tuple[str, str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Body and its UTF-8 encoding from the last to_markdown_chunks() call
+    _body_bytes: Optional[Tuple[str, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Title, body and the embedding_document() built from them
+    _embedding_doc: Optional[Tuple[str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Frontmatter layout; child classes declare their own
+    _META_FIELDS: ClassVar[_MetaFields] = ()
+
     def _get_metadata(self) -> dict:
-        """Override in child classes to provide metadata for serialization."""
-        raise NotImplementedError("Child classes must implement _get_metadata")
+        """Build the frontmatter dict described by the class's _META_FIELDS."""
+        fields = self._META_FIELDS
+        if not fields:
+            raise NotImplementedError("Child classes must declare _META_FIELDS")
+        metadata = {}
+        for key, attr, transform in fields:
+            value = getattr(self, attr)
+            metadata[key] = transform(value) if transform else value
+        return metadata
 
     @classmethod
-    def from_markdown_file(cls, filepath: Path) -> 'Note':
+    def from_markdown_file(cls, filepath: Path, include_body: bool = True) -> 'Note':
         """
         Create a Note from a markdown file with YAML frontmatter.
 
         Args:
             filepath: Path to the markdown file
+            include_body: If False, only the frontmatter is read and body is
+                left empty. Such notes are metadata-only summaries and must
+                not be saved back to disk.
 
         Returns:
             Note instance (either ReviewNote or ReferenceNote)
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
+        if include_body:
+            meta, content = _load_frontmatter(filepath)
+        else:
+            meta, content = _load_frontmatter_header(filepath), ""
 
-        note_type = post.get('type', 'review')
+        note_type = meta.get('type', 'review')
 
         if note_type == 'drill':
             now = datetime.now()
-            created_at = parse_datetime(post.get('created'), now)
-            last_reviewed = parse_review(post.get('last_reviewed'))
-            next_review = parse_datetime(post.get('next_review'), now)
+            created_at = parse_datetime(meta.get('created'), now)
+            last_reviewed = parse_review(meta.get('last_reviewed'))
+            next_review = parse_datetime(meta.get('next_review'), now)
 
             return DrillNote(
                 filename=filepath.name,
-                title=str(post.get('title', filepath.stem.replace('-', ' ').title())),
-                body=str(post.content),
-                language=str(post.get('language', 'text')),
-                tags=cast(List[str], parse_list(post.get('tags'))),
-                why_captured=str(post.get('why_captured', '')),
-                sources=cast(List[Dict[str, str]], parse_list(post.get('sources'))),
+                title=str(meta.get('title', filepath.stem.replace('-', ' ').title())),
+                body=content,
+                language=str(meta.get('language', 'text')),
+                tags=cast(List[str], parse_list(meta.get('tags'))),
+                why_captured=str(meta.get('why_captured', '')),
+                sources=cast(List[Dict[str, str]], parse_list(meta.get('sources'))),
                 created_at=created_at,
                 last_reviewed=last_reviewed,
                 next_review=next_review,
-                ladder_step=parse_int(post.get('ladder_step'), 0),
-                review_count=parse_int(post.get('review_count'), 0),
-                fail_streak=parse_int(post.get('fail_streak'), 0),
-                needs_rewrite=bool(post.get('needs_rewrite', False)),
+                ladder_step=parse_int(meta.get('ladder_step'), 0),
+                review_count=parse_int(meta.get('review_count'), 0),
+                fail_streak=parse_int(meta.get('fail_streak'), 0),
+                needs_rewrite=bool(meta.get('needs_rewrite', False)),
                 variants_status=cast(
                     Literal['pending', 'ready', 'failed'],
-                    post.get('variants_status', 'pending')
+                    meta.get('variants_status', 'pending')
                 ),
-                buddy_variants=cast(List[Dict[str, Any]], parse_list(post.get('buddy_variants'))),
-                reverse_variants=cast(List[Dict[str, Any]], parse_list(post.get('reverse_variants'))),
-            )
-        elif note_type == 'reference':
-            now = datetime.now()
-            created_at = parse_datetime(post.get('created'), now)
-
-            return ReferenceNote(
-                filename=filepath.name,
-                title=str(post.get('title', filepath.stem.replace('-', ' ').title())),
-                body=str(post.content),
-                created_at=created_at,
-                confidence_score=parse_optional_float(post.get('confidence_score')),
-                sources=cast(List[Dict[str, str]], parse_list(post.get('sources')))
+                buddy_variants=cast(List[Dict[str, Any]], parse_list(meta.get('buddy_variants'))),
+                reverse_variants=cast(List[Dict[str, Any]], parse_list(meta.get('reverse_variants'))),
             )
-        elif note_type == 'evergreen':
+        elif note_type in ('reference', 'evergreen'):
             now = datetime.now()
-            created_at = parse_datetime(post.get('created'), now)
+            created_at = parse_datetime(meta.get('created'), now)
+            stored_cls = ReferenceNote if note_type == 'reference' else EvergreenNote
 
-            return EvergreenNote(
+            return stored_cls(
                 filename=filepath.name,
-                title=str(post.get('title', filepath.stem.replace('-', ' ').title())),
-                body=str(post.content),
+                title=str(meta.get('title', filepath.stem.replace('-', ' ').title())),
+                body=content,
                 created_at=created_at,
-                confidence_score=parse_optional_float(post.get('confidence_score')),
-                sources=cast(List[Dict[str, str]], parse_list(post.get('sources')))
+                confidence_score=parse_optional_float(meta.get('confidence_score')),
+                sources=cast(List[Dict[str, str]], parse_list(meta.get('sources')))
             )
         else:
 
             now = datetime.now()
-            created_at = parse_datetime(post.get('created'), now)
-            last_reviewed = parse_review(post.get('last_reviewed'))
-            next_review = parse_datetime(post.get('next_review'), now)
+            created_at = parse_datetime(meta.get('created'), now)
+            last_reviewed = parse_review(meta.get('last_reviewed'))
+            next_review = parse_datetime(meta.get('next_review'), now)
 
             return ReviewNote(
                 filename=filepath.name,
-                title=str(post.get('title', filepath.stem.replace('-', ' ').title())),
-                body=str(post.content),
-                review_mode=cast(Literal['spaced', 'scheduled'], post.get('review_mode', 'spaced')),
-                schedule_pattern=cast(Optional[str], post.get('schedule_pattern')),
+                title=str(meta.get('title', filepath.stem.replace('-', ' ').title())),
+                body=content,
+                review_mode=cast(Literal['spaced', 'scheduled'], meta.get('review_mode', 'spaced')),
+                schedule_pattern=cast(Optional[str], meta.get('schedule_pattern')),
                 created_at=created_at,
                 last_reviewed=last_reviewed,
                 next_review=next_review,
-                interval_days=parse_int(post.get('interval_days'), 1),
-                ease_factor=parse_float(post.get('ease_factor'), 2.5),
-                review_count=parse_int(post.get('review_count'), 0),
-                question_performance=cast(Dict[str, float], parse_dict(post.get('question_performance'))),
-                priority_questions=cast(List[str], parse_list(post.get('priority_questions'))),
-                last_session_summary=cast(Dict[str, Any], parse_dict(post.get('last_session_summary'))),
-                learned_content_count=parse_int(post.get('learned_content_count'), 0),
-                priority_requests=cast(List[Dict[str, Any]], parse_list(post.get('priority_requests'))),
-                confidence_score=parse_optional_float(post.get('confidence_score')),
-                sources=cast(List[Dict[str, str]], parse_list(post.get('sources')))
+                interval_days=parse_int(meta.get('interval_days'), 1),
+                ease_factor=parse_float(meta.get('ease_factor'), 2.5),
+                review_count=parse_int(meta.get('review_count'), 0),
+                question_performance=cast(Dict[str, float], parse_dict(meta.get('question_performance'))),
+                priority_questions=cast(List[str], parse_list(meta.get('priority_questions'))),
+                last_session_summary=cast(Dict[str, Any], parse_dict(meta.get('last_session_summary'))),
+                learned_content_count=parse_int(meta.get('learned_content_count'), 0),
+                priority_requests=cast(List[Dict[str, Any]], parse_list(meta.get('priority_requests'))),
+                confidence_score=parse_optional_float(meta.get('confidence_score')),
+                sources=cast(List[Dict[str, str]], parse_list(meta.get('sources')))
             )
 
     def to_markdown_file(self) -> str:
@@ -145,8 +354,49 @@ class Note:
         """
         metadata = self._get_metadata()
 
-        post = frontmatter.Post(self.body, **metadata)
-        return frontmatter.dumps(post)
+        # repr() of the metadata (plain str/number/list/dict values) is far
+        # cheaper than a YAML dump and changes whenever a serialized field does
+        key = (repr(metadata), self.body)
+        if self._markdown_cache is not None and self._markdown_cache[0] == key:
+            return self._markdown_cache[1]
+
+        markdown = f"---\n{_dump_frontmatter(metadata)}\n---\n\n{self.body}"
+        self._markdown_cache = (key, markdown)
+        return markdown
+
+    def embedding_document(self) -> str:
+        """
+        Text to embed for semantic search: the title and body.
+
+        Built once and reused until the title or body changes, so notes that
+        stay cached are not re-concatenated on every index.
+
+        Returns:
+            Title and body separated by a blank line
+        """
+        title, body = self.title, self.body
+        cached = self._embedding_doc
+        if cached is None or cached[0] != title or cached[1] != body:
+            cached = self._embedding_doc = (title, body, f"{title}\n\n{body}")
+        return cached[2]
+
+    def to_markdown_chunks(self) -> Tuple[bytes, bytes]:
+        """
+        Encode the markdown file as separate frontmatter and body chunks.
+
+        Concatenated, the chunks equal to_markdown_file() in UTF-8. The body
+        encoding is kept until the body changes, so metadata-only saves such
+        as review updates re-encode just the frontmatter.
+
+        Returns:
+            Tuple of (frontmatter bytes, body bytes)
+        """
+        body = self.body
+        cached = self._body_bytes
+        if cached is None or cached[0] != body:
+            cached = self._body_bytes = (body, body.encode('utf-8'))
+        header = f"---\n{_dump_frontmatter(self._get_metadata())}\n---\n\n"
+        return header.encode('utf-8'), cached[1]
 
     @staticmethod
     def create_filename(title: str) -> str:
@@ -160,7 +410,7 @@ class Note:
             Safe filename (lowercase, hyphens, .md extension)
         """
         # Remove special characters and convert to lowercase
-        safe_title = ''.join(c if c.isalnum() or c.isspace() else '' for c in title)
+        safe_title = title.translate(_SLUG_CHARS)
         # Replace spaces with hyphens
         filename = '-'.join(safe_title.lower().split())
         # Limit length
@@ -169,13 +419,11 @@ class Note:
         return f"{filename}.md"
 
 # ================================================================
-# REFERENCE - Child class
+# STORED - Shared base for notes outside spaced repetition
 # ================================================================
-@dataclass
-class ReferenceNote(Note):
-    """Reference note - not being used for spaced repetition"""
-
-    type: str = "reference"
+@dataclass(slots=True)
+class _StoredNote(Note):
+    """Fields and behaviour shared by ReferenceNote and EvergreenNote."""
 
     # Metadata fields (same as ReviewNote for consistency)
     created_at: datetime = field(default_factory=datetime.now)
@@ -183,14 +431,13 @@ class ReferenceNote(Note):
     sources: List[Dict[str, str]] = field(default_factory=list)
     # Structure: [{"url": str, "title": str (optional), "accessed_date": str (optional), "note": str (optional)}]
 
-    def _get_metadata(self) -> dict:
-        return {
-            'title': self.title,
-            'type': self.type,
-            'created': self.created_at.isoformat(),
-            'confidence_score': self.confidence_score,
-            'sources': self.sources
-        }
+    _META_FIELDS: ClassVar[_MetaFields] = (
+        ('title', 'title', None),
+        ('type', 'type', None),
+        ('created', 'created_at', _iso),
+        ('confidence_score', 'confidence_score', None),
+        ('sources', 'sources', None),
+    )
 
     def set_confidence_score(self, score: float):
         """
@@ -202,60 +449,50 @@ class ReferenceNote(Note):
         Raises:
             ValueError: If score is invalid
         """
-        if not isinstance(score, (int, float)):
-            raise ValueError(f"Confidence score must be numeric, got {type(score).__name__}")
-        if not 0.0 <= score <= 1.0:
-            raise ValueError(f"Confidence score must be between 0.0 and 1.0, got {score}")
+        self.confidence_score = _check_unit_score(score, "Confidence score")
 
-        self.confidence_score = score
+
+# ================================================================
+# REFERENCE - Child class
+# ================================================================
+@dataclass(slots=True)
+class ReferenceNote(_StoredNote):
+    """Reference note - not being used for spaced repetition"""
+
+    type: str = "reference"
 
 
 # ================================================================
 # EVERGREEN - Child class
 # ================================================================
-@dataclass
-class EvergreenNote(Note):
+@dataclass(slots=True)
+class EvergreenNote(_StoredNote):
     """Evergreen note - manually curated by user; LLMs can read but not edit"""
 
     type: str = "evergreen"
 
-    # Metadata fields (same as ReferenceNote for consistency)
-    created_at: datetime = field(default_factory=datetime.now)
-    confidence_score: Optional[float] = None
-    sources: List[Dict[str, str]] = field(default_factory=list)
-    # Structure: [{"url": str, "title": str (optional), "accessed_date": str (optional), "note": str (optional)}]
-
-    def _get_metadata(self) -> dict:
-        return {
-            'title': self.title,
-            'type': self.type,
-            'created': self.created_at.isoformat(),
-            'confidence_score': self.confidence_score,
-            'sources': self.sources
-        }
-
-    def set_confidence_score(self, score: float):
-        """
-        Set confidence score with validation.
-
-        Args:
-            score: Confidence score (0.0-1.0)
-
-        Raises:
-            ValueError: If score is invalid
-        """
-        if not isinstance(score, (int, float)):
-            raise ValueError(f"Confidence score must be numeric, got {type(score).__name__}")
-        if not 0.0 <= score <= 1.0:
-            raise ValueError(f"Confidence score must be between 0.0 and 1.0, got {score}")
-
-        self.confidence_score = score
-
 
 # ================================================================
 # REVIEW - Child class
 # ================================================================
-@dataclass
+_REVIEW_FULL_TEMPLATE = (
+    "# {title}\n"
+    "\n"
+    "**File**: {filename}\n"
+    "**Mode**: {mode}\n"
+    "**Created**: {created:%Y-%m-%d}\n"
+    "**Last reviewed**: {last_reviewed}\n"
+    "**Next review**: {next_review:%Y-%m-%d}\n"
+    "**Interval**: {interval} days\n"
+    "**Ease factor**: {ease:.2f}\n"
+    "**Review count**: {count}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "{body}"
+)
+
+@dataclass(slots=True)
 class ReviewNote(Note):
     """Represents a learning note stored as a markdown file."""
 
@@ -284,53 +521,50 @@ class ReviewNote(Note):
     sources: List[Dict[str, str]] = field(default_factory=list)
     # Structure: [{"url": str, "title": str (optional), "accessed_date": str (optional), "note": str (optional)}]
 
-    def _get_metadata(self) -> dict:
-        return {
-            'title': self.title,
-            'type': self.type,
-            'created': self.created_at.isoformat(),
-            'review_mode': self.review_mode,
-            'next_review': self.next_review.isoformat(),
-            'interval_days': self.interval_days,
-            'ease_factor': self.ease_factor,
-            'review_count': self.review_count,
-            'last_reviewed': self.last_reviewed.isoformat() if self.last_reviewed else None,
-            'schedule_pattern': self.schedule_pattern,
-            'question_performance': self.question_performance,
-            'priority_questions': self.priority_questions,
-            'last_session_summary': self.last_session_summary,
-            'learned_content_count': self.learned_content_count,
-            'priority_requests': self.priority_requests,
-            'confidence_score': self.confidence_score,
-            'sources': self.sources
-        }
+    _META_FIELDS: ClassVar[_MetaFields] = (
+        ('title', 'title', None),
+        ('type', 'type', None),
+        ('created', 'created_at', _iso),
+        ('review_mode', 'review_mode', None),
+        ('next_review', 'next_review', _iso),
+        ('interval_days', 'interval_days', None),
+        ('ease_factor', 'ease_factor', None),
+        ('review_count', 'review_count', None),
+        ('last_reviewed', 'last_reviewed', _iso_or_none),
+        ('schedule_pattern', 'schedule_pattern', None),
+        ('question_performance', 'question_performance', None),
+        ('priority_questions', 'priority_questions', None),
+        ('last_session_summary', 'last_session_summary', None),
+        ('learned_content_count', 'learned_content_count', None),
+        ('priority_requests', 'priority_requests', None),
+        ('confidence_score', 'confidence_score', None),
+        ('sources', 'sources', None),
+    )
 
     def format_full(self) -> str:
         """Format note with all details and full content."""
-        lines = [
-            f"# {self.title}",
-            "",
-            f"**File**: {self.filename}",
-            f"**Mode**: {self.review_mode}",
-            f"**Created**: {self.created_at.strftime('%Y-%m-%d')}",
-            f"**Last reviewed**: {self.last_reviewed.strftime('%Y-%m-%d') if self.last_reviewed else 'Never'}",
-            f"**Next review**: {self.next_review.strftime('%Y-%m-%d')}",
-            f"**Interval**: {self.interval_days} days",
-            f"**Ease factor**: {self.ease_factor:.2f}",
-            f"**Review count**: {self.review_count}",
-            "",
-            "---",
-            "",
-            self.body
-        ]
+        return _REVIEW_FULL_TEMPLATE.format(
+            title=self.title,
+            filename=self.filename,
+            mode=self.review_mode,
+            created=self.created_at,
+            last_reviewed=f"{self.last_reviewed:%Y-%m-%d}" if self.last_reviewed else "Never",
+            next_review=self.next_review,
+            interval=self.interval_days,
+            ease=self.ease_factor,
+            count=self.review_count,
+            body=self.body,
+        )
 
-        return "\n".join(lines)
+    def days_until_review(self, today: Optional[date] = None) -> int:
+        """
+        Calculate days until next review.
 
-    def days_until_review(self) -> int:
-        """Calculate days until next review."""
-        delta = self.next_review.replace(hour=0, minute=0, second=0, microsecond=0) - \
-                datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return delta.days
+        Args:
+            today: Reference date; pass one when checking many notes in a row
+                (default: date.today())
+        """
+        return self.next_review.toordinal() - (today or date.today()).toordinal()
 
     def get_question_score(self, question_hash: str) -> Optional[float]:
         """
@@ -355,20 +589,26 @@ class ReviewNote(Note):
         Raises:
             ValueError: If score is invalid
         """
-        if not isinstance(score, (int, float)):
-            raise ValueError(f"Score must be numeric, got {type(score).__name__}")
-        if not 0.0 <= score <= 1.0:
-            raise ValueError(f"Score must be between 0.0 and 1.0, got {score}")
+        self._update_question_scores_unchecked(((question_hash, _check_unit_score(score, "Score")),))
 
-        if question_hash in self.question_performance:
-            # Exponential moving average
-            previous_avg = self.question_performance[question_hash]
-            self.question_performance[question_hash] = (
-                EMA_NEW_WEIGHT * score + EMA_OLD_WEIGHT * previous_avg
-            )
-        else:
-            # First time seeing this question
-            self.question_performance[question_hash] = score
+    def _update_question_scores_unchecked(self, question_scores: Iterable[Tuple[str, float]]):
+        """
+        Apply EMA updates for a batch of (question_hash, score) pairs.
+
+        No validation; callers must have checked every score. The dict and
+        weights are bound to locals once for the whole batch.
+        """
+        performance = self.question_performance
+        new_weight = EMA_NEW_WEIGHT
+        old_weight = EMA_OLD_WEIGHT
+        for question_hash, score in question_scores:
+            previous_avg = performance.get(question_hash)
+            if previous_avg is None:
+                # First time seeing this question
+                performance[question_hash] = score
+            else:
+                # Exponential moving average
+                performance[question_hash] = new_weight * score + old_weight * previous_avg
 
     def set_confidence_score(self, score: float):
         """
@@ -380,18 +620,19 @@ class ReviewNote(Note):
         Raises:
             ValueError: If score is invalid
         """
-        if not isinstance(score, (int, float)):
-            raise ValueError(f"Confidence score must be numeric, got {type(score).__name__}")
-        if not 0.0 <= score <= 1.0:
-            raise ValueError(f"Confidence score must be between 0.0 and 1.0, got {score}")
-
-        self.confidence_score = score
+        self.confidence_score = _check_unit_score(score, "Confidence score")
 
 
 # ================================================================
 # DRILL - Code drill flashcard
 # ================================================================
-@dataclass
+_DRILL_PROMPT_SECTION = re.compile(
+    r'^##\s+Prompt\s*\n(.*?)(?=^##\s+Model Answer|\Z)', re.MULTILINE | re.DOTALL
+)
+_DRILL_ANSWER_SECTION = re.compile(r'^##\s+Model Answer\s*\n(.*?)\Z', re.MULTILINE | re.DOTALL)
+_CODE_FENCE = re.compile(r'^```[^\n]*\n(.*?)\n```\s*$', re.DOTALL)
+
+@dataclass(slots=True)
 class DrillNote(Note):
     """Code drill flashcard with ladder-based spaced repetition and three review modes."""
 
@@ -413,31 +654,28 @@ class DrillNote(Note):
     buddy_variants: List[Dict[str, Any]] = field(default_factory=list)
     reverse_variants: List[Dict[str, Any]] = field(default_factory=list)
 
-    def _get_metadata(self) -> dict:
-        return {
-            'title': self.title,
-            'type': self.type,
-            'language': self.language,
-            'tags': self.tags,
-            'why_captured': self.why_captured,
-            'sources': self.sources,
-            'created': self.created_at.isoformat(),
-            'review_mode': self.review_mode,
-            'ladder_step': self.ladder_step,
-            'next_review': self.next_review.isoformat(),
-            'last_reviewed': self.last_reviewed.isoformat() if self.last_reviewed else None,
-            'review_count': self.review_count,
-            'fail_streak': self.fail_streak,
-            'needs_rewrite': self.needs_rewrite,
-            'variants_status': self.variants_status,
-            'buddy_variants': self.buddy_variants,
-            'reverse_variants': self.reverse_variants,
-        }
-
-    def days_until_review(self) -> int:
-        delta = self.next_review.replace(hour=0, minute=0, second=0, microsecond=0) - \
-                datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return delta.days
+    _META_FIELDS: ClassVar[_MetaFields] = (
+        ('title', 'title', None),
+        ('type', 'type', None),
+        ('language', 'language', None),
+        ('tags', 'tags', None),
+        ('why_captured', 'why_captured', None),
+        ('sources', 'sources', None),
+        ('created', 'created_at', _iso),
+        ('review_mode', 'review_mode', None),
+        ('ladder_step', 'ladder_step', None),
+        ('next_review', 'next_review', _iso),
+        ('last_reviewed', 'last_reviewed', _iso_or_none),
+        ('review_count', 'review_count', None),
+        ('fail_streak', 'fail_streak', None),
+        ('needs_rewrite', 'needs_rewrite', None),
+        ('variants_status', 'variants_status', None),
+        ('buddy_variants', 'buddy_variants', None),
+        ('reverse_variants', 'reverse_variants', None),
+    )
+
+    def days_until_review(self, today: Optional[date] = None) -> int:
+        return self.next_review.toordinal() - (today or date.today()).toordinal()
 
     def parse_prompt_and_answer(self) -> tuple[str, str]:
         """Extract prompt and model answer from the markdown body.
@@ -456,17 +694,11 @@ class DrillNote(Note):
     @staticmethod
     def parse_body(body: str) -> tuple[str, str]:
         """Parse a drill body into (prompt, model_answer)."""
-        prompt_match = re.search(
-            r'^##\s+Prompt\s*\n(.*?)(?=^##\s+Model Answer|\Z)',
-            body, re.MULTILINE | re.DOTALL
-        )
-        answer_match = re.search(
-            r'^##\s+Model Answer\s*\n(.*?)\Z',
-            body, re.MULTILINE | re.DOTALL
-        )
+        prompt_match = _DRILL_PROMPT_SECTION.search(body)
+        answer_match = _DRILL_ANSWER_SECTION.search(body)
         prompt = prompt_match.group(1).strip() if prompt_match else ""
         raw_answer = answer_match.group(1).strip() if answer_match else ""
-        fence = re.match(r'^```[^\n]*\n(.*?)\n```\s*$', raw_answer, re.DOTALL)
+        fence = _CODE_FENCE.match(raw_answer)
         answer = fence.group(1) if fence else raw_answer
         return prompt, answer
 
@@ -529,26 +761,25 @@ class Task:
         Returns:
             Task instance
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
+        meta, content = _load_frontmatter(filepath)
 
         now = datetime.now()
 
         return Task(
-            id=str(post.get('id', filepath.stem)),
-            title=str(post.get('title', '')),
-            description=str(post.content),
-            categories=parse_categories(post.get('categories')),
-            workspace=parse_workspace(post.get('workspace')),
-            project=str(post['project']) if post.get('project') else None,
-            due=parse_datetime(post.get('due'), now),
-            status=str(post.get('status', 'pending')),
-            dependencies=parse_categories(post.get('dependencies')),
-            created=parse_datetime(post.get('created'), now),
-            updated=parse_datetime(post.get('updated'), now),
-            completed=parse_datetime(post['completed'], now) if post.get('completed') else None,
-            confidence=parse_confidence(post.get('confidence')),
-            reasoning=str(post['reasoning']) if post.get('reasoning') else None,
+            id=str(meta.get('id', filepath.stem)),
+            title=str(meta.get('title', '')),
+            description=content,
+            categories=parse_categories(meta.get('categories')),
+            workspace=parse_workspace(meta.get('workspace')),
+            project=str(meta['project']) if meta.get('project') else None,
+            due=parse_datetime(meta.get('due'), now),
+            status=str(meta.get('status', 'pending')),
+            dependencies=parse_categories(meta.get('dependencies')),
+            created=parse_datetime(meta.get('created'), now),
+            updated=parse_datetime(meta.get('updated'), now),
+            completed=parse_datetime(meta['completed'], now) if meta.get('completed') else None,
+            confidence=parse_confidence(meta.get('confidence')),
+            reasoning=str(meta['reasoning']) if meta.get('reasoning') else None,
             filename=filepath.name
         )
 
@@ -575,8 +806,7 @@ class Task:
             'reasoning': self.reasoning
         }
 
-        post = frontmatter.Post(self.description, **metadata)
-        return frontmatter.dumps(post)
+        return f"---\n{_dump_frontmatter(metadata)}\n---\n\n{self.description}"
 
     @staticmethod
     def create_id(title: str, due: datetime) -> str:
@@ -594,7 +824,7 @@ class Task:
         date_prefix = due.strftime('%Y-%m-%d')
 
         # Create slug from title
-        safe_title = ''.join(c if c.isalnum() or c.isspace() else '' for c in title)
+        safe_title = title.translate(_SLUG_CHARS)
         slug = '-'.join(safe_title.lower().split())
 
         # Limit slug length
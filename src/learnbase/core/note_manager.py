@@ -1,33 +1,252 @@
 """Note manager for markdown-based learning notes."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Optional, Any, Tuple, Literal, Dict
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, List, Optional, Any, Tuple, Literal, Dict, Iterator
+import atexit
+import copy
+import hashlib
+import heapq
+import os
 import re
 import logging
 import json
+from stat import S_IMODE
 
 from .models import Note, ReviewNote, ReferenceNote, EvergreenNote, DrillNote
 from .spaced_rep import (
     calculate_next_review,
     calculate_scheduled_review,
     calculate_ladder_review,
+    parse_schedule_pattern,
     LADDER_INTERVALS,
     REWRITE_FAIL_THRESHOLD,
 )
 
+if TYPE_CHECKING:
+    # rag_manager imports this module (and chromadb) at runtime
+    from .rag_manager import RAGManager
+
 logger = logging.getLogger(__name__)
 
 
+def _next_review_key(note: Any) -> datetime:
+    return note.next_review
+
+
+def _confidence_key(note: Any) -> Tuple[float, datetime]:
+    return note.confidence_score, note.next_review
+
+
+def _copy_note(note: Note) -> Note:
+    """
+    Copy a note so the caller can modify it without touching the cache.
+
+    Only the list and dict fields (sources, tags, question performance, ...)
+    are deep-copied; strings, datetimes and the serialization caches are
+    immutable and stay shared.
+    """
+    clone = copy.copy(note)
+    for name in _mutable_fields(type(note)):
+        setattr(clone, name, copy.deepcopy(getattr(note, name)))
+    return clone
+
+
+@lru_cache(maxsize=None)
+def _mutable_fields(note_type: type) -> Tuple[str, ...]:
+    """Names of the list and dict fields (those defaulting to list() or dict())."""
+    return tuple(
+        name for name, f in note_type.__dataclass_fields__.items()
+        if f.default_factory in (list, dict)
+    )
+
+
+def _history_line(session: dict) -> str:
+    """Serialize one session as a compact JSON Lines record."""
+    return json.dumps(session, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+# Flags for a new temp file; O_EXCL so a name collision fails instead of
+# sharing a file, O_BINARY so Windows writes the bytes untranslated
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Temp files from _write_atomic are hidden siblings ending in this suffix
+_TMP_SUFFIX = ".tmp"
+
+# Leftover temp files older than this (a crash mid-write) are deleted
+_STALE_TMP_SECONDS = 3600
+
+
+def _open_temp_file(directory: str, name: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named hidden temp file next to a target.
+
+    The file is created with mode 0o666, so the kernel applies the umask in
+    effect right now, exactly as for a file opened normally.
+
+    Returns:
+        Tuple of (file descriptor, temp file path)
+    """
+    for _ in range(100):
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}{_TMP_SUFFIX}")
+        try:
+            return os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temp file name for {name} in {directory or '.'}")
+
+
+def _write_atomic(path: Path, *chunks: bytes) -> None:
+    """
+    Replace a file's contents atomically.
+
+    The bytes go to a uniquely named sibling temp file (safe with several
+    writers, including threads of one process) with raw os calls, and are
+    renamed over the target, so readers never see a partial file. The
+    target keeps its permission bits. Temp names are hidden and do not end
+    in .md, so note scans skip them.
+
+    Args:
+        path: File to write
+        *chunks: Complete new contents, written in order without joining
+
+    Raises:
+        OSError: If the file cannot be written; the temp file is removed
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    fd, tmp_path = _open_temp_file(directory, name)
+    try:
+        try:
+            # A new file keeps the umask-derived mode it was created with
+            try:
+                mode = S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                pass
+            else:
+                # chmod by path also works on Windows
+                os.chmod(tmp_path, mode)
+            for data in chunks:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _remove_stale_temp_files(directory: str) -> None:
+    """Delete _write_atomic temp files left in a directory by a crash."""
+    cutoff = datetime.now().timestamp() - _STALE_TMP_SECONDS
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('.') and name.endswith(_TMP_SUFFIX)):
+                    continue
+                try:
+                    # Recent ones may belong to a write in progress elsewhere
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        logger.info(f"Removed stale temp file: {name}")
+                except OSError as e:
+                    logger.warning(f"Could not remove stale temp file {name}: {e}")
+    except OSError as e:
+        logger.warning(f"Could not scan {directory} for stale temp files: {e}")
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """
+    Append to a file with one O_APPEND write.
+
+    A single write to an O_APPEND descriptor lands at end of file as a
+    unit, so records from concurrent writers (server and TUI helper) do not
+    interleave the way a buffered file object's chunked flushes can.
+
+    Args:
+        path: File to append to; created if missing
+        data: Bytes to append
+
+    Raises:
+        OSError: If the file cannot be opened or written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _readme_digest(body: str) -> bytes:
+    return hashlib.blake2b(body.encode('utf-8'), digest_size=16).digest()
+
+
+# Cold note loads below this count are parsed serially (pool overhead)
+_PARALLEL_LOAD_MIN = 16
+
+# Valid note filename: alphanumerics, hyphens and underscores, plus .md
+_FILENAME_RE = re.compile(r"[\w-]+\.md")
+_FILENAME_MAX = 255  # common filesystem limit for a single name
+
+
+@lru_cache(maxsize=2048)
+def _is_plain_filename(filename: str) -> bool:
+    """Whether a name passes validation; memoized, as callers repeat names."""
+    return len(filename) <= _FILENAME_MAX and _FILENAME_RE.fullmatch(filename) is not None
+
+
+# Fixed top of README.md. The title carries the update time; everything from
+# the header on is filled from get_stats() and is what change detection hashes.
+_README_TITLE = "# LearnBase Learning Notes\n\nLast updated: {updated}\n"
+_README_HEADER = (
+    "\n"
+    "## Statistics\n"
+    "- Total notes: {total_notes}\n"
+    "- Review notes: {review_notes}\n"
+    "- Reference notes: {reference_notes}\n"
+    "- Evergreen notes: {evergreen_notes}\n"
+    "- Due today: {due_today}\n"
+    "- Reviewed today: {reviewed_today}\n"
+    "- Spaced repetition: {spaced_notes} notes\n"
+    "- Scheduled: {scheduled_notes} notes\n"
+    "- Average ease factor: {average_ease:.2f}\n"
+    "\n"
+    "## Notes Registry\n"
+    "\n"
+    "| File | Title | Type | Mode | Next Review | Reviews | Ease |\n"
+    "|------|-------|------|------|-------------|---------|------|"
+)
+
+# README registry rows by note type, and the recent-updates line
+_README_REVIEW_ROW = "\n| {} | {} | review | {} | {} | {} | {:.2f} |"
+_README_DRILL_ROW = "\n| {} | {} | drill | drill ({}) | {} | {} | step {} |"
+_README_STORED_ROW = "\n| {} | {} | {} | - | - | - | - |"
+_README_RECENT_LINE = "\n- {}: Reviewed {} ({})"
+
+
 class NoteManager:
     """Manages markdown-based learning notes and README index."""
 
-    def __init__(self, notes_dir: Optional[Path] = None):
+    def __init__(self, notes_dir: Optional[Path] = None, lazy_readme: bool = False):
         """
         Initialize NoteManager.
 
         Args:
             notes_dir: Directory to store notes (default: ~/.learnbase/notes)
+            lazy_readme: If True, mutations only mark the README stale; it is
+                rebuilt by flush(), which also runs at interpreter exit. For
+                short-lived bulk scripts, not long-running servers.
         """
         if notes_dir is None:
             notes_dir = Path.home() / ".learnbase" / "notes"
@@ -35,13 +254,39 @@ class NoteManager:
         self.notes_dir = Path(notes_dir)
         self.notes_dir.mkdir(parents=True, exist_ok=True)
         self.readme_path = self.notes_dir / "README.md"
+        # String form for os-level calls on hot paths
+        self._notes_dir_str = os.fspath(self.notes_dir)
+        _remove_stale_temp_files(self._notes_dir_str)
 
         # Create history directory for session tracking
         self.history_dir = Path.home() / ".learnbase" / "history"
         self.history_dir.mkdir(parents=True, exist_ok=True)
 
         # RAG manager will be injected after initialization
-        self.rag_manager = None
+        self.rag_manager: Optional['RAGManager'] = None
+
+        # Parsed notes for get_all_notes, keyed by filename:
+        # (st_mtime_ns, st_size, note, has_body). Entries are reused while the
+        # file's stat is unchanged; _save_note stores the note it just wrote.
+        self._note_cache: Dict[str, Tuple[int, int, Note, bool]] = {}
+
+        # Path objects for note files, built once per filename by _note_path
+        self._note_paths: Dict[str, Path] = {}
+
+        # README rebuilds postponed by batch(); lazy mode is a batch that
+        # never ends, flushed explicitly or at exit
+        self._defer_readme = 1 if lazy_readme else 0
+        self._readme_dirty = False
+        if lazy_readme:
+            atexit.register(self.flush)
+
+        # Note writes held back by batched_writes(), keyed by path; None when
+        # writes go straight to disk
+        self._pending_notes: Optional[Dict[Path, Note]] = None
+
+        # Digest of the generated README body last seen on disk; None until
+        # the first rebuild reads it
+        self._readme_digest: Optional[bytes] = None
 
         # Initialize README if it doesn't exist
         if not self.readme_path.exists():
@@ -57,11 +302,20 @@ class NoteManager:
         Raises:
             ValueError: If filename is invalid or unsafe
         """
+        # Fast path: the common valid name. \w is isalnum() plus underscore,
+        # so this accepts exactly what the checks below accept.
+        if _is_plain_filename(filename):
+            return
+
+        # Slow path: find the rule that failed, for the error message
         if not filename:
             raise ValueError("Filename cannot be empty")
 
-        # Check for path traversal (directory separators)
-        if Path(filename).name != filename:
+        if len(filename) > _FILENAME_MAX:
+            raise ValueError(f"Filename cannot exceed {_FILENAME_MAX} characters")
+
+        # Check for path traversal (directory separators on any platform, NUL)
+        if '/' in filename or '\\' in filename or '\x00' in filename:
             raise ValueError(
                 f"Filename must not contain directory separators: '{filename}'"
             )
@@ -74,19 +328,52 @@ class NoteManager:
         if not filename.endswith('.md'):
             raise ValueError(f"Filename must have .md extension: '{filename}'")
 
-        # Check for valid characters (alphanumeric, hyphen, underscore, dot only)
-        base_name = filename[:-3]  # Remove .md extension
-        if not all(c.isalnum() or c in '-_' for c in base_name):
-            raise ValueError(
-                f"Filename contains invalid characters: '{filename}'. "
-                f"Only alphanumeric, hyphens, and underscores allowed."
-            )
+        # Every other rule holds, so the regex rejected a character in the
+        # base name; no need to rescan it in Python
+        raise ValueError(
+            f"Filename contains invalid characters: '{filename}'. "
+            f"Only alphanumeric, hyphens, and underscores allowed."
+        )
+
+    def _note_path(self, filename: str) -> Path:
+        """
+        Get the path of a note file, reusing the Path built on earlier calls.
 
-        logger.debug(f"Validated filename: {filename}")
+        Args:
+            filename: Note filename, already validated
+
+        Returns:
+            Path inside notes_dir
+        """
+        filepath = self._note_paths.get(filename)
+        if filepath is None:
+            filepath = self._note_paths[filename] = self.notes_dir / filename
+        return filepath
 
     def _save_note(self, note: Note, filepath: Path) -> None:
         """
-        Save note to file with proper error handling.
+        Save note to file, or hold it until the enclosing batched_writes().
+
+        Args:
+            note: Note instance to save
+            filepath: Full path where note should be saved
+
+        Raises:
+            IOError: If file cannot be written
+        """
+        if self._pending_notes is not None:
+            self._pending_notes[filepath] = note
+            return
+        self._write_note(note, filepath)
+
+    def _write_note(self, note: Note, filepath: Path) -> None:
+        """
+        Write note to file with proper error handling.
+
+        The encoded note is written to a sibling temp file with raw os calls
+        and renamed over the target, so readers never see a partial note.
+        The body's encoding is reused from the note's previous save when the
+        body is unchanged.
 
         Args:
             note: Note instance to save
@@ -95,10 +382,18 @@ class NoteManager:
         Raises:
             IOError: If file cannot be written
         """
+        self._note_cache.pop(filepath.name, None)
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(note.to_markdown_file())
+            _write_atomic(filepath, *note.to_markdown_chunks())
             logger.debug(f"Saved note to {filepath.name}")
+
+            # A copy of the saved object is exactly what is on disk now; serve
+            # it to listings instead of parsing the file again
+            if os.path.dirname(filepath) == self._notes_dir_str:
+                stat = os.stat(filepath)
+                self._note_cache[filepath.name] = (
+                    stat.st_mtime_ns, stat.st_size, _copy_note(note), True
+                )
         except (IOError, OSError) as e:
             logger.error(f"Failed to save note {filepath.name}: {e}")
             raise IOError(f"Failed to save note {filepath.name}: {e}") from e
@@ -137,22 +432,21 @@ class NoteManager:
         Raises:
             RuntimeError: If unable to create unique filename after 1000 attempts
         """
-        import os
-        base = base_filename.replace('.md', '')
+        base = base_filename[:-3]  # strip .md
         filename = base_filename
-        filepath = self.notes_dir / filename
         counter = 1
 
         while counter < 1000:
             try:
-                # Atomic file creation - fails if file exists
-                fd = os.open(str(filepath), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                # Atomic file creation - fails if file exists. Candidates are
+                # plain strings; only the winning name gets a Path.
+                fd = os.open(os.path.join(self._notes_dir_str, filename),
+                             os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
                 os.close(fd)
                 logger.debug(f"Created unique filename: {filename}")
-                return filename, filepath
+                return filename, self._note_path(filename)
             except FileExistsError:
                 filename = f"{base}-{counter}.md"
-                filepath = self.notes_dir / filename
                 counter += 1
 
         raise RuntimeError(f"Failed to create unique filename after 1000 attempts")
@@ -161,6 +455,9 @@ class NoteManager:
         """
         Automatically index/remove note after CRUD operation.
 
+        The write is queued on the RAG manager's background worker, so the
+        CRUD call returns once the note file is saved.
+
         Args:
             filename: Note filename
             operation: 'index' or 'remove'
@@ -172,11 +469,11 @@ class NoteManager:
 
         try:
             if operation == "index":
-                self.rag_manager.index_note(filename)
-                logger.debug(f"Auto-indexed: {filename}")
+                self.rag_manager.index_note_async(filename)
+                logger.debug(f"Queued auto-index: {filename}")
             elif operation == "remove":
-                self.rag_manager.remove_from_index(filename)
-                logger.debug(f"Auto-removed from index: {filename}")
+                self.rag_manager.remove_from_index_async(filename)
+                logger.debug(f"Queued auto-removal from index: {filename}")
         except Exception as e:
             logger.warning(f"Auto-indexing failed for {filename}: {e}")
             # Don't raise - allow CRUD operation to succeed
@@ -227,7 +524,6 @@ class NoteManager:
             # Test parsing
             if review_mode == 'scheduled':
                 try:
-                    from .spaced_rep import parse_schedule_pattern
                     intervals = parse_schedule_pattern(schedule_pattern)
                     if not intervals:
                         raise ValueError("Schedule pattern must produce at least one interval")
@@ -240,21 +536,8 @@ class NoteManager:
                 logger.warning("review_mode and schedule_pattern are ignored for reference and evergreen notes")
 
         logger.debug(f"Creating note: title='{title[:50]}...', note_type={note_type}, review_mode={review_mode}")
-        filename = Note.create_filename(title)
-        filepath = self.notes_dir / filename
-
         # Atomically create unique filename to prevent race conditions
-        if filepath.exists():
-            filename, filepath = self._create_unique_filename(filename)
-        else:
-            import os
-            try:
-                # Atomic file creation - fails if file exists
-                fd = os.open(str(filepath), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-                os.close(fd)
-            except FileExistsError:
-                # Race condition occurred, fall back to unique filename helper
-                filename, filepath = self._create_unique_filename(filename)
+        filename, filepath = self._create_unique_filename(Note.create_filename(title))
 
         now = datetime.now()
 
@@ -290,14 +573,15 @@ class NoteManager:
             )
             logger.info(f"Created review note: {filename} (mode={review_mode})")
 
-        # Write to file
-        self._save_note(note, filepath)
+        # Write to file now: _create_unique_filename left an empty
+        # placeholder that must not outlive this call
+        self._write_note(note, filepath)
 
         # Auto-index the note
         self._auto_index_note(filename, operation="index")
 
         # Update README
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         return filename
 
@@ -312,7 +596,13 @@ class NoteManager:
             Note instance or None if not found
         """
         self._validate_filename(filename)
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
+
+        # A write held by batched_writes() is newer than the file
+        if self._pending_notes:
+            pending = self._pending_notes.get(filepath)
+            if pending is not None:
+                return _copy_note(pending)
 
         if not filepath.exists():
             logger.warning(f"Note file not found: {filename}")
@@ -334,53 +624,171 @@ class NoteManager:
 
     def _sort_notes_by_review_date(self, notes: List[Note]) -> List[Note]:
         """Sort notes: ReviewNotes and DrillNotes first by next_review, then ReferenceNotes and EvergreenNotes by title."""
-        review_notes = [n for n in notes if isinstance(n, ReviewNote)]
-        drill_notes = [n for n in notes if isinstance(n, DrillNote)]
-        reference_notes = [n for n in notes if isinstance(n, ReferenceNote)]
-        evergreen_notes = [n for n in notes if isinstance(n, EvergreenNote)]
+        review_notes: List[ReviewNote] = []
+        drill_notes: List[DrillNote] = []
+        reference_notes: List[ReferenceNote] = []
+        evergreen_notes: List[EvergreenNote] = []
+        # One pass over the notes; the note types are disjoint
+        for n in notes:
+            if isinstance(n, ReviewNote):
+                review_notes.append(n)
+            elif isinstance(n, DrillNote):
+                drill_notes.append(n)
+            elif isinstance(n, ReferenceNote):
+                reference_notes.append(n)
+            elif isinstance(n, EvergreenNote):
+                evergreen_notes.append(n)
         review_notes.sort(key=lambda n: n.next_review)
         drill_notes.sort(key=lambda n: n.next_review)
         reference_notes.sort(key=lambda n: n.title)
         evergreen_notes.sort(key=lambda n: n.title)
         return review_notes + drill_notes + reference_notes + evergreen_notes
 
-    def get_all_notes(self) -> List[Note]:
+    def get_all_notes(self, include_body: bool = True) -> List[Note]:
         """
         Get all notes.
 
+        Args:
+            include_body: If False, load frontmatter only (body left empty).
+                Use for listings and statistics; never save these notes.
+
         Returns:
-            List of Note instances
+            List of Note instances. Unchanged files are served from an
+            in-memory cache; each call returns fresh copies, so callers may
+            modify them freely.
         """
-        notes = []
+        # Sort by next_review date using type-safe sorting
+        notes = self._sort_notes_by_review_date(self._load_notes(include_body))
+        return [_copy_note(n) for n in notes]
 
-        for filepath in self.notes_dir.glob("*.md"):
-            if filepath.name == "README.md":
-                continue
+    def iter_all_notes(self) -> Iterator[Note]:
+        """
+        Yield every note with its body, one at a time, in directory order.
 
-            try:
-                note = Note.from_markdown_file(filepath)
-                notes.append(note)
-                logger.debug(f"Loaded note: {filepath.name}")
-            except (IOError, OSError) as e:
-                logger.error(f"I/O error loading note {filepath.name}: {e}")
-                continue
-            except ValueError as e:
-                logger.error(f"Invalid note format in {filepath.name}: {e}")
-                continue
-            except Exception as e:
-                logger.critical(f"Unexpected error loading note {filepath.name}: {e}", exc_info=True)
-                continue
+        For whole-corpus passes such as reindexing: notes that are not
+        already cached are parsed on demand and not added to the cache, so
+        memory stays bounded by what the caller holds on to.
 
-        # Sort by next_review date using type-safe sorting
-        notes = self._sort_notes_by_review_date(notes)
+        Yields:
+            Note instances (copies of cached ones, safe to modify)
+        """
+        cache = self._note_cache
+        with os.scandir(self.notes_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".md") or name == "README.md":
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.error(f"I/O error loading note {name}: {e}")
+                    continue
+
+                cached = cache.get(name)
+                if (cached is not None and cached[0] == stat.st_mtime_ns
+                        and cached[1] == stat.st_size and cached[3]):
+                    yield _copy_note(cached[2])
+                    continue
+
+                note = self._load_note_file(Path(entry.path), include_body=True)
+                if note is not None:
+                    yield note
+
+    def _load_notes(self, include_body: bool = True) -> List[Note]:
+        """
+        Load all notes in directory order, without sorting.
+
+        For callers that filter first and only need the (usually small)
+        result ordered. The notes are the cached objects themselves: treat
+        them as read-only and copy anything handed out to callers.
+        """
+        notes: List[Optional[Note]] = []
+        cache = self._note_cache
+        seen = set()
+        # Cache misses as (slot in notes, name, path, st_mtime_ns, st_size)
+        misses: List[Tuple[int, str, str, int, int]] = []
+
+        with os.scandir(self.notes_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".md") or name == "README.md":
+                    continue
+
+                try:
+                    # d_type from readdir, so no extra syscall on most filesystems
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.error(f"I/O error loading note {name}: {e}")
+                    continue
+
+                seen.add(name)
+                cached = cache.get(name)
+                if (cached is not None and cached[0] == stat.st_mtime_ns
+                        and cached[1] == stat.st_size and (cached[3] or not include_body)):
+                    notes.append(cached[2])
+                else:
+                    misses.append((len(notes), name, entry.path, stat.st_mtime_ns, stat.st_size))
+                    notes.append(None)
+
+        # Forget files that disappeared behind our back
+        for name in cache.keys() - seen:
+            del cache[name]
+
+        if not misses:
+            return notes
+
+        def load(miss: Tuple[int, str, str, int, int]) -> Optional[Note]:
+            return self._load_note_file(Path(miss[2]), include_body)
+
+        # Cold loads are mostly file I/O; overlap them when there are many
+        if len(misses) < _PARALLEL_LOAD_MIN:
+            loaded = [load(miss) for miss in misses]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(misses))) as executor:
+                loaded = list(executor.map(load, misses))
 
-        return notes
+        for (slot, name, _, mtime_ns, size), note in zip(misses, loaded):
+            if note is not None:
+                cache[name] = (mtime_ns, size, note, include_body)
+                notes[slot] = note
+
+        return [n for n in notes if n is not None]
+
+    def _load_note_file(self, filepath: Path, include_body: bool) -> Optional[Note]:
+        """
+        Parse one note file, logging and swallowing errors.
+
+        Args:
+            filepath: Path to the note file
+            include_body: Passed through to Note.from_markdown_file
+
+        Returns:
+            Note instance, or None if the file could not be loaded
+        """
+        name = filepath.name
+        try:
+            note = Note.from_markdown_file(filepath, include_body=include_body)
+            logger.debug(f"Loaded note: {name}")
+            return note
+        except (IOError, OSError) as e:
+            logger.error(f"I/O error loading note {name}: {e}")
+        except ValueError as e:
+            logger.error(f"Invalid note format in {name}: {e}")
+        except Exception as e:
+            logger.critical(f"Unexpected error loading note {name}: {e}", exc_info=True)
+        return None
 
     def get_due_notes(
         self,
         limit: Optional[int] = None,
         review_mode: Optional[Literal['spaced', 'scheduled']] = None,
-        require_verified: bool = False
+        require_verified: bool = False,
+        include_body: bool = True
     ) -> List[ReviewNote]:
         """
         Get notes that are due for review.
@@ -389,60 +797,64 @@ class NoteManager:
             limit: Maximum number of notes to return
             review_mode: Filter by review mode ('spaced' or 'scheduled')
             require_verified: Only include verified notes (with sources and confidence >= 0.6)
+            include_body: If False, read frontmatter only (see get_all_notes)
 
         Returns:
             List of ReviewNote instances due for review
         """
-        all_notes = [n for n in self.get_all_notes() if isinstance(n, ReviewNote)]
         now = datetime.now()
 
-        # Filter due notes
-        due_notes = [n for n in all_notes if n.next_review <= now]
-
-        # Filter by review mode if specified
-        if review_mode:
-            due_notes = [n for n in due_notes if n.review_mode == review_mode]
-
-        # Filter by verification status if required
-        if require_verified:
-            due_notes = [
-                n for n in due_notes
-                if n.sources and (n.confidence_score is None or n.confidence_score >= 0.6)
-            ]
+        # One pass: due, then mode, then verification (sources and
+        # confidence >= 0.6), each test skipped when not requested
+        due_notes = [
+            n for n in self._load_notes(include_body)
+            if isinstance(n, ReviewNote) and n.next_review <= now
+            and (not review_mode or n.review_mode == review_mode)
+            and (not require_verified or (
+                n.sources and (n.confidence_score is None or n.confidence_score >= 0.6)
+            ))
+        ]
 
-        # Apply limit
+        # Order only the due subset; top-k when limited
         if limit:
-            due_notes = due_notes[:limit]
-
-        return due_notes
+            due_notes = heapq.nsmallest(limit, due_notes, key=_next_review_key)
+        else:
+            due_notes.sort(key=_next_review_key)
+        return [_copy_note(n) for n in due_notes]
 
-    def get_notes_needing_verification(self, limit: Optional[int] = None) -> List[ReviewNote]:
+    def get_notes_needing_verification(
+        self,
+        limit: Optional[int] = None,
+        include_body: bool = True
+    ) -> List[ReviewNote]:
         """
         Get notes that need verification (have no sources).
 
         Args:
             limit: Maximum number of notes to return
+            include_body: If False, read frontmatter only (see get_all_notes)
 
         Returns:
             List of ReviewNote instances with empty sources, sorted by next_review date
         """
-        all_notes = [n for n in self.get_all_notes() if isinstance(n, ReviewNote)]
-
         # Filter notes with no sources
-        unverified_notes = [n for n in all_notes if not n.sources]
-
-        # Already sorted by next_review in get_all_notes()
+        unverified_notes = [
+            n for n in self._load_notes(include_body)
+            if isinstance(n, ReviewNote) and not n.sources
+        ]
 
-        # Apply limit
+        # Order only the matches; top-k when limited
         if limit:
-            unverified_notes = unverified_notes[:limit]
-
-        return unverified_notes
+            unverified_notes = heapq.nsmallest(limit, unverified_notes, key=_next_review_key)
+        else:
+            unverified_notes.sort(key=_next_review_key)
+        return [_copy_note(n) for n in unverified_notes]
 
     def get_notes_with_low_confidence(
         self,
         threshold: float = 0.6,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        include_body: bool = True
     ) -> List[ReviewNote]:
         """
         Get notes with confidence score below threshold.
@@ -450,6 +862,7 @@ class NoteManager:
         Args:
             threshold: Confidence threshold (0.0-1.0), default 0.6
             limit: Maximum number of notes to return
+            include_body: If False, read frontmatter only (see get_all_notes)
 
         Returns:
             List of ReviewNote instances with low confidence, sorted by confidence_score (lowest first)
@@ -459,23 +872,20 @@ class NoteManager:
         if not 0.0 <= threshold <= 1.0:
             raise ValueError(f"Threshold must be between 0.0 and 1.0, got {threshold}")
 
-        all_notes = [n for n in self.get_all_notes() if isinstance(n, ReviewNote)]
-
         # Filter notes with confidence score below threshold
         # Exclude notes with None confidence_score
         low_confidence_notes = [
-            n for n in all_notes
-            if n.confidence_score is not None and n.confidence_score < threshold
+            n for n in self._load_notes(include_body)
+            if isinstance(n, ReviewNote)
+            and n.confidence_score is not None and n.confidence_score < threshold
         ]
 
-        # Sort by confidence score (lowest first)
-        low_confidence_notes.sort(key=lambda n: n.confidence_score)
-
-        # Apply limit
+        # Sort by confidence score (lowest first), ties by next_review
         if limit:
-            low_confidence_notes = low_confidence_notes[:limit]
-
-        return low_confidence_notes
+            low_confidence_notes = heapq.nsmallest(limit, low_confidence_notes, key=_confidence_key)
+        else:
+            low_confidence_notes.sort(key=_confidence_key)
+        return [_copy_note(n) for n in low_confidence_notes]
 
     def update_note_review(self, filename: str, rating: int):
         """
@@ -502,38 +912,43 @@ class NoteManager:
                 f"Reference notes are for storage only and do not use spaced repetition."
             )
 
+        # One timestamp for both last_reviewed and the next-review base
+        now = datetime.now()
+
         # Calculate next review based on mode
         if note.review_mode == 'spaced':
             new_interval, new_ease, next_review = calculate_next_review(
                 rating,
                 note.interval_days,
                 note.ease_factor,
-                note.review_count
+                note.review_count,
+                now
             )
         else:  # scheduled mode
             new_interval, next_review = calculate_scheduled_review(
                 rating,
                 note.schedule_pattern or "1d,1w,2w,1m,3m,6m",
-                note.review_count
+                note.review_count,
+                now
             )
             new_ease = note.ease_factor  # unchanged in scheduled mode
 
         # Update note
-        note.last_reviewed = datetime.now()
+        note.last_reviewed = now
         note.next_review = next_review
         note.interval_days = new_interval
         note.ease_factor = new_ease
         note.review_count += 1
 
         # Write back to file
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
 
         # Auto-index the updated note
         self._auto_index_note(filename, operation="index")
 
         # Update README
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         logger.info(f"Updated review for {filename}: rating={rating}, next_review={next_review}")
 
@@ -566,14 +981,14 @@ class NoteManager:
         note.body = body
 
         # Write back to file
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
 
         # Auto-index the updated note
         self._auto_index_note(filename, operation="index")
 
         # Update README
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         logger.info(f"Updated content for {filename}")
 
@@ -588,46 +1003,51 @@ class NoteManager:
             True if deleted, False if not found
         """
         self._validate_filename(filename)
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
 
         if not filepath.exists():
             logger.warning(f"Cannot delete note {filename}: not found")
             return False
 
         filepath.unlink()
+        self._note_cache.pop(filename, None)
+        if self._pending_notes:
+            self._pending_notes.pop(filepath, None)
 
         # Auto-remove from index
         self._auto_index_note(filename, operation="remove")
 
         # Update README
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         logger.info(f"Deleted note: {filename}")
         return True
 
     def get_all_notes_by_type(
         self,
-        note_type: Optional[Literal['review', 'reference', 'evergreen', 'drill']] = None
+        note_type: Optional[Literal['review', 'reference', 'evergreen', 'drill']] = None,
+        include_body: bool = True
     ) -> List[Note]:
         """
         Get all notes, optionally filtered by type.
 
         Args:
             note_type: Filter by 'review', 'reference', 'evergreen', or 'drill', or None for all notes
+            include_body: If False, load frontmatter only (see get_all_notes)
 
         Returns:
             List of Note instances
         """
-        notes = self.get_all_notes()
+        notes = self._sort_notes_by_review_date(self._load_notes(include_body))
         if note_type == 'review':
-            return [n for n in notes if isinstance(n, ReviewNote)]
+            notes = [n for n in notes if isinstance(n, ReviewNote)]
         elif note_type == 'reference':
-            return [n for n in notes if isinstance(n, ReferenceNote)]
+            notes = [n for n in notes if isinstance(n, ReferenceNote)]
         elif note_type == 'evergreen':
-            return [n for n in notes if isinstance(n, EvergreenNote)]
+            notes = [n for n in notes if isinstance(n, EvergreenNote)]
         elif note_type == 'drill':
-            return [n for n in notes if isinstance(n, DrillNote)]
-        return notes
+            notes = [n for n in notes if isinstance(n, DrillNote)]
+        return [_copy_note(n) for n in notes]
 
     # ================================================================
     # Drill card operations (code flashcards — ladder SR, three modes)
@@ -676,18 +1096,7 @@ class NoteManager:
         # Filenames prefixed with "drill-" to make the type recognisable on disk.
         base = Note.create_filename(title)
         prefixed = f"drill-{base}" if not base.startswith("drill-") else base
-        filepath = self.notes_dir / prefixed
-
-        if filepath.exists():
-            filename, filepath = self._create_unique_filename(prefixed)
-        else:
-            import os
-            try:
-                fd = os.open(str(filepath), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-                os.close(fd)
-                filename = prefixed
-            except FileExistsError:
-                filename, filepath = self._create_unique_filename(prefixed)
+        filename, filepath = self._create_unique_filename(prefixed)
 
         now = datetime.now()
         body = DrillNote.build_body(prompt, model_answer, language)
@@ -712,9 +1121,9 @@ class NoteManager:
             reverse_variants=reverse_variants or [],
         )
 
-        self._save_note(drill, filepath)
+        self._write_note(drill, filepath)
         self._auto_index_note(filename, operation="index")
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         logger.info(f"Created drill note: {filename} (language={language})")
         return filename
@@ -736,7 +1145,7 @@ class NoteManager:
         note.reverse_variants = reverse_variants
         note.variants_status = variants_status
 
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
         self._auto_index_note(filename, operation="index")
         logger.info(f"Updated variants for {filename}: status={variants_status}")
@@ -763,11 +1172,13 @@ class NoteManager:
         if not isinstance(note, DrillNote):
             raise ValueError(f"Note '{filename}' is not a drill card")
 
+        now = datetime.now()
         if is_first_mode:
             new_step, _, next_review, new_fail_streak = calculate_ladder_review(
                 passed=passed,
                 current_step=note.ladder_step,
                 fail_streak=note.fail_streak,
+                now=now,
             )
             note.ladder_step = new_step
             note.next_review = next_review
@@ -779,13 +1190,13 @@ class NoteManager:
             elif new_fail_streak >= REWRITE_FAIL_THRESHOLD:
                 note.needs_rewrite = True
 
-        note.last_reviewed = datetime.now()
+        note.last_reviewed = now
         note.review_count += 1
 
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
         self._auto_index_note(filename, operation="index")
-        self.update_readme_index()
+        self._mark_readme_dirty()
 
         logger.info(
             f"Drill review: {filename} passed={passed} first_mode={is_first_mode} "
@@ -795,13 +1206,13 @@ class NoteManager:
 
     def get_due_drills(self, limit: Optional[int] = None) -> List[DrillNote]:
         """Return drill cards whose next_review is today or earlier."""
-        all_drills = [n for n in self.get_all_notes() if isinstance(n, DrillNote)]
         now = datetime.now()
-        due = [d for d in all_drills if d.next_review <= now]
-        due.sort(key=lambda d: d.next_review)
+        due = [d for d in self._load_notes() if isinstance(d, DrillNote) and d.next_review <= now]
         if limit:
-            due = due[:limit]
-        return due
+            due = heapq.nsmallest(limit, due, key=_next_review_key)
+        else:
+            due.sort(key=_next_review_key)
+        return [_copy_note(d) for d in due]
 
     def find_similar_drills(
         self,
@@ -833,137 +1244,275 @@ class NoteManager:
                 break
         return matches
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(
+        self,
+        notes: Optional[List[Note]] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Get learning statistics.
 
+        Args:
+            notes: Already-loaded notes to summarize (default: load all notes)
+            now: Reference time for due/reviewed counts (default: datetime.now())
+
         Returns:
             Dictionary with statistics
         """
-        all_notes = self.get_all_notes()
-        review_notes = [n for n in all_notes if isinstance(n, ReviewNote)]
-        drill_notes = [n for n in all_notes if isinstance(n, DrillNote)]
-        reference_notes = [n for n in all_notes if isinstance(n, ReferenceNote)]
-        evergreen_notes = [n for n in all_notes if isinstance(n, EvergreenNote)]
-
-        now = datetime.now()
-        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        if notes is None:
+            # Read-only pass over the cache; no copies needed
+            notes = self._load_notes(include_body=False)
+
+        if now is None:
+            now = datetime.now()
+        # Day bounds computed once, so the loop compares datetimes instead of
+        # building a date per note
+        today_start = datetime.combine(now.date(), time.min)
+        today_end = datetime.combine(now.date(), time.max)
         week_end = now + timedelta(days=7)
 
-        # Count due notes (ReviewNotes and DrillNotes both have next_review)
-        due_today = [n for n in review_notes if n.next_review <= today_end]
-        due_week = [n for n in review_notes if today_end < n.next_review <= week_end]
-        drills_due_today = [d for d in drill_notes if d.next_review <= today_end]
-
-        # Count reviewed today (using date comparison)
-        today_date = now.date()
-        reviewed_today = [
-            n for n in review_notes
-            if n.last_reviewed and n.last_reviewed.date() == today_date
-        ]
-
-        # Average ease factor
-        reviewed_notes_with_reviews = [n for n in review_notes if n.review_count > 0]
-        avg_ease = sum(n.ease_factor for n in reviewed_notes_with_reviews) / len(reviewed_notes_with_reviews) if reviewed_notes_with_reviews else 2.5
+        review_total = reference_total = evergreen_total = drill_total = 0
+        due_today = due_week = reviewed_today = 0
+        spaced = scheduled = 0
+        drills_due_today = drills_needing_rewrite = 0
+        ease_sum = 0.0
+        ease_count = 0
+
+        # Single pass; the note types are disjoint
+        for n in notes:
+            if isinstance(n, ReviewNote):
+                review_total += 1
+                if n.next_review <= today_end:
+                    due_today += 1
+                elif n.next_review <= week_end:
+                    due_week += 1
+                if n.last_reviewed and today_start <= n.last_reviewed <= today_end:
+                    reviewed_today += 1
+                if n.review_count > 0:
+                    ease_sum += n.ease_factor
+                    ease_count += 1
+                if n.review_mode == 'spaced':
+                    spaced += 1
+                elif n.review_mode == 'scheduled':
+                    scheduled += 1
+            elif isinstance(n, DrillNote):
+                drill_total += 1
+                if n.next_review <= today_end:
+                    drills_due_today += 1
+                if n.needs_rewrite:
+                    drills_needing_rewrite += 1
+            elif isinstance(n, ReferenceNote):
+                reference_total += 1
+            elif isinstance(n, EvergreenNote):
+                evergreen_total += 1
 
         return {
-            "total_notes": len(all_notes),
-            "review_notes": len(review_notes),
-            "reference_notes": len(reference_notes),
-            "evergreen_notes": len(evergreen_notes),
-            "drill_notes": len(drill_notes),
-            "drills_due_today": len(drills_due_today),
-            "drills_needing_rewrite": len([d for d in drill_notes if d.needs_rewrite]),
-            "reviewed_today": len(reviewed_today),
-            "due_today": len(due_today),
-            "due_this_week": len(due_week),
-            "average_ease": avg_ease,
-            "spaced_notes": len([n for n in review_notes if n.review_mode == 'spaced']),
-            "scheduled_notes": len([n for n in review_notes if n.review_mode == 'scheduled'])
+            "total_notes": len(notes),
+            "review_notes": review_total,
+            "reference_notes": reference_total,
+            "evergreen_notes": evergreen_total,
+            "drill_notes": drill_total,
+            "drills_due_today": drills_due_today,
+            "drills_needing_rewrite": drills_needing_rewrite,
+            "reviewed_today": reviewed_today,
+            "due_today": due_today,
+            "due_this_week": due_week,
+            "average_ease": ease_sum / ease_count if ease_count else 2.5,
+            "spaced_notes": spaced,
+            "scheduled_notes": scheduled
         }
 
+    @contextmanager
+    def batch(self) -> Iterator['NoteManager']:
+        """
+        Defer README index rebuilds until the outermost batch exits.
+
+        Wrap bulk mutations (imports, scripts) in ``with manager.batch():`` so
+        the README is regenerated once instead of after every note.
+        """
+        self._defer_readme += 1
+        try:
+            yield self
+        finally:
+            self._defer_readme -= 1
+            if not self._defer_readme:
+                self.flush()
+
+    @contextmanager
+    def batched_writes(self) -> Iterator['NoteManager']:
+        """
+        Coalesce note writes until the outermost block exits.
+
+        Inside the block each note is written at most once, with its final
+        state, however many updates touch it; get_note() returns the pending
+        note so successive updates build on each other. Listings read the
+        files and see the changes once the block exits. Implies batch(), so
+        the README is rebuilt once after the notes are written.
+
+        Raises:
+            IOError: If any pending note could not be written. Every other
+                pending note is still written first.
+        """
+        if self._pending_notes is not None:
+            yield self
+            return
+
+        pending: Dict[Path, Note] = {}
+        self._pending_notes = pending
+        with self.batch():
+            try:
+                yield self
+            finally:
+                # Write before clearing, so get_note() never sees older files.
+                # One failed note must not drop the rest; _write_note logs it.
+                failed: List[str] = []
+                first_error: Optional[IOError] = None
+                try:
+                    for filepath, note in pending.items():
+                        try:
+                            self._write_note(note, filepath)
+                        except IOError as e:
+                            failed.append(filepath.name)
+                            first_error = first_error or e
+                finally:
+                    self._pending_notes = None
+                if failed:
+                    raise IOError(
+                        f"Failed to save {len(failed)} of {len(pending)} batched notes: "
+                        f"{', '.join(failed)}"
+                    ) from first_error
+
+    def flush(self) -> None:
+        """Rebuild the README if a deferred mutation left it stale."""
+        if self._readme_dirty:
+            self.update_readme_index()
+
+    def _mark_readme_dirty(self) -> None:
+        """Rebuild the README now, or at the end of the enclosing batch()."""
+        if self._defer_readme:
+            self._readme_dirty = True
+        else:
+            self.update_readme_index()
+
     def update_readme_index(self):
         """Update README.md with current notes index and statistics."""
-        notes = self.get_all_notes()
-        stats = self.get_stats()
-
-        # Build README content
-        lines = [
-            "# LearnBase Learning Notes",
-            "",
-            f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Statistics",
-            f"- Total notes: {stats['total_notes']}",
-            f"- Review notes: {stats['review_notes']}",
-            f"- Reference notes: {stats['reference_notes']}",
-            f"- Evergreen notes: {stats['evergreen_notes']}",
-            f"- Due today: {stats['due_today']}",
-            f"- Reviewed today: {stats['reviewed_today']}",
-            f"- Spaced repetition: {stats['spaced_notes']} notes",
-            f"- Scheduled: {stats['scheduled_notes']} notes",
-            f"- Average ease factor: {stats['average_ease']:.2f}",
-            "",
-            "## Notes Registry",
-            "",
-            "| File | Title | Type | Mode | Next Review | Reviews | Ease |",
-            "|------|-------|------|------|-------------|---------|------|"
-        ]
+        self._readme_dirty = False
+        now = datetime.now()
+        # Rendered, not handed out, so the cached notes need no copies
+        notes = self._sort_notes_by_review_date(self._load_notes(include_body=False))
+        stats = self.get_stats(notes, now)
+
+        # Recent updates: last 10 reviewed notes (only ReviewNotes have last_reviewed)
+        recent_notes = heapq.nlargest(
+            10,
+            (n for n in notes if isinstance(n, ReviewNote) and n.last_reviewed),
+            key=lambda n: n.last_reviewed
+        )
+
+        # Render everything below the timestamp as parts joined once, with
+        # the row formatters looked up outside the loop
+        review_row = _README_REVIEW_ROW.format
+        drill_row = _README_DRILL_ROW.format
+        stored_row = _README_STORED_ROW.format
+        parts = [_README_HEADER.format(**stats)]
+        append = parts.append
 
-        # Add notes to table
         for note in notes:
             if isinstance(note, ReviewNote):
-                next_review_str = note.next_review.strftime('%Y-%m-%d')
-                lines.append(
-                    f"| {note.filename} | {note.title[:40]} | review | {note.review_mode} | "
-                    f"{next_review_str} | {note.review_count} | {note.ease_factor:.2f} |"
-                )
+                append(review_row(
+                    note.filename, note.title[:40], note.review_mode,
+                    note.next_review.date().isoformat(), note.review_count, note.ease_factor
+                ))
             elif isinstance(note, DrillNote):
-                next_review_str = note.next_review.strftime('%Y-%m-%d')
-                mode_label = f"drill ({note.language})"
-                ease_col = f"step {note.ladder_step}"
-                lines.append(
-                    f"| {note.filename} | {note.title[:40]} | drill | {mode_label} | "
-                    f"{next_review_str} | {note.review_count} | {ease_col} |"
-                )
+                append(drill_row(
+                    note.filename, note.title[:40], note.language,
+                    note.next_review.date().isoformat(), note.review_count, note.ladder_step
+                ))
             elif isinstance(note, EvergreenNote):
-                lines.append(
-                    f"| {note.filename} | {note.title[:40]} | evergreen | - | - | - | - |"
-                )
+                append(stored_row(note.filename, note.title[:40], "evergreen"))
             else:  # ReferenceNote
-                lines.append(
-                    f"| {note.filename} | {note.title[:40]} | reference | - | - | - | - |"
-                )
+                append(stored_row(note.filename, note.title[:40], "reference"))
 
-        lines.extend(["", "## Recent Updates", ""])
+        append("\n\n## Recent Updates\n")
+        recent_line = _README_RECENT_LINE.format
+        parts.extend(
+            recent_line(n.last_reviewed.date().isoformat(), n.filename, n.title)
+            for n in recent_notes
+        )
 
-        # Add recent updates (last 10 reviewed notes - only ReviewNotes have last_reviewed)
-        review_notes = [n for n in notes if isinstance(n, ReviewNote)]
-        reviewed_notes = [n for n in review_notes if n.last_reviewed]
-        reviewed_notes.sort(key=lambda n: n.last_reviewed, reverse=True)
+        # Leave the file (and its timestamp) alone if nothing visible changed
+        body = "".join(parts)
+        digest = _readme_digest(body)
+        if self._readme_digest is None:
+            self._readme_digest = self._read_readme_digest()
+        if digest == self._readme_digest and self.readme_path.exists():
+            logger.debug("README index unchanged, skipping write")
+            return
+
+        # One encoded buffer, swapped in atomically
+        title = _README_TITLE.format(updated=now.strftime('%Y-%m-%d %H:%M:%S'))
+        try:
+            _write_atomic(self.readme_path, (title + body).encode('utf-8'))
+            self._readme_digest = digest
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to write README index: {e}")
+            raise
 
-        for note in reviewed_notes[:10]:
-            date_str = note.last_reviewed.strftime('%Y-%m-%d')
-            lines.append(f"- {date_str}: Reviewed {note.filename} ({note.title})")
+    def _read_readme_digest(self) -> bytes:
+        """
+        Digest the generated part of the README currently on disk.
 
-        # Write README
-        with open(self.readme_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        Returns:
+            Digest of the text below the "Last updated" line, or b"" if the
+            README is missing or was not generated by update_readme_index
+        """
+        try:
+            text = self.readme_path.read_text(encoding='utf-8')
+        except (IOError, OSError):
+            return b""
+        _, marker, rest = text.partition("\nLast updated: ")
+        if not marker:
+            return b""
+        return _readme_digest(rest.partition("\n")[2])
 
     def _get_history_path(self, filename: str) -> Path:
         """
-        Get the path to the history file for a note.
+        Get the path to the history log for a note.
 
         Args:
             filename: Note filename (e.g., "python-gil.md")
 
         Returns:
-            Path to history JSON file
+            Path to history JSON Lines file (one session per line)
         """
         self._validate_filename(filename)
-        # Remove .md extension and add .json
-        base_name = filename.replace('.md', '')
-        return self.history_dir / f"{base_name}.json"
+        # Remove .md extension and add .jsonl
+        base_name = filename[:-3]
+        return self.history_dir / f"{base_name}.jsonl"
+
+    def _load_legacy_history(self, filename: str, legacy_path: Path) -> dict:
+        """
+        Load a pre-JSON-Lines history file (a single JSON document).
+
+        Args:
+            filename: Note filename
+            legacy_path: Path to the old .json history file
+
+        Returns:
+            History dictionary with sessions list (empty if missing or unreadable)
+        """
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            history.setdefault("sessions", [])
+            return history
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError as e:
+            logger.warning(f"Corrupted history file for {filename}: {e}")
+        except (IOError, OSError) as e:
+            logger.error(f"I/O error loading history for {filename}: {e}")
+        return {"note_filename": filename, "sessions": []}
 
     def load_history(self, filename: str) -> dict:
         """
@@ -978,42 +1527,55 @@ class NoteManager:
         self._validate_filename(filename)
         history_path = self._get_history_path(filename)
 
-        if not history_path.exists():
-            logger.debug(f"No history file found for {filename}")
-            return {"note_filename": filename, "sessions": []}
+        # Sessions recorded before the switch to JSON Lines come first
+        history = self._load_legacy_history(filename, history_path.with_suffix('.json'))
+        sessions = history["sessions"]
 
         try:
             with open(history_path, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-            logger.debug(f"Loaded history for {filename}: {len(history.get('sessions', []))} sessions")
-            return history
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        sessions.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping corrupted history line {line_number} for {filename}: {e}")
         except FileNotFoundError:
-            logger.debug(f"No history file found for {filename}")
-            return {"note_filename": filename, "sessions": []}
-        except json.JSONDecodeError as e:
-            logger.warning(f"Corrupted history file for {filename}: {e}")
-            return {"note_filename": filename, "sessions": []}
+            logger.debug(f"No history log found for {filename}")
         except (IOError, OSError) as e:
             logger.error(f"I/O error loading history for {filename}: {e}")
-            return {"note_filename": filename, "sessions": []}
+
+        logger.debug(f"Loaded history for {filename}: {len(sessions)} sessions")
+        return history
 
     def save_session_history(self, filename: str, session: dict):
         """
-        Save a session to the note's history file.
+        Append a session to the note's history log.
+
+        Only the new session is serialized; earlier sessions are not re-read
+        or rewritten. A legacy .json history is folded into the log on the
+        first save.
 
         Args:
             filename: Note filename
             session: Session dictionary to save
         """
         self._validate_filename(filename)
-        history = self.load_history(filename)
-        history["sessions"].append(session)
-
         history_path = self._get_history_path(filename)
+        legacy_path = history_path.with_suffix('.json')
+
+        lines = []
+        migrating = legacy_path.exists()
+        if migrating:
+            legacy_sessions = self._load_legacy_history(filename, legacy_path)["sessions"]
+            lines.extend(_history_line(s) for s in legacy_sessions)
+        lines.append(_history_line(session))
 
         try:
-            with open(history_path, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            _append_bytes(history_path, ''.join(lines).encode('utf-8'))
+            if migrating:
+                legacy_path.unlink()
+                logger.info(f"Migrated {len(lines) - 1} sessions for {filename} to {history_path.name}")
             logger.info(f"Saved session history for {filename}")
         except (IOError, OSError) as e:
             logger.error(f"Failed to save history for {filename}: {e}")
@@ -1028,6 +1590,9 @@ class NoteManager:
         Update multiple question performances in a single file write.
         More efficient than calling update_question_performance repeatedly.
 
+        Question scores are not shown in the README, so this neither rebuilds
+        it nor marks it stale; the saved note refreshes the note cache.
+
         Args:
             filename: Note filename
             question_scores: List of (question_hash, score) tuples
@@ -1066,12 +1631,11 @@ class NoteManager:
                 f"Reference notes are for storage only and do not use spaced repetition."
             )
 
-        # Apply EMA algorithm to all questions
-        for question_hash, score in question_scores:
-            note.update_question_score(question_hash, score)
+        # Apply EMA algorithm to all questions (scores validated above)
+        note._update_question_scores_unchecked(question_scores)
 
-        # Single write operation
-        filepath = self.notes_dir / filename
+        # Single write operation; no README change (see docstring)
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
 
         # Auto-index the updated note
@@ -1105,6 +1669,15 @@ class NoteManager:
 
         ADDRESSED_THRESHOLD = 2
 
+        # Active requests by lowercased topic, in list order, so each lookup
+        # below finds the first active match without rescanning the list
+        active_by_topic: Dict[str, List[dict]] = {}
+        for existing in note.priority_requests:
+            if existing["active"]:
+                active_by_topic.setdefault(existing["topic"].lower(), []).append(existing)
+
+        requested_at = datetime.now().isoformat()
+
         # Process new priority requests
         for req in new_requests:
             topic = req.get("topic")
@@ -1115,45 +1688,47 @@ class NoteManager:
                 continue
 
             # Check if topic already has an active request
-            found = False
-            for existing in note.priority_requests:
-                if existing["topic"].lower() == topic.lower() and existing["active"]:
-                    # Reactivate/update existing request
-                    existing["reason"] = reason
-                    existing["requested_at"] = datetime.now().isoformat()
-                    existing["session_id"] = session_id
-                    found = True
-                    logger.debug(f"Updated existing priority request for '{topic}'")
-                    break
-
-            if not found:
+            key = topic.lower()
+            matches = active_by_topic.get(key)
+            if matches:
+                # Reactivate/update existing request
+                existing = matches[0]
+                existing["reason"] = reason
+                existing["requested_at"] = requested_at
+                existing["session_id"] = session_id
+                logger.debug(f"Updated existing priority request for '{topic}'")
+            else:
                 # Add new request
-                note.priority_requests.append({
+                request = {
                     "topic": topic,
                     "reason": reason,
-                    "requested_at": datetime.now().isoformat(),
+                    "requested_at": requested_at,
                     "session_id": session_id,
                     "addressed_count": 0,
                     "active": True
-                })
+                }
+                note.priority_requests.append(request)
+                active_by_topic[key] = [request]
                 logger.debug(f"Added new priority request for '{topic}'")
 
         # Process addressed priorities
         for topic in addressed_topics:
-            for existing in note.priority_requests:
-                if existing["topic"].lower() == topic.lower() and existing["active"]:
-                    existing["addressed_count"] += 1
+            matches = active_by_topic.get(topic.lower())
+            if not matches:
+                continue
 
-                    if existing["addressed_count"] >= ADDRESSED_THRESHOLD:
-                        existing["active"] = False
-                        logger.info(f"Deactivated priority '{topic}' after {existing['addressed_count']} sessions")
-                    else:
-                        logger.debug(f"Incremented priority '{topic}' to {existing['addressed_count']}/{ADDRESSED_THRESHOLD}")
+            existing = matches[0]
+            existing["addressed_count"] += 1
 
-                    break
+            if existing["addressed_count"] >= ADDRESSED_THRESHOLD:
+                existing["active"] = False
+                matches.pop(0)
+                logger.info(f"Deactivated priority '{topic}' after {existing['addressed_count']} sessions")
+            else:
+                logger.debug(f"Incremented priority '{topic}' to {existing['addressed_count']}/{ADDRESSED_THRESHOLD}")
 
         # Save updated note
-        filepath = self.notes_dir / filename
+        filepath = self._note_path(filename)
         self._save_note(note, filepath)
 
         # Auto-index the updated note
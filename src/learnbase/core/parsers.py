@@ -1,6 +1,7 @@
 """Parsing utilities for frontmatter fields."""
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 
@@ -23,11 +24,36 @@ def _strip_timezone(dt: datetime) -> datetime:
     return dt
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 string to an offset-naive datetime, memoized.
+
+    Listing or reindexing many notes parses the same timestamps again and
+    again; datetimes are immutable, so cached results can be shared.
+    """
+    return _strip_timezone(datetime.fromisoformat(value))
+
+
+def _to_datetime(value: Any) -> datetime:
+    """Convert a non-None frontmatter value to an offset-naive datetime.
+
+    The YAML loader already turns unquoted ISO 8601 timestamps into datetime
+    (and bare dates into date) objects, so those skip string parsing entirely.
+    """
+    if isinstance(value, datetime):
+        return _strip_timezone(value)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if not isinstance(value, str):
+        value = str(value)
+    return _parse_iso(value)
+
+
 def parse_datetime(value: Any, default: datetime) -> datetime:
     """Parse datetime from string or datetime object.
 
     Args:
-        value: Value to parse (datetime, string)
+        value: Value to parse (datetime, date, string)
         default: Default value
 
     Returns:
@@ -35,16 +61,14 @@ def parse_datetime(value: Any, default: datetime) -> datetime:
     """
     if value is None:
         return default
-    if isinstance(value, datetime):
-        return _strip_timezone(value)
-    return _strip_timezone(datetime.fromisoformat(str(value)))
+    return _to_datetime(value)
 
 
 def parse_review(value: Any, default: datetime | None = None) -> datetime | None:
     """Parse datetime from string or datetime object.
 
     Args:
-        value: Value to parse (datetime, string, or None)
+        value: Value to parse (datetime, date, string, or None)
         default: Default value if None
 
     Returns:
@@ -52,9 +76,8 @@ def parse_review(value: Any, default: datetime | None = None) -> datetime | None
     """
     if value is None:
         return default
-    if isinstance(value, datetime):
-        return _strip_timezone(value)
-    return _strip_timezone(datetime.fromisoformat(str(value)))
+    return _to_datetime(value)
+
 
 def parse_float(value: Any, default: float = 0.0) -> float:
     """Parse float from string or numeric value.
@@ -1,8 +1,16 @@
 """RAG manager for semantic search using ChromaDB."""
 
+import atexit
+import json
 import logging
+import os
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Tuple
 import hashlib
 
 logger = logging.getLogger(__name__)
@@ -24,6 +32,38 @@ except ImportError:
 
 from .note_manager import NoteManager
 from .models import Note, ReviewNote, ReferenceNote, EvergreenNote, DrillNote
+from .faiss_store import FAISS_AVAILABLE, FaissCollection
+
+# Embedding functions keyed by (provider, model). Loading a model is the
+# slow part of startup, so every RAGManager in the process shares one.
+_EMBED_FN_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _call_if_alive(method_ref: weakref.WeakMethod) -> None:
+    """atexit hook that calls a method unless its object is already gone."""
+    method = method_ref()
+    if method is not None:
+        method()
+
+
+def _noop() -> None:
+    """Queued behind pending index writes to wait for them."""
+
+
+def _completed(result: Any) -> Future:
+    """A Future that already holds result."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def _sentence_transformer_device() -> str:
+    """Pick the device for sentence-transformers: CUDA when torch sees a GPU."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
 
 
 class RAGManager:
@@ -32,24 +72,53 @@ class RAGManager:
     COLLECTION_NAME = "learnbase_notes"
     DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
+    # Notes per upsert during a full reindex; ChromaDB rejects batches above
+    # its max_batch_size (5461 on the default SQLite backend)
+    INDEX_BATCH_SIZE = 128
+    MAX_INDEX_BATCH_SIZE = 5000
+
+    # Documents per sentence-transformers forward pass (faiss backend)
+    ENCODE_BATCH_SIZE = 64
+
+    # Subdirectory of vector_db_dir holding the faiss store
+    FAISS_DIR = "faiss"
+
+    # Sidecar mapping filename -> indexed metadata digest, kept next to the
+    # store it describes: inside FAISS_DIR, or as chroma_<name> beside
+    # ChromaDB's files
+    INDEX_HASHES_FILE = "content_hashes.json"
+
+    # Single-note writes save the faiss store and the sidecar at most this
+    # often; each save rewrites them whole. Shutdown and reindex always save.
+    FLUSH_INTERVAL_SECONDS = 30.0
+
     def __init__(
         self,
         note_manager: NoteManager,
         vector_db_dir: Optional[Path] = None,
         embedding_provider: Literal['openai', 'sentence-transformers'] = 'sentence-transformers',
-        embedding_model: Optional[str] = None
+        embedding_model: Optional[str] = None,
+        backend: Literal['chroma', 'faiss'] = 'chroma',
+        exact_precision: bool = False
     ):
         """
         Initialize RAGManager.
 
         Args:
             note_manager: NoteManager instance for reading notes
-            vector_db_dir: Directory for ChromaDB storage (default: ~/.learnbase/vector_db)
+            vector_db_dir: Directory for vector storage (default: ~/.learnbase/vector_db)
             embedding_provider: 'openai' or 'sentence-transformers'
             embedding_model: Model name (default: all-MiniLM-L6-v2 for sentence-transformers)
+            backend: 'chroma' (persistent HNSW collection) or 'faiss' (exact
+                in-memory search, sentence-transformers only; stored under
+                vector_db_dir/faiss)
+            exact_precision: faiss backend only; keep float32 vectors instead
+                of int8-quantizing large indexes
         """
         self.note_manager = note_manager
         self.embedding_provider = embedding_provider
+        self.backend = backend
+        self.exact_precision = exact_precision
         self.embedding_model = embedding_model or self.DEFAULT_EMBEDDING_MODEL
 
         # Set up vector database directory
@@ -63,16 +132,85 @@ class RAGManager:
         self.collection = None
         self.embedding_function = None
 
+        # Set once a store is open; is_available() is hit on every operation
+        self._available = False
+
+        # Single worker for index writes, created on first use. One thread
+        # keeps writes for the same note in submission order.
+        self._index_executor: Optional[ThreadPoolExecutor] = None
+        # Exit hook flushing the worker, registered with it; holds only a
+        # weak reference so it does not keep the manager alive
+        self._atexit_hook: Optional[partial] = None
+
+        # Digest of the metadata last written for each note, persisted so a
+        # fresh process can skip unchanged notes without querying the store.
+        # Only trusted for the same backend and embedding settings.
+        if backend == 'faiss':
+            self._index_hashes_path = self.vector_db_dir / self.FAISS_DIR / self.INDEX_HASHES_FILE
+        else:
+            self._index_hashes_path = self.vector_db_dir / f"chroma_{self.INDEX_HASHES_FILE}"
+        self._index_identity = {
+            "backend": backend,
+            "embedding_provider": embedding_provider,
+            "embedding_model": self.embedding_model,
+        }
+        self._index_hashes: Dict[str, str] = {}
+        self._index_hashes_dirty = False
+        self._last_flush = time.monotonic()
+
+        if backend == 'faiss':
+            if not FAISS_AVAILABLE:
+                logger.error("faiss not available. RAG functionality disabled.")
+                return
+            try:
+                self._initialize_faiss()
+                self._load_index_hashes()
+                logger.info(f"Initialized RAGManager with FAISS and {embedding_provider} embeddings")
+            except Exception as e:
+                logger.error(f"Failed to initialize FAISS: {e}", exc_info=True)
+            return
+
         if not CHROMADB_AVAILABLE:
             logger.error("ChromaDB not available. RAG functionality disabled.")
             return
 
         try:
             self._initialize_chromadb()
+            self._load_index_hashes()
             logger.info(f"Initialized RAGManager with {embedding_provider} embeddings")
         except Exception as e:
             logger.error(f"Failed to initialize ChromaDB: {e}", exc_info=True)
 
+    def _initialize_faiss(self):
+        """Open the FAISS store, embedding with a shared sentence-transformers model."""
+        if self.embedding_provider != 'sentence-transformers':
+            raise ValueError("The faiss backend supports sentence-transformers embeddings only")
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
+
+        key = ('sentence-transformers-model', self.embedding_model)
+        model = _EMBED_FN_CACHE.get(key)
+        if model is None:
+            model = _EMBED_FN_CACHE[key] = SentenceTransformer(
+                self.embedding_model, device=_sentence_transformer_device()
+            )
+
+        def embed(documents: List[str]):
+            # One encode call per upsert batch, run as forward passes of
+            # ENCODE_BATCH_SIZE. Unit vectors, so FAISS inner product is cosine.
+            return model.encode(
+                documents,
+                batch_size=self.ENCODE_BATCH_SIZE,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+        self.collection = FaissCollection(
+            self.vector_db_dir / self.FAISS_DIR, embed, exact_precision=self.exact_precision
+        )
+        self._available = True
+
     def _initialize_chromadb(self):
         """Initialize ChromaDB client and collection."""
         # Create persistent client
@@ -90,32 +228,37 @@ class RAGManager:
         else:  # sentence-transformers
             self.embedding_function = self._create_sentence_transformer_embedding_function()
 
-        # Get or create collection
-        try:
-            self.collection = self.client.get_collection(
-                name=self.COLLECTION_NAME,
-                embedding_function=self.embedding_function
-            )
-            logger.debug(f"Loaded existing collection: {self.COLLECTION_NAME}")
-        except Exception:
-            self.collection = self.client.create_collection(
-                name=self.COLLECTION_NAME,
-                embedding_function=self.embedding_function,
-                metadata={"hnsw:space": "cosine"}
-            )
-            logger.info(f"Created new collection: {self.COLLECTION_NAME}")
+        # Get or create collection. Errors opening an existing store propagate
+        # instead of being mistaken for a missing collection.
+        self.collection = self.client.get_or_create_collection(
+            name=self.COLLECTION_NAME,
+            embedding_function=self.embedding_function,
+            metadata={"hnsw:space": "cosine"}
+        )
+        logger.debug(
+            f"Opened collection {self.COLLECTION_NAME} ({self.collection.count()} notes)"
+        )
+        self._available = True
 
     def _create_sentence_transformer_embedding_function(self):
         """Create sentence-transformers embedding function."""
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError("sentence-transformers not installed. Install with: pip install sentence-transformers")
 
+        key = ('sentence-transformers', self.embedding_model)
+        cached = _EMBED_FN_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         # ChromaDB has built-in sentence-transformers support
         from chromadb.utils import embedding_functions
 
-        return embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=self.embedding_model
+        embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name=self.embedding_model,
+            device=_sentence_transformer_device()
         )
+        _EMBED_FN_CACHE[key] = embedding_function
+        return embedding_function
 
     def _create_openai_embedding_function(self):
         """Create OpenAI embedding function."""
@@ -125,12 +268,20 @@ class RAGManager:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
 
+        model_name = self.embedding_model or "text-embedding-3-small"
+        key = ('openai', model_name)
+        cached = _EMBED_FN_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         from chromadb.utils import embedding_functions
 
-        return embedding_functions.OpenAIEmbeddingFunction(
+        embedding_function = embedding_functions.OpenAIEmbeddingFunction(
             api_key=api_key,
-            model_name=self.embedding_model or "text-embedding-3-small"
+            model_name=model_name
         )
+        _EMBED_FN_CACHE[key] = embedding_function
+        return embedding_function
 
     def _prepare_document(self, note: Note) -> str:
         """
@@ -144,16 +295,19 @@ class RAGManager:
         Returns:
             Document text for embedding
         """
-        return f"{note.title}\n\n{note.body}"
+        return note.embedding_document()
 
-    def _prepare_metadata(self, note: Note) -> Dict[str, Any]:
+    def _prepare_metadata(self, note: Note, document: str) -> Dict[str, Any]:
         """
         Extract metadata from note.
 
         Metadata is stored separately from embeddings and can be used for filtering.
+        It also records a hash of the embedded document, so unchanged text can
+        skip re-embedding.
 
         Args:
             note: Note instance
+            document: Document text from _prepare_document
 
         Returns:
             Metadata dictionary
@@ -162,18 +316,18 @@ class RAGManager:
             "filename": note.filename,
             "title": note.title,
             "created_at": note.created_at.isoformat(),
+            "content_sha256": hashlib.sha256(document.encode("utf-8")).hexdigest(),
+            # Vectors from another model are stale even for unchanged text
+            "embedding_model": f"{self.embedding_provider}:{self.embedding_model}",
         }
 
         # Add note type
         if isinstance(note, ReviewNote):
             metadata["note_type"] = "review"
             # Add review-specific metadata
-            if hasattr(note, 'confidence_score') and note.confidence_score is not None:
+            if note.confidence_score is not None:
                 metadata["confidence_score"] = note.confidence_score
-            if hasattr(note, 'sources') and note.sources:
-                metadata["source_count"] = len(note.sources)
-            else:
-                metadata["source_count"] = 0
+            metadata["source_count"] = len(note.sources)
         elif isinstance(note, DrillNote):
             metadata["note_type"] = "drill"
             metadata["language"] = note.language
@@ -189,32 +343,206 @@ class RAGManager:
 
     def is_available(self) -> bool:
         """Check if RAG functionality is available."""
-        return CHROMADB_AVAILABLE and self.client is not None and self.collection is not None
+        return self._available
 
-    def index_note(self, filename: str) -> bool:
+    def __enter__(self) -> 'RAGManager':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
         """
-        Index or update a note in the vector database.
+        Stop the background index worker.
+
+        Args:
+            wait: If True, finish queued index writes and save the store
+                before returning
+        """
+        if self._index_executor is not None:
+            self._index_executor.shutdown(wait=wait)
+            self._index_executor = None
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+        if wait:
+            self._flush()
+
+    def _load_index_hashes(self) -> None:
+        """Load the indexed-state sidecar, if it still matches the store."""
+        try:
+            with open(self._index_hashes_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index hash cache: {e}")
+            return
+
+        # Digests recorded under another backend or embedding model say
+        # nothing about the vectors this store holds
+        if not isinstance(sidecar, dict) or any(
+            sidecar.get(key) != value for key, value in self._index_identity.items()
+        ):
+            logger.info("Index hash cache written with other embedding settings, ignoring it")
+            return
+        hashes = sidecar.get("hashes")
+
+        # A store rebuilt or edited outside this class invalidates the cache:
+        # the count is checked first, then the stored ids themselves
+        if (not isinstance(hashes, dict) or len(hashes) != self.collection.count()
+                or set(hashes) != set(self.collection.get(include=[])["ids"])):
+            logger.info("Index hash cache out of date, ignoring it")
+            return
+        self._index_hashes = hashes
+
+    def _maybe_flush(self) -> None:
+        """Save after a single-note write if FLUSH_INTERVAL_SECONDS have passed."""
+        if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Save the store, then the sidecar describing what it holds."""
+        self._last_flush = time.monotonic()
+        try:
+            # ChromaDB persists its own writes; the faiss store holds them
+            # in memory until flushed
+            if self.backend == 'faiss' and self.collection is not None:
+                self.collection.flush()
+        except (OSError, RuntimeError) as e:
+            # Keep the old sidecar rather than describe unsaved vectors
+            logger.error(f"Failed to save vector store: {e}", exc_info=True)
+            return
+        self._flush_index_hashes()
+
+    def _flush_index_hashes(self) -> None:
+        """Write the indexed-state sidecar if it changed (temp file + rename)."""
+        if not self._index_hashes_dirty:
+            return
+        tmp_path = f"{self._index_hashes_path}.tmp"
+        try:
+            self._index_hashes_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {**self._index_identity, "hashes": self._index_hashes},
+                    f, separators=(',', ':')
+                )
+            os.replace(tmp_path, self._index_hashes_path)
+            self._index_hashes_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save index hash cache: {e}")
+
+    @staticmethod
+    def _metadata_digest(metadata: Dict[str, Any]) -> str:
+        """Digest of everything written for a note (metadata holds the text hash)."""
+        encoded = json.dumps(metadata, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _record_indexed(self, filename: str, metadata: Dict[str, Any]) -> None:
+        """Remember what the store now holds for a note."""
+        self._index_hashes[filename] = self._metadata_digest(metadata)
+        self._index_hashes_dirty = True
+
+    def _submit(self, fn, *args) -> Future:
+        """Queue an index write on the background worker."""
+        if self._index_executor is None:
+            self._index_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-index")
+            self._atexit_hook = partial(_call_if_alive, weakref.WeakMethod(self.shutdown))
+            atexit.register(self._atexit_hook)
+        return self._index_executor.submit(fn, *args)
+
+    def _wait_for_writes(self) -> None:
+        """Block until every index write queued so far has been applied."""
+        if self._index_executor is not None:
+            self._submit(_noop).result()
+
+    def index_note_async(self, filename: str) -> Future:
+        """
+        Queue a note for indexing and return without waiting.
+
+        The note is read and its document and metadata built on the calling
+        thread, since NoteManager is not thread-safe. Embedding and the
+        vector store write run on a background thread, so note saves are not
+        held up by them. Writes are applied in order.
 
         Args:
             filename: Note filename
 
         Returns:
-            True if successful, False otherwise
+            Future resolving to index_note's result
         """
         if not self.is_available():
             logger.error("RAG not available")
-            return False
+            return _completed(False)
 
         try:
-            # Load note
             note = self.note_manager.get_note(filename)
             if not note:
                 logger.error(f"Note not found: {filename}")
-                return False
+                return _completed(False)
 
-            # Prepare document and metadata
             document = self._prepare_document(note)
-            metadata = self._prepare_metadata(note)
+            metadata = self._prepare_metadata(note, document)
+        except Exception as e:
+            logger.error(f"Failed to index note {filename}: {e}", exc_info=True)
+            return _completed(False)
+
+        return self._submit(self._index_note_now, filename, document, metadata)
+
+    def remove_from_index_async(self, filename: str) -> Future:
+        """
+        Queue a note for removal, ordered after any pending index write.
+
+        Args:
+            filename: Note filename
+
+        Returns:
+            Future resolving to remove_from_index's result
+        """
+        return self._submit(self._remove_from_index_now, filename)
+
+    def index_note(self, filename: str) -> bool:
+        """
+        Index or update a note in the vector database.
+
+        Waits for any queued writes first, so the result reflects the
+        latest state.
+
+        Args:
+            filename: Note filename
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.index_note_async(filename).result()
+
+    def _index_note_now(self, filename: str, document: str, metadata: Dict[str, Any]) -> bool:
+        """Write a prepared note to the store on the calling thread; see index_note."""
+        if not self.is_available():
+            logger.error("RAG not available")
+            return False
+
+        try:
+            # Same text and metadata as the last write: nothing to do
+            if self._index_hashes.get(filename) == self._metadata_digest(metadata):
+                logger.debug(f"Note unchanged since last index: {filename}")
+                return True
+
+            # Embedding dominates indexing cost; only re-embed changed text
+            # or text embedded by another model
+            existing = self.collection.get(ids=[filename], include=["metadatas"])
+            stored = existing["metadatas"][0] if existing and existing.get("metadatas") else None
+            if (stored and stored.get("content_sha256") == metadata["content_sha256"]
+                    and stored.get("embedding_model") == metadata["embedding_model"]):
+                if stored == metadata:
+                    logger.debug(f"Note unchanged, skipping index: {filename}")
+                else:
+                    # Same text, new metadata (e.g. confidence): no embedding needed
+                    self.collection.update(ids=[filename], metadatas=[metadata])
+                    logger.info(f"Updated index metadata: {filename}")
+                self._record_indexed(filename, metadata)
+                self._maybe_flush()
+                return True
 
             # Upsert to collection (add or update)
             self.collection.upsert(
@@ -222,6 +550,8 @@ class RAGManager:
                 documents=[document],
                 metadatas=[metadata]
             )
+            self._record_indexed(filename, metadata)
+            self._maybe_flush()
 
             logger.info(f"Indexed note: {filename}")
             return True
@@ -230,6 +560,47 @@ class RAGManager:
             logger.error(f"Failed to index note {filename}: {e}", exc_info=True)
             return False
 
+    def _index_notes_batch(self, notes: List[Note], batch_size: int = INDEX_BATCH_SIZE) -> Tuple[int, int]:
+        """
+        Upsert notes in batches rather than one call per note.
+
+        Each batch is a single upsert, so the embedding function and the
+        storage transaction are paid once per batch. A failing batch is
+        logged and counted without stopping the remaining batches. Nothing
+        is flushed here; the caller saves once after the last batch.
+
+        Args:
+            notes: Notes to index
+            batch_size: Notes per upsert (clamped to MAX_INDEX_BATCH_SIZE)
+
+        Returns:
+            Tuple of (indexed, failed) note counts
+        """
+        batch_size = max(1, min(batch_size, self.MAX_INDEX_BATCH_SIZE))
+        indexed = failed = 0
+
+        for start in range(0, len(notes), batch_size):
+            batch = notes[start:start + batch_size]
+            try:
+                documents = [self._prepare_document(note) for note in batch]
+                metadatas = [self._prepare_metadata(n, d) for n, d in zip(batch, documents)]
+                self.collection.upsert(
+                    ids=[note.filename for note in batch],
+                    documents=documents,
+                    metadatas=metadatas
+                )
+                for note, metadata in zip(batch, metadatas):
+                    self._record_indexed(note.filename, metadata)
+                indexed += len(batch)
+            except Exception as e:
+                logger.error(
+                    f"Failed to index batch of {len(batch)} notes starting at {batch[0].filename}: {e}",
+                    exc_info=True
+                )
+                failed += len(batch)
+
+        return indexed, failed
+
     def search_notes(
         self,
         query: str,
@@ -240,6 +611,9 @@ class RAGManager:
         """
         Search for notes using semantic similarity.
 
+        Waits for queued index writes first, so a note saved just before
+        the search is found with its current metadata.
+
         Args:
             query: Search query
             limit: Maximum number of results
@@ -254,6 +628,8 @@ class RAGManager:
             return []
 
         try:
+            self._wait_for_writes()
+
             # Build metadata filter
             where = {}
             if note_type:
@@ -271,14 +647,16 @@ class RAGManager:
             # Format results
             formatted_results = []
             if results and results['ids'] and results['ids'][0]:
-                for i, filename in enumerate(results['ids'][0]):
-                    metadata = results['metadatas'][0][i]
-                    distance = results['distances'][0][i] if results.get('distances') else None
-
-                    # Convert distance to similarity score (cosine: similarity = 1 - distance)
-                    similarity = 1 - distance if distance is not None else None
+                ids = results['ids'][0]
+                # Convert distances to similarity scores in one pass
+                # (cosine: similarity = 1 - distance)
+                if results.get('distances'):
+                    similarities = [1 - distance for distance in results['distances'][0]]
+                else:
+                    similarities = [None] * len(ids)
 
-                    result = {
+                formatted_results = [
+                    {
                         'filename': filename,
                         'title': metadata.get('title', 'Unknown'),
                         'similarity': similarity,
@@ -287,7 +665,9 @@ class RAGManager:
                         'source_count': metadata.get('source_count', 0),
                         'created_at': metadata.get('created_at')
                     }
-                    formatted_results.append(result)
+                    for filename, metadata, similarity
+                    in zip(ids, results['metadatas'][0], similarities)
+                ]
 
             logger.info(f"Search query '{query}' returned {len(formatted_results)} results")
             return formatted_results
@@ -306,12 +686,19 @@ class RAGManager:
         Returns:
             True if successful, False otherwise
         """
+        return self.remove_from_index_async(filename).result()
+
+    def _remove_from_index_now(self, filename: str) -> bool:
+        """Remove a note on the calling thread; see remove_from_index."""
         if not self.is_available():
             logger.error("RAG not available")
             return False
 
         try:
             self.collection.delete(ids=[filename])
+            if self._index_hashes.pop(filename, None) is not None:
+                self._index_hashes_dirty = True
+            self._maybe_flush()
             logger.info(f"Removed from index: {filename}")
             return True
         except Exception as e:
@@ -322,7 +709,11 @@ class RAGManager:
         """
         Reindex all notes in the database.
 
-        Clears the collection and rebuilds from scratch.
+        Clears the collection and rebuilds from scratch. The store is
+        cleared on the index worker, after any queued writes, so none land
+        in the dropped collection. Notes are read on the calling thread and
+        each batch is embedded and written on the worker while the next
+        batch is read.
 
         Returns:
             Dictionary with stats: total, indexed, failed
@@ -332,25 +723,30 @@ class RAGManager:
             return {"total": 0, "indexed": 0, "failed": 0}
 
         try:
-            # Clear collection
-            self.client.delete_collection(name=self.COLLECTION_NAME)
-            self._initialize_chromadb()
-
-            # Get all notes (review, reference, and evergreen)
-            all_notes = self.note_manager.get_all_notes()
+            self._submit(self._clear_index).result()
 
             stats = {
-                "total": len(all_notes),
+                "total": 0,
                 "indexed": 0,
                 "failed": 0
             }
 
-            # Index each note
-            for note in all_notes:
-                if self.index_note(note.filename):
-                    stats["indexed"] += 1
-                else:
-                    stats["failed"] += 1
+            # Stream notes (review, reference, evergreen and drill) into
+            # batched upserts, holding at most two batches of bodies at a time
+            notes = self.note_manager.iter_all_notes()
+            pending: Optional[Tuple[int, Future]] = None
+            while True:
+                batch = list(islice(notes, self.INDEX_BATCH_SIZE))
+                if pending is not None:
+                    indexed, failed = pending[1].result()
+                    stats["total"] += pending[0]
+                    stats["indexed"] += indexed
+                    stats["failed"] += failed
+                if not batch:
+                    break
+                pending = (len(batch), self._submit(self._index_notes_batch, batch))
+            # One save for the whole rebuild
+            self._submit(self._flush).result()
 
             logger.info(f"Reindexed all notes: {stats}")
             return stats
@@ -359,6 +755,18 @@ class RAGManager:
             logger.error(f"Failed to reindex all notes: {e}", exc_info=True)
             return {"total": 0, "indexed": 0, "failed": 0}
 
+    def _clear_index(self) -> None:
+        """Empty the store and the indexed-state cache, on the index worker."""
+        self._index_hashes.clear()
+        self._index_hashes_dirty = True
+        if self.backend == 'faiss':
+            self.collection.reset()
+        else:
+            # Unavailable until the collection is recreated
+            self._available = False
+            self.client.delete_collection(name=self.COLLECTION_NAME)
+            self._initialize_chromadb()
+
     def get_index_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the vector database.
@@ -371,18 +779,21 @@ class RAGManager:
                 "indexed_count": 0,
                 "embedding_provider": self.embedding_provider,
                 "embedding_model": self.embedding_model,
+                "backend": self.backend,
                 "storage_path": str(self.vector_db_dir),
                 "available": False,
                 "error": "ChromaDB not available"
             }
 
         try:
+            self._wait_for_writes()
             count = self.collection.count()
 
             return {
                 "indexed_count": count,
                 "embedding_provider": self.embedding_provider,
                 "embedding_model": self.embedding_model,
+                "backend": self.backend,
                 "storage_path": str(self.vector_db_dir),
                 "available": True
             }
@@ -392,6 +803,7 @@ class RAGManager:
                 "indexed_count": 0,
                 "embedding_provider": self.embedding_provider,
                 "embedding_model": self.embedding_model,
+                "backend": self.backend,
                 "storage_path": str(self.vector_db_dir),
                 "available": False,
                 "error": str(e)
@@ -1,7 +1,8 @@
 """Spaced repetition algorithm implementation (SM-2 simplified)."""
 
 from datetime import datetime, timedelta
-from typing import Tuple, List
+from functools import lru_cache
+from typing import Tuple, List, Optional
 import re
 
 
@@ -28,12 +29,25 @@ INTERVAL_EXCELLENT_MULTIPLIER = 2.5  # 2.5x interval for rating 4
 # First Review Handling
 FIRST_REVIEW_INTERVAL = 1  # First review always after 1 day for rating 3+
 
+# Ease factor change per rating
+_EASE_DELTA = {
+    1: -EASE_DECREASE_POOR,
+    2: -EASE_DECREASE_FAIR,
+    3: 0.0,
+    4: EASE_INCREASE_EXCELLENT,
+}
+
+# Schedule pattern parts: a count and a unit (day, week, month, year)
+_SCHEDULE_PART_RE = re.compile(r'(\d+)([dwmy])')
+_UNIT_DAYS = {'d': 1, 'w': 7, 'm': 30, 'y': 365}
+
 
 def calculate_next_review(
     rating: int,
     current_interval: int,
     ease_factor: float,
-    review_count: int
+    review_count: int,
+    now: Optional[datetime] = None
 ) -> Tuple[int, float, datetime]:
     """
     Calculate the next review schedule based on SM-2 algorithm.
@@ -47,21 +61,20 @@ def calculate_next_review(
         current_interval: Current interval in days
         ease_factor: Current ease factor (1.3 - 3.0)
         review_count: Number of times reviewed
+        now: Time of the review (default: datetime.now())
 
     Returns:
         Tuple of (new_interval, new_ease_factor, next_review_date)
     """
-    # Update ease factor based on rating
-    new_ease_factor = ease_factor
-
-    if rating == 1:
-        new_ease_factor = max(EASE_FACTOR_MIN, ease_factor - EASE_DECREASE_POOR)
-    elif rating == 2:
-        new_ease_factor = max(EASE_FACTOR_MIN, ease_factor - EASE_DECREASE_FAIR)
-    elif rating == 3:
-        pass  # No change
-    elif rating == 4:
-        new_ease_factor = min(EASE_FACTOR_MAX, ease_factor + EASE_INCREASE_EXCELLENT)
+    # Update ease factor based on rating; a change is clamped only at the
+    # bound it moves toward, and rating 3 leaves the ease untouched
+    delta = _EASE_DELTA.get(rating, 0.0)
+    if delta < 0:
+        new_ease_factor = max(EASE_FACTOR_MIN, ease_factor + delta)
+    elif delta > 0:
+        new_ease_factor = min(EASE_FACTOR_MAX, ease_factor + delta)
+    else:
+        new_ease_factor = ease_factor
 
     # Calculate new interval
     if rating == 1:
@@ -74,7 +87,7 @@ def calculate_next_review(
         new_interval = int(current_interval * INTERVAL_EXCELLENT_MULTIPLIER)
 
     # Calculate next review date
-    next_review_date = datetime.now() + timedelta(days=new_interval)
+    next_review_date = (now or datetime.now()) + timedelta(days=new_interval)
 
     return new_interval, new_ease_factor, next_review_date
 
@@ -93,6 +106,18 @@ def parse_schedule_pattern(pattern: str) -> List[int]:
         "1d,1w,2w" -> [1, 7, 14]
         "1w,1m,3m" -> [7, 30, 90]
     """
+    return list(_parse_schedule_intervals(pattern))
+
+
+@lru_cache(maxsize=256)
+def _parse_schedule_intervals(pattern: str) -> Tuple[int, ...]:
+    """
+    Parse a schedule pattern once per distinct string.
+
+    Patterns come from a handful of presets and per-note strings that are
+    re-read on every review, so the result is memoized. It is a tuple so the
+    cached value cannot be mutated by callers.
+    """
     intervals = []
     parts = pattern.split(',')
 
@@ -101,35 +126,21 @@ def parse_schedule_pattern(pattern: str) -> List[int]:
         if not part:
             continue
 
-        # Extract number and unit
-        match = re.match(r'(\d+)([dwmy])', part.lower())
+        # Extract number and unit, convert to days
+        match = _SCHEDULE_PART_RE.match(part.lower())
         if not match:
             continue
 
-        value = int(match.group(1))
-        unit = match.group(2)
-
-        # Convert to days
-        if unit == 'd':
-            days = value
-        elif unit == 'w':
-            days = value * 7
-        elif unit == 'm':
-            days = value * 30
-        elif unit == 'y':
-            days = value * 365
-        else:
-            continue
-
-        intervals.append(days)
+        intervals.append(int(match.group(1)) * _UNIT_DAYS[match.group(2)])
 
-    return intervals if intervals else [1, 7, 14, 30]  # Default if parsing fails
+    return tuple(intervals) if intervals else (1, 7, 14, 30)  # Default if parsing fails
 
 
 def calculate_scheduled_review(
     rating: int,
     schedule_pattern: str,
-    review_count: int
+    review_count: int,
+    now: Optional[datetime] = None
 ) -> Tuple[int, datetime]:
     """
     Calculate next review for scheduled mode.
@@ -145,11 +156,12 @@ def calculate_scheduled_review(
             4 (easy): Skip ahead in schedule
         schedule_pattern: Pattern like "1d,1w,2w,1m,3m,6m"
         review_count: Number of reviews completed
+        now: Time of the review (default: datetime.now())
 
     Returns:
         Tuple of (interval_days, next_review_date)
     """
-    intervals = parse_schedule_pattern(schedule_pattern)
+    intervals = _parse_schedule_intervals(schedule_pattern)
 
     if rating == 1:
         # Reset to beginning
@@ -167,7 +179,7 @@ def calculate_scheduled_review(
         next_index = min(review_count + 2, len(intervals) - 1)
         next_interval = intervals[next_index]
 
-    next_review_date = datetime.now() + timedelta(days=next_interval)
+    next_review_date = (now or datetime.now()) + timedelta(days=next_interval)
 
     return next_interval, next_review_date
 
@@ -180,6 +192,12 @@ PRESET_SCHEDULES = {
     "relaxed": "1w,2w,1m,2m,6m,1y"          # Long-term retention
 }
 
+# Parse the presets at import, so reviews on a preset schedule start out as
+# pattern cache hits
+for _pattern in PRESET_SCHEDULES.values():
+    _parse_schedule_intervals(_pattern)
+del _pattern
+
 
 # Ladder review mode — pass/fail with fixed interval progression
 # Used by DrillNote. On pass: step += 1 (capped). On fail: step -= 1 (floored at 0).
@@ -193,7 +211,8 @@ REWRITE_FAIL_THRESHOLD = 3
 def calculate_ladder_review(
     passed: bool,
     current_step: int,
-    fail_streak: int
+    fail_streak: int,
+    now: Optional[datetime] = None
 ) -> Tuple[int, int, datetime, int]:
     """Calculate the next ladder review for a drill card.
 
@@ -201,6 +220,7 @@ def calculate_ladder_review(
         passed: True if the user passed; False otherwise.
         current_step: Current index into LADDER_INTERVALS.
         fail_streak: Current consecutive-fail count.
+        now: Time of the review (default: datetime.now()).
 
     Returns:
         Tuple of (new_step, new_interval_days, next_review_date, new_fail_streak).
@@ -215,6 +235,6 @@ def calculate_ladder_review(
         new_fail_streak = fail_streak + 1
 
     new_interval = LADDER_INTERVALS[new_step]
-    next_review_date = datetime.now() + timedelta(days=new_interval)
+    next_review_date = (now or datetime.now()) + timedelta(days=new_interval)
 
     return new_step, new_interval, next_review_date, new_fail_streak
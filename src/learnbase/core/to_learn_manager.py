@@ -2,14 +2,29 @@
 
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Tuple, Mapping
+import os
 import re
 import logging
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Quick-table separator row ("|---|---|", "| --- | --- |"): pipes, dashes and
+# spaces, with any whitespace at the ends. Callers also require '---'.
+_TABLE_SEPARATOR = re.compile(r'\s*\|[\s|]*(?:-(?:[- |]*-)?)?[\s|]*')
+
+# Topic metadata lines ("**Added:** 2024-01-01"), and the slot each label
+# fills in _parse_content's current topic. Completed is read in the archive.
+_META_PREFIXES = ('**Added:**', '**Context:**', '**Completed:**')
+_META_SLOTS = {'**Added': 1, '**Context': 2, '**Completed': 3}
+
+# Cached parse: each section's topics as read-only views
+_Snapshot = Dict[str, Tuple[Mapping[str, Any], ...]]
+
 
 class ToLearnManager:
     """Manages learning topics in a single markdown file with table and sections."""
@@ -28,6 +43,12 @@ class ToLearnManager:
         self.learnbase_dir = self.file_path.parent
         self.learnbase_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed file as (st_mtime_ns, st_size, data, index), reused while the
+        # file's stat is unchanged; _write_file stores what it just wrote.
+        # index maps each lowercased topic name to the (section, position)
+        # of its first occurrence in quick, detailed, archived order.
+        self._cache: Optional[Tuple[int, int, _Snapshot, Dict[str, Tuple[str, int]]]] = None
+
         # Initialize file if it doesn't exist
         if not self.file_path.exists():
             self._create_initial_file()
@@ -90,11 +111,36 @@ class ToLearnManager:
         """
         Parse the to_learn.md file into structured data.
 
+        The parse is cached until the file's mtime or size changes; callers
+        get their own mutable copy.
+
         Returns:
             Dictionary with 'quick' and 'detailed' and 'archived' topics
         """
-        if not self.file_path.exists():
-            return {"quick": [], "detailed": [], "archived": []}
+        data, _ = self._load()
+        return self._copy_data(data)
+
+    def _load(self) -> Tuple[_Snapshot, Dict[str, Tuple[str, int]]]:
+        """
+        Get the parsed file and its topic index, from the cache when unchanged.
+
+        Both are shared with the cache. Topics are read-only views; write
+        paths modify a copy made with _copy_data.
+
+        Returns:
+            Tuple of (data, index); see __init__ for the index layout
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return {"quick": (), "detailed": (), "archived": ()}, {}
+        except OSError as e:
+            logger.error(f"Failed to read {self.file_path}: {e}")
+            raise IOError(f"Failed to read to_learn.md: {e}") from e
+
+        cached = self._cache
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
 
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
@@ -103,27 +149,108 @@ class ToLearnManager:
             logger.error(f"Failed to read {self.file_path}: {e}")
             raise IOError(f"Failed to read to_learn.md: {e}") from e
 
-        quick_topics = []
-        detailed_topics = []
-        archived_topics = []
+        data = self._freeze(self._parse_content(content))
+        index = self._index_topics(data)
+        self._cache = (stat.st_mtime_ns, stat.st_size, data, index)
+        return data, index
+
+    @staticmethod
+    def _freeze(data: Dict[str, List[Dict]]) -> _Snapshot:
+        """Wrap parsed topics in read-only views for the cache."""
+        return {key: tuple(MappingProxyType(t) for t in topics) for key, topics in data.items()}
+
+    @staticmethod
+    def _index_topics(data: _Snapshot) -> Dict[str, Tuple[str, int]]:
+        """Map lowercased topic names to where they first occur in data."""
+        index: Dict[str, Tuple[str, int]] = {}
+        for section in ("quick", "detailed", "archived"):
+            for position, t in enumerate(data[section]):
+                index.setdefault(t["topic"].lower(), (section, position))
+        return index
+
+    @staticmethod
+    def _copy_data(data: _Snapshot) -> Dict[str, List[Dict]]:
+        """Mutable copy of cached data; topic values are immutable, so copying each topic suffices."""
+        return {key: [dict(t) for t in topics] for key, topics in data.items()}
+
+    def _parse_content(self, content: str) -> Dict[str, List[Dict]]:
+        """
+        Parse to_learn.md content into structured data.
 
-        # Split content by main sections
-        sections = re.split(r'\n## ', content)
+        A single pass over the lines: "## " headers switch between the quick
+        table, the detailed and archive sections and ignored sections (a
+        repeated section replaces the earlier one), and "### " headers start
+        a topic within the detailed and archive sections.
 
-        for section in sections:
-            section_lower = section.lower()
+        Args:
+            content: Complete file content
 
-            # Parse Quick Capture Topics table
-            if section_lower.startswith('quick capture topics'):
-                quick_topics = self._parse_quick_table(section)
+        Returns:
+            Dictionary with 'quick' and 'detailed' and 'archived' topics
+        """
+        quick_topics: List[Dict] = []
+        detailed_topics: List[Dict] = []
+        archived_topics: List[Dict] = []
 
-            # Parse Detailed Topics
-            elif section_lower.startswith('detailed topics'):
-                detailed_topics = self._parse_detailed_section(section)
+        # 'quick', 'detailed', 'archive', or None outside those sections
+        section: Optional[str] = None
+        in_table = False
+        # Topic being read: [name, added, context, completed, notes_lines]
+        current: Optional[List[Any]] = None
+
+        for i, line in enumerate(content.split('\n')):
+            # The first line cannot start a section (no newline before it)
+            if i and line.startswith('## '):
+                self._finish_topic(section, current, detailed_topics, archived_topics)
+                current = None
+                header = line[3:].lower()
+                if header.startswith('quick capture topics'):
+                    section = 'quick'
+                    quick_topics = []
+                    in_table = False
+                elif header.startswith('detailed topics'):
+                    section = 'detailed'
+                    detailed_topics = []
+                elif header.startswith('archive'):
+                    section = 'archive'
+                    archived_topics = []
+                else:
+                    section = None
+                continue
 
-            # Parse Archive
-            elif section_lower.startswith('archive'):
-                archived_topics = self._parse_archive_section(section)
+            if section == 'quick':
+                # Rows count once the separator (skip header) has been seen
+                if '---' in line and _TABLE_SEPARATOR.fullmatch(line):
+                    in_table = True
+                elif in_table and line.strip().startswith('|'):
+                    parts = [p.strip() for p in line.split('|')[1:-1]]  # Skip empty first/last
+                    if len(parts) >= 3:
+                        quick_topics.append({
+                            "topic": parts[0],
+                            "added": parts[1],
+                            "context": parts[2],
+                            "detailed": False,
+                            "notes": "",
+                            "archived": False
+                        })
+
+            elif section is not None:
+                if line.startswith('### '):
+                    self._finish_topic(section, current, detailed_topics, archived_topics)
+                    current = [line[4:].strip(), "", "", "", []]
+                elif current is None:
+                    continue  # Section text before the first topic
+                elif line.startswith(_META_PREFIXES):
+                    # Everything after the label is the value
+                    label, _, value = line.partition(':**')
+                    slot = _META_SLOTS[label]
+                    if slot != 3 or section == 'archive':
+                        current[slot] = value.strip()
+                elif line.strip() and not line.startswith('**'):
+                    # Content lines
+                    current[4].append(line)
+
+        self._finish_topic(section, current, detailed_topics, archived_topics)
 
         return {
             "quick": quick_topics,
@@ -131,63 +258,21 @@ class ToLearnManager:
             "archived": archived_topics
         }
 
-    def _parse_quick_table(self, section: str) -> List[Dict]:
-        """Parse the Quick Capture Topics table."""
-        topics = []
-        lines = section.split('\n')
-
-        # Find table rows (skip header and separator)
-        in_table = False
-        for line in lines:
-            # Match separator line (can have spaces: "| ---" or "|---")
-            if line.strip().startswith('|') and '---' in line and all(c in '|- ' for c in line.replace('|', '').strip()):
-                in_table = True
-                continue
-
-            if in_table and line.strip().startswith('|'):
-                # Parse table row
-                parts = [p.strip() for p in line.split('|')[1:-1]]  # Skip empty first/last
-                if len(parts) >= 3:
-                    topics.append({
-                        "topic": parts[0],
-                        "added": parts[1],
-                        "context": parts[2] if len(parts) > 2 else "",
-                        "detailed": False,
-                        "notes": "",
-                        "archived": False
-                    })
-
-        return topics
-
-    def _parse_detailed_section(self, section: str) -> List[Dict]:
-        """Parse the Detailed Topics section."""
-        topics = []
-
-        # Split by ### headers (individual topics)
-        topic_sections = re.split(r'\n### ', section)
-
-        for topic_section in topic_sections[1:]:  # Skip first (section header)
-            lines = topic_section.split('\n')
-            if not lines:
-                continue
-
-            topic_name = lines[0].strip()
-            added = ""
-            context = ""
-            notes_lines = []
-
-            # Parse metadata and notes
-            for i, line in enumerate(lines[1:], 1):
-                if line.startswith('**Added:**'):
-                    added = line.replace('**Added:**', '').strip()
-                elif line.startswith('**Context:**'):
-                    context = line.replace('**Context:**', '').strip()
-                elif line.strip() and not line.startswith('**'):
-                    # Content lines
-                    notes_lines.append(line)
-
-            topics.append({
-                "topic": topic_name,
+    @staticmethod
+    def _finish_topic(
+        section: Optional[str],
+        current: Optional[List[Any]],
+        detailed_topics: List[Dict],
+        archived_topics: List[Dict]
+    ) -> None:
+        """Append the topic read by _parse_content to its section's list."""
+        if current is None:
+            return
+        name, added, context, completed, notes_lines = current
+
+        if section == 'detailed':
+            detailed_topics.append({
+                "topic": name,
                 "added": added,
                 "context": context,
                 "detailed": True,
@@ -195,61 +280,28 @@ class ToLearnManager:
                 "archived": False
             })
 
-        return topics
-
-    def _parse_archive_section(self, section: str) -> List[Dict]:
-        """Parse the Archive section."""
-        topics = []
-
-        # Similar to detailed topics parsing
-        topic_sections = re.split(r'\n### ', section)
-
-        for topic_section in topic_sections[1:]:
-            lines = topic_section.split('\n')
-            if not lines:
-                continue
-
-            topic_name = lines[0].strip()
-
-            # Skip the "Completed Topics" header itself
-            if topic_name.lower() == "completed topics":
-                continue
-
-            added = ""
-            completed = ""
-            context = ""
-            notes_lines = []
-
-            for line in lines[1:]:
-                if line.startswith('**Added:**'):
-                    added = line.replace('**Added:**', '').strip()
-                elif line.startswith('**Completed:**'):
-                    completed = line.replace('**Completed:**', '').strip()
-                elif line.startswith('**Context:**'):
-                    context = line.replace('**Context:**', '').strip()
-                elif line.strip() and not line.startswith('**'):
-                    notes_lines.append(line)
-
-            # Only add if we have valid data (added date at minimum)
-            if added or topic_name:
-                topics.append({
-                    "topic": topic_name,
-                    "added": added,
-                    "completed": completed,
-                    "context": context,
-                    "detailed": True,
-                    "notes": '\n'.join(notes_lines).strip(),
-                    "archived": True
-                })
-
-        return topics
+        # Skip the "Completed Topics" header itself; otherwise only add if
+        # we have valid data (added date at minimum)
+        elif name.lower() != "completed topics" and (added or name):
+            archived_topics.append({
+                "topic": name,
+                "added": added,
+                "completed": completed,
+                "context": context,
+                "detailed": True,
+                "notes": '\n'.join(notes_lines).strip(),
+                "archived": True
+            })
 
-    def _write_file(self, data: Dict[str, List[Dict]]) -> None:
+    def _render_file(self, data: Dict[str, List[Dict]]) -> str:
         """
-        Write structured data back to file atomically.
+        Render structured data as to_learn.md content.
 
         Args:
             data: Dictionary with 'quick', 'detailed', and 'archived' topics
+
+        Returns:
+            Complete file content
         """
         # Calculate counts
         all_active_topics = data["quick"] + data["detailed"]
@@ -303,30 +355,65 @@ class ToLearnManager:
                 lines.append(topic['notes'])
                 lines.append("")
 
-        content = '\n'.join(lines)
+        return '\n'.join(lines)
 
-        # Atomic write: write to temp file, then rename
+    def _write_file(self, data: Dict[str, List[Dict]]) -> None:
+        """
+        Write structured data back to file atomically.
+
+        Args:
+            data: Dictionary with 'quick', 'detailed', and 'archived' topics
+        """
+        content = self._render_file(data)
+
+        # Atomic write: write to temp file, then rename. The content is
+        # encoded once and handed to a binary file in a single write, which
+        # skips the text layer's encoder and buffer.
+        tmp_path = None
         try:
             with tempfile.NamedTemporaryFile(
-                mode='w',
-                encoding='utf-8',
+                mode='wb',
                 dir=self.learnbase_dir,
                 delete=False,
                 suffix='.tmp'
             ) as tmp_file:
-                tmp_file.write(content)
                 tmp_path = Path(tmp_file.name)
+                tmp_file.write(content.encode('utf-8'))
+                # The new contents must be on disk before the rename exposes them
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
 
-            # Atomic rename
+            # Atomic rename, then persist the directory entry so the rename
+            # itself survives a crash
             tmp_path.replace(self.file_path)
+            self._fsync_directory()
             logger.debug(f"Successfully wrote to {self.file_path}")
 
+            # Cache what a re-read would return (rendering normalizes some
+            # fields, so parse the content rather than reuse data)
+            stat = os.stat(self.file_path)
+            written = self._freeze(self._parse_content(content))
+            self._cache = (stat.st_mtime_ns, stat.st_size, written, self._index_topics(written))
+
         except (IOError, OSError) as e:
             logger.error(f"Failed to write {self.file_path}: {e}")
-            if tmp_path.exists():
+            if tmp_path is not None and tmp_path.exists():
                 tmp_path.unlink()
             raise IOError(f"Failed to write to_learn.md: {e}") from e
 
+    def _fsync_directory(self) -> None:
+        """Flush learnbase_dir's entries to disk, where the platform allows it."""
+        try:
+            fd = os.open(self.learnbase_dir, os.O_RDONLY)
+        except OSError:
+            return  # Directories cannot be opened on Windows
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.debug(f"Could not fsync {self.learnbase_dir}: {e}")
+        finally:
+            os.close(fd)
+
     def add_topic(
         self,
         topic: str,
@@ -348,18 +435,30 @@ class ToLearnManager:
         """
         self._validate_topic_name(topic)
 
-        data = self._parse_file()
+        data, index = self._load()
 
         # Check for duplicates
-        all_topics = data["quick"] + data["detailed"] + data["archived"]
-        if any(t["topic"].lower() == topic.lower() for t in all_topics):
+        if topic.lower() in index:
             raise ValueError(f"Topic '{topic}' already exists")
 
-        added_date = datetime.now().strftime('%Y-%m-%d')
+        data = self._copy_data(data)
+        self._append_topic(data, topic, context, detailed, notes)
 
+        self._write_file(data)
+        logger.info(f"Added {'detailed' if detailed else 'quick'} topic: {topic}")
+
+    def _append_topic(
+        self,
+        data: Dict[str, List[Dict]],
+        topic: str,
+        context: str,
+        detailed: bool,
+        notes: str
+    ) -> None:
+        """Append a new, already validated topic to parsed data, added today."""
         new_topic = {
             "topic": topic,
-            "added": added_date,
+            "added": datetime.now().strftime('%Y-%m-%d'),
             "context": context,
             "detailed": detailed,
             "notes": notes if detailed else "",
@@ -371,13 +470,10 @@ class ToLearnManager:
         else:
             data["quick"].append(new_topic)
 
-        self._write_file(data)
-        logger.info(f"Added {'detailed' if detailed else 'quick'} topic: {topic}")
-
     def list_topics(
         self,
         include_archived: bool = False
-    ) -> List[Dict]:
+    ) -> List[Mapping[str, Any]]:
         """
         List all topics with optional filtering.
 
@@ -385,17 +481,18 @@ class ToLearnManager:
             include_archived: Include archived topics
 
         Returns:
-            List of topic dictionaries
+            List of read-only topic mappings, shared with the parse cache
+            (copy one with dict() to modify it)
         """
-        data = self._parse_file()
-        topics = data["quick"] + data["detailed"]
+        data, _ = self._load()
+        topics = [*data["quick"], *data["detailed"]]
 
         if include_archived:
             topics.extend(data["archived"])
 
         return topics
 
-    def get_topic(self, topic: str) -> Optional[Dict]:
+    def get_topic(self, topic: str) -> Optional[Mapping[str, Any]]:
         """
         Get a specific topic by name.
 
@@ -403,18 +500,17 @@ class ToLearnManager:
             topic: Topic name
 
         Returns:
-            Topic dictionary or None if not found
+            Read-only topic mapping (as in list_topics), or None if not found
         """
         self._validate_topic_name(topic)
 
-        data = self._parse_file()
-        all_topics = data["quick"] + data["detailed"] + data["archived"]
+        data, index = self._load()
+        location = index.get(topic.lower())
+        if location is None:
+            return None
 
-        for t in all_topics:
-            if t["topic"].lower() == topic.lower():
-                return t
-
-        return None
+        section, position = location
+        return data[section][position]
 
     def remove_topic(self, topic: str) -> bool:
         """
@@ -428,22 +524,19 @@ class ToLearnManager:
         """
         self._validate_topic_name(topic)
 
-        data = self._parse_file()
-
-        # Find and remove from quick or detailed
-        found = None
-        for topic_list in [data["quick"], data["detailed"]]:
-            for i, t in enumerate(topic_list):
-                if t["topic"].lower() == topic.lower():
-                    found = topic_list.pop(i)
-                    break
-            if found:
-                break
+        data, index = self._load()
 
-        if not found:
+        # Find and remove from quick or detailed (the index has the first
+        # match, which is only archived if no active topic matches)
+        location = index.get(topic.lower())
+        if location is None or location[0] == "archived":
             logger.warning(f"Topic '{topic}' not found for archival")
             return False
 
+        data = self._copy_data(data)
+        section, position = location
+        found = data[section].pop(position)
+
         # Add to archive
         found["archived"] = True
         found["completed"] = datetime.now().strftime('%Y-%m-%d')
@@ -473,24 +566,18 @@ class ToLearnManager:
         """
         self._validate_topic_name(topic)
 
-        data = self._parse_file()
+        data, index = self._load()
 
         # Find topic
-        found = None
-        target_list = None
-        for topic_list in [data["quick"], data["detailed"], data["archived"]]:
-            for t in topic_list:
-                if t["topic"].lower() == topic.lower():
-                    found = t
-                    target_list = topic_list
-                    break
-            if found:
-                break
-
-        if not found:
+        location = index.get(topic.lower())
+        if location is None:
             logger.warning(f"Topic '{topic}' not found for update")
             return False
 
+        data = self._copy_data(data)
+        section, position = location
+        found = data[section][position]
+
         # Update fields
         if notes is not None:
             found["notes"] = notes
@@ -498,8 +585,8 @@ class ToLearnManager:
             if not found["detailed"] and notes.strip():
                 found["detailed"] = True
                 # Move from quick to detailed
-                if target_list == data["quick"]:
-                    data["quick"].remove(found)
+                if section == "quick":
+                    del data["quick"][position]
                     data["detailed"].append(found)
 
         if context is not None:
@@ -509,12 +596,18 @@ class ToLearnManager:
         logger.info(f"Updated topic: {topic}")
         return True
 
-    def migrate_from_old_files(self, old_dir: Path) -> Dict[str, Any]:
+    def migrate_from_old_files(
+        self,
+        old_dir: Path,
+        md_files: Optional[List[Path]] = None
+    ) -> Dict[str, Any]:
         """
         Migrate topics from old file-based system.
 
         Args:
             old_dir: Directory containing old topic files
+            md_files: Markdown files in old_dir, if the caller has already
+                listed them (default: scan old_dir)
 
         Returns:
             Migration summary dictionary
@@ -523,42 +616,78 @@ class ToLearnManager:
         if not old_dir.exists() or not old_dir.is_dir():
             raise ValueError(f"Directory not found: {old_dir}")
 
+        if md_files is None:
+            md_files = list(old_dir.glob("*.md"))
+
         migrated = []
         failed = []
 
-        # Read all .md files (except README)
-        for file_path in old_dir.glob("*.md"):
-            if file_path.name.lower() == "readme.md":
-                continue
-
+        # Read all .md files (except README) in one batch before merging,
+        # so file reads aren't interleaved with to_learn.md rewrites.
+        # Reads are I/O-bound, so a thread pool overlaps them.
+        to_read = [p for p in md_files if p.name.lower() != "readme.md"]
+        contents: Dict[Path, str] = {}
+        with ThreadPoolExecutor(max_workers=min(32, len(to_read) or 1)) as executor:
+            pending = [
+                (file_path, executor.submit(file_path.read_text, encoding='utf-8'))
+                for file_path in to_read
+            ]
+
+        for file_path, future in pending:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                contents[file_path] = future.result()
+            except (IOError, OSError) as e:
+                logger.error(f"Failed to read {file_path.name}: {e}")
+                failed.append({"file": file_path.name, "error": str(e)})
 
+        # Add every topic to one parse of to_learn.md and write it once,
+        # with the same checks add_topic applies to each
+        data, index = self._load()
+        seen = set(index)
+        data = self._copy_data(data)
+        added = []
+
+        for file_path, content in contents.items():
+            try:
                 # Use filename (without .md) as topic name
                 topic_name = file_path.stem
+                self._validate_topic_name(topic_name)
+
+                key = topic_name.lower()
+                if key in seen:
+                    raise ValueError(f"Topic '{topic_name}' already exists")
+                seen.add(key)
 
                 # Add as detailed topic with content as notes
-                self.add_topic(
+                self._append_topic(
+                    data,
                     topic=topic_name,
                     context=f"Migrated from {file_path.name}",
                     detailed=True,
                     notes=content.strip()
                 )
-
-                migrated.append(file_path.name)
-                logger.info(f"Migrated: {file_path.name}")
+                added.append(file_path.name)
 
             except Exception as e:
                 logger.error(f"Failed to migrate {file_path.name}: {e}")
                 failed.append({"file": file_path.name, "error": str(e)})
 
+        if added:
+            try:
+                self._write_file(data)
+                migrated.extend(added)
+                for name in added:
+                    logger.info(f"Migrated: {name}")
+            except (IOError, OSError) as e:
+                logger.error(f"Failed to write migrated topics: {e}")
+                failed.extend({"file": name, "error": str(e)} for name in added)
+
         # Create archive directory and move old files
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         archive_dir = self.learnbase_dir / f"to_learn_archived_{timestamp}"
         archive_dir.mkdir(parents=True, exist_ok=True)
 
-        for file_path in old_dir.glob("*.md"):
+        for file_path in md_files:
             try:
                 shutil.move(str(file_path), str(archive_dir / file_path.name))
             except Exception as e:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from mcp.types import TextContent
@@ -172,8 +172,9 @@ def handle_list_due_drills(note_manager: NoteManager, arguments: Any) -> list[Te
         return [TextContent(type="text", text="No drill cards currently due.")]
 
     lines = [f"Found {len(due)} drill card(s) due for review:\n"]
+    today = date.today()
     for d in due:
-        days_until = d.days_until_review()
+        days_until = d.days_until_review(today)
         if days_until < 0:
             status = f"overdue by {-days_until} days"
         elif days_until == 0:
@@ -1,6 +1,7 @@
 """Note CRUD operation handlers."""
 
 import logging
+from datetime import date
 from typing import Any, Literal
 from mcp.types import TextContent
 
@@ -134,24 +135,25 @@ def handle_list_notes(note_manager: NoteManager, arguments: Any) -> list[TextCon
 
     # Determine which notes to fetch
     if needs_verification:
-        notes = note_manager.get_notes_needing_verification(limit=limit)
+        notes = note_manager.get_notes_needing_verification(limit=limit, include_body=False)
         header = "Notes needing verification (no sources)"
     elif low_confidence_threshold is not None:
         notes = note_manager.get_notes_with_low_confidence(
             threshold=low_confidence_threshold,
-            limit=limit
+            limit=limit,
+            include_body=False
         )
         header = f"Notes with confidence < {low_confidence_threshold}"
     elif due_only:
-        notes = note_manager.get_due_notes(limit=limit)
+        notes = note_manager.get_due_notes(limit=limit, include_body=False)
         header = "Notes due for review"
     elif note_type:
-        notes = note_manager.get_all_notes_by_type(note_type=note_type)
+        notes = note_manager.get_all_notes_by_type(note_type=note_type, include_body=False)
         if limit:
             notes = notes[:limit]
         header = f"{note_type.capitalize()} notes"
     else:
-        notes = note_manager.get_all_notes()
+        notes = note_manager.get_all_notes(include_body=False)
         if limit:
             notes = notes[:limit]
         header = "All notes"
@@ -167,9 +169,10 @@ def handle_list_notes(note_manager: NoteManager, arguments: Any) -> list[TextCon
         )]
 
     result = f"## {header}\n\n"
+    today = date.today()
     for note in notes:
         if isinstance(note, ReviewNote):
-            days = note.days_until_review()
+            days = note.days_until_review(today)
             if days < 0:
                 status = f"overdue by {-days} days"
             elif days == 0:
@@ -27,38 +27,40 @@ def handle_save_session_history(note_manager: NoteManager, arguments: Any) -> li
         # Extract question performance data from session
         questions = session_data.get("questions", [])
 
-        # Update note's question_performance if questions exist
-        if questions:
-            # Validate question structure
-            for q in questions:
-                if "question_hash" not in q or "score" not in q:
-                    return [TextContent(
-                        type="text",
-                        text="Error: Each question must have question_hash and score"
-                    )]
-                if not (0.0 <= q["score"] <= 1.0):
-                    return [TextContent(
-                        type="text",
-                        text=f"Error: Score must be between 0.0 and 1.0, got {q['score']}"
-                    )]
-
-            # Bulk update note frontmatter
-            question_scores = [(q["question_hash"], q["score"]) for q in questions]
-            note_manager.bulk_update_question_performance(filename, question_scores)
-
-        # Extract and process priority data
-        priorities_requested = session_data.get("priorities_requested", [])
-        priorities_addressed = session_data.get("priorities_addressed", [])
-
-        # Update priority requests if any exist
-        if priorities_requested or priorities_addressed:
-            session_id = session_data.get("session_id", "unknown")
-            note_manager.update_priority_requests(
-                filename,
-                priorities_requested,
-                priorities_addressed,
-                session_id
-            )
+        # Both updates below rewrite the same note; write it once
+        with note_manager.batched_writes():
+            # Update note's question_performance if questions exist
+            if questions:
+                # Validate question structure
+                for q in questions:
+                    if "question_hash" not in q or "score" not in q:
+                        return [TextContent(
+                            type="text",
+                            text="Error: Each question must have question_hash and score"
+                        )]
+                    if not (0.0 <= q["score"] <= 1.0):
+                        return [TextContent(
+                            type="text",
+                            text=f"Error: Score must be between 0.0 and 1.0, got {q['score']}"
+                        )]
+
+                # Bulk update note frontmatter
+                question_scores = [(q["question_hash"], q["score"]) for q in questions]
+                note_manager.bulk_update_question_performance(filename, question_scores)
+
+            # Extract and process priority data
+            priorities_requested = session_data.get("priorities_requested", [])
+            priorities_addressed = session_data.get("priorities_addressed", [])
+
+            # Update priority requests if any exist
+            if priorities_requested or priorities_addressed:
+                session_id = session_data.get("session_id", "unknown")
+                note_manager.update_priority_requests(
+                    filename,
+                    priorities_requested,
+                    priorities_addressed,
+                    session_id
+                )
 
         # Save to history file (existing behavior)
         note_manager.save_session_history(filename, session_data)
@@ -76,7 +78,7 @@ def handle_save_session_history(note_manager: NoteManager, arguments: Any) -> li
             result += f"- Added {len(priorities_requested)} new priority request(s)\n"
         if priorities_addressed:
             result += f"- Addressed {len(priorities_addressed)} priority topic(s)\n"
-        result += f"- History file: ~/.learnbase/history/{filename.replace('.md', '.json')}"
+        result += f"- History file: ~/.learnbase/history/{filename[:-3]}.jsonl"
 
         return [TextContent(type="text", text=result)]
 
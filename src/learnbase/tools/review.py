@@ -1,7 +1,7 @@
 """Review operation handlers."""
 
 import logging
-from datetime import datetime
+from datetime import date
 from typing import Any
 from mcp.types import TextContent
 
@@ -36,7 +36,8 @@ def handle_get_due_notes(note_manager: NoteManager, arguments: Any) -> list[Text
     notes = note_manager.get_due_notes(
         limit=limit,
         review_mode=review_mode,
-        require_verified=require_verified
+        require_verified=require_verified,
+        include_body=False
     )
 
     if not notes:
@@ -46,11 +47,11 @@ def handle_get_due_notes(note_manager: NoteManager, arguments: Any) -> list[Text
         )]
 
     result = f"Found {len(notes)} note(s) due for review:\n\n"
+    today_ordinal = date.today().toordinal()
     for note in notes:
         # Calculate days since last review
         if note.last_reviewed:
-            days_ago = (datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) -
-                       note.last_reviewed.replace(hour=0, minute=0, second=0, microsecond=0)).days
+            days_ago = today_ordinal - note.last_reviewed.toordinal()
             if days_ago == 0:
                 last_reviewed_text = "today"
             elif days_ago == 1:
@@ -0,0 +1,278 @@
+"""Tests for the FAISS-backed vector store."""
+
+import sys
+import threading
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+faiss = pytest.importorskip("faiss")
+
+from learnbase.core.faiss_store import FaissCollection
+
+
+DIM = 32
+
+
+def fake_embed(documents):
+    """Deterministic bag-of-words embedding: one hashed bucket per word, normalized."""
+    vectors = np.zeros((len(documents), DIM), dtype="float32")
+    for row, document in enumerate(documents):
+        for word in document.lower().split():
+            vectors[row, zlib.crc32(word.encode("utf-8")) % DIM] += 1.0
+        norm = np.linalg.norm(vectors[row])
+        if norm:
+            vectors[row] /= norm
+    return vectors
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return tmp_path / "faiss"
+
+
+@pytest.fixture
+def store(store_dir):
+    return FaissCollection(store_dir, fake_embed)
+
+
+def add_notes(store, notes):
+    """Upsert (filename, text, note_type) tuples."""
+    store.upsert(
+        ids=[filename for filename, _, _ in notes],
+        documents=[text for _, text, _ in notes],
+        metadatas=[{"title": text, "note_type": note_type} for _, text, note_type in notes],
+    )
+
+
+NOTES = [
+    ("gil.md", "python global interpreter lock", "review"),
+    ("tls.md", "transport layer security handshake", "reference"),
+    ("raft.md", "raft consensus leader election", "review"),
+]
+
+
+class TestRoundTrip:
+    def test_upsert_get_and_query(self, store):
+        add_notes(store, NOTES)
+
+        assert store.count() == 3
+        got = store.get(ids=["tls.md", "missing.md"])
+        assert got["ids"] == ["tls.md"]
+        assert got["metadatas"] == [{"title": "transport layer security handshake", "note_type": "reference"}]
+
+        results = store.query(query_texts=["raft consensus leader election"], n_results=2)
+        assert results["ids"][0][0] == "raft.md"
+        assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+        assert len(results["ids"][0]) == 2
+
+    def test_query_on_empty_store(self, store):
+        results = store.query(query_texts=["anything", "else"], n_results=3)
+        assert results == {"ids": [[], []], "metadatas": [[], []], "distances": [[], []]}
+
+    def test_where_filter(self, store):
+        add_notes(store, NOTES)
+
+        results = store.query(
+            query_texts=["transport layer security handshake"], n_results=5,
+            where={"note_type": "review"},
+        )
+
+        assert sorted(results["ids"][0]) == ["gil.md", "raft.md"]
+        assert all(m["note_type"] == "review" for m in results["metadatas"][0])
+
+    def test_update_replaces_metadata_only(self, store):
+        add_notes(store, NOTES)
+
+        store.update(ids=["gil.md", "missing.md"], metadatas=[{"note_type": "evergreen"}] * 2)
+
+        assert store.get(ids=["gil.md"])["metadatas"] == [{"note_type": "evergreen"}]
+        assert store.count() == 3
+        results = store.query(query_texts=["python global interpreter lock"], n_results=1)
+        assert results["ids"][0] == ["gil.md"]
+
+    def test_delete_then_reupsert_same_id(self, store):
+        add_notes(store, NOTES)
+
+        store.delete(ids=["gil.md"])
+        assert store.count() == 2
+        assert store.get(ids=["gil.md"])["ids"] == []
+        results = store.query(query_texts=["python global interpreter lock"], n_results=3)
+        assert "gil.md" not in results["ids"][0]
+
+        add_notes(store, [("gil.md", "python asyncio event loop", "review")])
+        assert store.count() == 3
+        results = store.query(query_texts=["python asyncio event loop"], n_results=1)
+        assert results["ids"][0] == ["gil.md"]
+        assert results["metadatas"][0][0]["title"] == "python asyncio event loop"
+
+    def test_upsert_replaces_existing_vector(self, store):
+        add_notes(store, NOTES)
+        add_notes(store, [("tls.md", "raft consensus leader election", "reference")])
+
+        assert store.count() == 3
+        results = store.query(query_texts=["transport layer security handshake"], n_results=3)
+        assert results["distances"][0][0] > 1e-3
+
+
+class TestPersistence:
+    def test_reload_from_disk_after_flush(self, store, store_dir):
+        add_notes(store, NOTES)
+        store.delete(ids=["tls.md"])
+        store.flush()
+
+        reopened = FaissCollection(store_dir, fake_embed)
+
+        assert reopened.count() == 2
+        assert reopened.get(ids=["gil.md"])["metadatas"] == store.get(ids=["gil.md"])["metadatas"]
+        results = reopened.query(query_texts=["raft consensus leader election"], n_results=1)
+        assert results["ids"][0] == ["raft.md"]
+
+        # New ids continue after the reloaded ones
+        add_notes(reopened, [("tls.md", "transport layer security handshake", "reference")])
+        results = reopened.query(query_texts=["transport layer security handshake"], n_results=1)
+        assert results["ids"][0] == ["tls.md"]
+
+    def test_writes_are_deferred_until_flush(self, store, store_dir, monkeypatch):
+        saves = []
+        save = store._save
+        monkeypatch.setattr(store, "_save", lambda: (saves.append(1), save()))
+
+        for filename, text, note_type in NOTES:
+            add_notes(store, [(filename, text, note_type)])
+        store.update(ids=["gil.md"], metadatas=[{"note_type": "review"}])
+        store.delete(ids=["raft.md"])
+
+        assert saves == []
+        assert FaissCollection(store_dir, fake_embed).count() == 0
+
+        store.flush()
+        store.flush()
+        assert saves == [1]
+        assert FaissCollection(store_dir, fake_embed).count() == 2
+
+    def test_reset_removes_files(self, store, store_dir):
+        add_notes(store, NOTES)
+        store.flush()
+
+        store.reset()
+
+        assert store.count() == 0
+        assert FaissCollection(store_dir, fake_embed).count() == 0
+
+
+def random_embed(documents):
+    """Seeded random unit vector per document, so many documents stay distinguishable."""
+    vectors = np.stack([
+        np.random.default_rng(zlib.crc32(d.encode("utf-8"))).standard_normal(DIM)
+        for d in documents
+    ]).astype("float32")
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def add_many(store, start, stop):
+    ids = [f"note-{i}.md" for i in range(start, stop)]
+    store.upsert(ids=ids, documents=[f"doc {i}" for i in range(start, stop)],
+                 metadatas=[{"n": i} for i in range(start, stop)])
+
+
+def inner_index(store):
+    return faiss.downcast_index(store._index.index)
+
+
+class TestQuantization:
+    THRESHOLD = FaissCollection.QUANTIZE_MIN_VECTORS
+
+    def test_switches_to_int8_at_threshold(self, store_dir):
+        store = FaissCollection(store_dir, random_embed)
+
+        add_many(store, 0, self.THRESHOLD - 1)
+        assert isinstance(inner_index(store), faiss.IndexFlatIP)
+
+        add_many(store, self.THRESHOLD - 1, self.THRESHOLD)
+        assert isinstance(inner_index(store), faiss.IndexScalarQuantizer)
+        assert store._index.ntotal == self.THRESHOLD
+
+    def test_ids_and_metadata_survive_rebuild(self, store_dir):
+        store = FaissCollection(store_dir, random_embed)
+        add_many(store, 0, self.THRESHOLD + 10)
+        store.delete(ids=["note-3.md"])
+
+        assert store.count() == self.THRESHOLD + 9
+        assert store.get(ids=["note-7.md"])["metadatas"] == [{"n": 7}]
+        for i in (0, 7, self.THRESHOLD - 1, self.THRESHOLD + 9):
+            results = store.query(query_texts=[f"doc {i}"], n_results=1)
+            assert results["ids"][0] == [f"note-{i}.md"]
+            assert results["metadatas"][0] == [{"n": i}]
+        results = store.query(query_texts=["doc 3"], n_results=5)
+        assert "note-3.md" not in results["ids"][0]
+
+        # Later writes go into the quantized index
+        add_many(store, 3, 4)
+        assert store.query(query_texts=["doc 3"], n_results=1)["ids"][0] == ["note-3.md"]
+
+    def test_quantized_index_reloads(self, store_dir):
+        store = FaissCollection(store_dir, random_embed)
+        add_many(store, 0, self.THRESHOLD)
+        store.flush()
+
+        reopened = FaissCollection(store_dir, random_embed)
+
+        assert isinstance(inner_index(reopened), faiss.IndexScalarQuantizer)
+        assert reopened.query(query_texts=["doc 42"], n_results=1)["ids"][0] == ["note-42.md"]
+
+    def test_exact_precision_keeps_flat_index(self, store_dir):
+        store = FaissCollection(store_dir, random_embed, exact_precision=True)
+        add_many(store, 0, self.THRESHOLD * 2)
+
+        assert isinstance(inner_index(store), faiss.IndexFlatIP)
+        results = store.query(query_texts=["doc 300"], n_results=1)
+        assert results["ids"][0] == ["note-300.md"]
+        assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+
+
+class TestConcurrency:
+    @pytest.fixture(autouse=True)
+    def frequent_thread_switches(self):
+        """Switch threads far more often than the default, to expose races."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(interval)
+
+    def test_queries_during_concurrent_writes(self, store_dir):
+        """Test that queries stay consistent while another thread replaces notes."""
+        store = FaissCollection(store_dir, random_embed)
+        add_many(store, 0, 200)
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            try:
+                for i in range(3000):
+                    # Replace one note at a time, and grow past the
+                    # quantization threshold so the index is swapped mid-run
+                    store.delete(ids=[f"note-{i % 200}.md"])
+                    add_many(store, i % 200, i % 200 + 1)
+                    if i % 20 == 0:
+                        add_many(store, 200 + i // 20, 201 + i // 20)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            while not done.is_set():
+                results = store.query(query_texts=["doc 5"], n_results=3, where={"n": {"$gte": 0}})
+                assert len(results["ids"][0]) == len(results["metadatas"][0]) == 3
+                store.get()
+        finally:
+            thread.join()
+
+        assert errors == []
+        assert store.count() == 350
+        assert isinstance(inner_index(store), faiss.IndexScalarQuantizer)
+        assert store.query(query_texts=["doc 5"], n_results=1)["ids"][0] == ["note-5.md"]
@@ -56,6 +56,13 @@ class TestLadderProgression:
         # allow ~1 second of drift for the datetime.now() calls
         assert abs((next_date - expected).total_seconds()) < 2
 
+    def test_next_review_date_uses_given_now(self):
+        now = datetime(2026, 5, 1, 18, 30)
+        _, interval, next_date, _ = calculate_ladder_review(
+            passed=True, current_step=2, fail_streak=0, now=now
+        )
+        assert next_date == now + timedelta(days=interval)
+
     def test_fail_streak_crosses_rewrite_threshold(self):
         # simulate three consecutive fails starting from step 3
         step, fs = 3, 0
@@ -1,10 +1,11 @@
 """Tests for creating both ReviewNote and ReferenceNote types."""
 
+import os
 import pytest
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from learnbase.core.note_manager import NoteManager
-from learnbase.core.models import ReviewNote, ReferenceNote
+from learnbase.core.models import Note, ReviewNote, ReferenceNote
 
 
 @pytest.fixture
@@ -187,6 +188,17 @@ class TestValidation:
                 review_mode="invalid"
             )
 
+    def test_overlong_filename_rejected(self, nm):
+        """Test that names beyond the filesystem limit fail validation, not the OS call."""
+        with pytest.raises(ValueError, match="cannot exceed 255"):
+            nm.get_note("a" * 253 + ".md")
+
+    @pytest.mark.parametrize("filename", ["../escape.md", "sub/note.md", "sub\\note.md", "nul\x00.md"])
+    def test_filename_with_separator_rejected(self, nm, filename):
+        """Test that path separators are rejected on every platform."""
+        with pytest.raises(ValueError, match="directory separators"):
+            nm.get_note(filename)
+
 
 class TestNoteOperations:
     """Test that both note types work with existing operations."""
@@ -260,6 +272,30 @@ class TestNoteOperations:
         assert len(due_notes) == 1
         assert all(isinstance(n, ReviewNote) for n in due_notes)
 
+    def test_bulk_question_scores_apply_ema_in_order(self, nm):
+        """Test that bulk updates seed new questions and average repeats."""
+        filename = nm.create_note("Review", "Content", note_type="review")
+        nm.bulk_update_question_performance(filename, [("q1", 1.0), ("q2", 0.5), ("q1", 0.0)])
+
+        performance = nm.get_note(filename).question_performance
+        assert performance["q2"] == 0.5
+        assert performance["q1"] == pytest.approx(0.3)
+
+    def test_save_replaces_file_without_leftovers(self, nm, temp_notes_dir):
+        """Test that saving swaps in the new content and leaves no temp files."""
+        filename = nm.create_note("Atomic", "Old body")
+        nm.update_note_content(filename, "Atomic", "New body")
+
+        assert nm.get_note(filename).body == "New body"
+        assert sorted(p.name for p in temp_notes_dir.iterdir()) == ["README.md", filename]
+
+    def test_create_filename_strips_special_characters(self):
+        """Test that filenames keep only alphanumerics, joined by hyphens."""
+        assert Note.create_filename("Python's GIL: a (quick) look!") == "pythons-gil-a-quick-look.md"
+        assert Note.create_filename("snake_case  and\ttabs") == "snakecase-and-tabs.md"
+        assert Note.create_filename("Über café") == "über-café.md"
+        assert Note.create_filename("x" * 80) == "x" * 50 + ".md"
+
 
 class TestRoundtrip:
     """Test serialization and deserialization."""
@@ -292,3 +328,464 @@ class TestRoundtrip:
         assert isinstance(note, ReviewNote)
         assert note.title == "Python Concepts"
         assert note.review_mode == "spaced"
+
+    def test_body_with_horizontal_rule_roundtrip(self, nm):
+        """Test a '---' rule in the body is not mistaken for the frontmatter fence."""
+        body = "Above the rule\n\n---\n\nBelow the rule"
+        filename = nm.create_note(title="Rule Note", body=body)
+
+        note = nm.get_note(filename)
+        assert note.title == "Rule Note"
+        assert note.body == body
+
+    def test_file_without_frontmatter_loads_as_review(self, temp_notes_dir):
+        """Test a plain markdown file loads with defaults and its full text as body."""
+        filepath = temp_notes_dir / "plain-note.md"
+        filepath.write_text("# Plain\n\nNo frontmatter here.\n")
+
+        note = Note.from_markdown_file(filepath)
+        assert isinstance(note, ReviewNote)
+        assert note.title == "Plain Note"
+        assert note.body == "# Plain\n\nNo frontmatter here."
+
+    def test_serialization_reflects_in_place_mutation(self, nm):
+        """Test that repeated serialization picks up nested list/dict changes."""
+        filename = nm.create_note(title="Cached", body="Content")
+        note = nm.get_note(filename)
+
+        first = note.to_markdown_file()
+        assert note.to_markdown_file() == first
+
+        note.sources.append({"url": "https://example.com"})
+        note.question_performance["abc"] = 0.5
+        second = note.to_markdown_file()
+        assert "https://example.com" in second
+        assert "abc: 0.5" in second
+
+        note.body = "Changed"
+        assert note.to_markdown_file().endswith("\n\nChanged")
+
+    def test_embedding_document_tracks_title_and_body(self, nm):
+        """Test that the embedding text is reused until title or body change."""
+        note = nm.get_note(nm.create_note(title="Embed", body="Text"))
+
+        document = note.embedding_document()
+        assert document == "Embed\n\nText"
+        assert note.embedding_document() is document
+
+        note.title = "Renamed"
+        assert note.embedding_document() == "Renamed\n\nText"
+
+    def test_chunks_match_markdown_and_reuse_body(self, nm):
+        """Test that save chunks equal the markdown and keep the body encoding."""
+        filename = nm.create_note(title="Chunks", body="Körper ✓")
+        note = nm.get_note(filename)
+
+        header, body = note.to_markdown_chunks()
+        assert header + body == note.to_markdown_file().encode("utf-8")
+
+        note.review_count += 1
+        new_header, same_body = note.to_markdown_chunks()
+        assert same_body is body
+        assert b"review_count: 1" in new_header
+
+        note.body = "Changed"
+        assert note.to_markdown_chunks()[1] == b"Changed"
+
+    def test_header_only_load_matches_full_load(self, nm):
+        """Test that include_body=False keeps metadata and skips the body."""
+        filename = nm.create_note(title="Header Only", body="Body\n\n---\n\nmore")
+        full = nm.get_note(filename)
+        header = Note.from_markdown_file(nm.notes_dir / filename, include_body=False)
+
+        assert header.body == ""
+        assert header.title == full.title
+        assert header.next_review == full.next_review
+        assert header.review_mode == full.review_mode
+        # A fresh manager has no cached full note to hand back
+        cold = NoteManager(nm.notes_dir)
+        assert [n.body for n in cold.get_all_notes(include_body=False)] == [""]
+
+    def test_tricky_metadata_values_roundtrip(self, nm):
+        """Test that YAML-significant titles and nested values survive a save/load."""
+        titles = ["yes", "Note: with colon", "It's # not a comment", "2026-01-01", "  padded "]
+        for title in titles:
+            filename = nm.create_note(title=title, body="Content")
+            note = nm.get_note(filename)
+            note.sources.append({"url": "https://example.com/ü", "note": "line one\nline two"})
+            note.question_performance["q1"] = 1e-05
+            nm._save_note(note, nm.notes_dir / filename)
+
+            loaded = nm.get_note(filename)
+            assert loaded.title == title
+            assert loaded.sources == note.sources
+            assert loaded.question_performance == {"q1": 1e-05}
+
+
+class TestDaysUntilReview:
+    """Test calendar-day countdown to the next review."""
+
+    def test_counts_calendar_days_not_elapsed_time(self, nm):
+        """Test that a review early tomorrow is one day away, even late tonight."""
+        from datetime import date, timedelta
+
+        filename = nm.create_note("Countdown", "Content")
+        note = nm.get_note(filename)
+        today = date(2026, 3, 10)
+
+        note.next_review = datetime(2026, 3, 11, 0, 30)
+        assert note.days_until_review(today) == 1
+
+        note.next_review = datetime(2026, 3, 10, 23, 59)
+        assert note.days_until_review(today) == 0
+
+        note.next_review = datetime(2026, 3, 7, 9, 0)
+        assert note.days_until_review(today) == -3
+
+        note.next_review = datetime.now() + timedelta(days=2)
+        assert note.days_until_review() == 2
+
+
+class TestNoteMemoryLayout:
+    """Test that note models stay slotted."""
+
+    def test_notes_have_no_instance_dict(self, nm):
+        """Test that loaded notes of every type carry no per-instance __dict__."""
+        nm.create_note("Review", "Content", note_type="review")
+        nm.create_note("Reference", "Content", note_type="reference")
+        nm.create_note("Evergreen", "Content", note_type="evergreen")
+        nm.create_drill_note("Drill", "Prompt", "echo hi", "bash")
+
+        notes = nm.get_all_notes()
+        assert len(notes) == 4
+        for note in notes:
+            assert not hasattr(note, "__dict__"), type(note).__name__
+
+
+class TestFormatFull:
+    """Test the full-detail rendering of review notes."""
+
+    def test_renders_header_fields_and_body(self, nm):
+        """Test that every header line is rendered before the body."""
+        filename = nm.create_note("Layout", "Body text")
+        note = nm.get_note(filename)
+        note.created_at = datetime(2026, 1, 2, 8, 0)
+        note.next_review = datetime(2026, 1, 5, 8, 0)
+        note.ease_factor = 2.5
+
+        assert note.format_full() == (
+            "# Layout\n\n"
+            f"**File**: {filename}\n"
+            f"**Mode**: {note.review_mode}\n"
+            "**Created**: 2026-01-02\n"
+            "**Last reviewed**: Never\n"
+            "**Next review**: 2026-01-05\n"
+            f"**Interval**: {note.interval_days} days\n"
+            "**Ease factor**: 2.50\n"
+            "**Review count**: 0\n\n"
+            "---\n\n"
+            "Body text"
+        )
+
+        note.last_reviewed = datetime(2026, 1, 3, 21, 15)
+        assert "**Last reviewed**: 2026-01-03\n" in note.format_full()
+
+
+class TestNoteCache:
+    """Test that get_all_notes reuses parsed notes until their files change."""
+
+    def test_unchanged_files_are_not_reparsed(self, nm, monkeypatch):
+        """Test that a second listing is served from the cache."""
+        nm.create_note("Cached", "Content")
+        first = nm.get_all_notes()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("note file was parsed again")
+
+        monkeypatch.setattr(Note, "from_markdown_file", fail)
+        second = nm.get_all_notes()
+        assert [(n.filename, n.title) for n in second] == [(n.filename, n.title) for n in first]
+
+    def test_mutating_listed_note_leaves_cache_alone(self, nm):
+        """Test that changes to a returned note do not leak into later reads."""
+        filename = nm.create_note("Cached", "Content")
+        note = nm.get_note(filename)
+        note.sources = [{"url": "https://a"}]
+        nm._save_note(note, nm.notes_dir / filename)
+
+        listed = nm.get_all_notes()[0]
+        listed.title = "Changed"
+        listed.sources[0]["url"] = "https://changed"
+        listed.sources.append({"url": "https://b"})
+        next(nm.iter_all_notes()).sources.clear()
+
+        fresh = nm.get_note(filename)
+        assert fresh.title == "Cached"
+        assert fresh.sources == [{"url": "https://a"}]
+        assert nm.get_all_notes()[0].sources == [{"url": "https://a"}]
+
+    def test_saved_note_is_copied_into_cache(self, nm):
+        """Test that the caller's note object is not the one cached on save."""
+        filename = nm.create_note("Cached", "Content")
+        note = nm.get_note(filename)
+        nm._save_note(note, nm.notes_dir / filename)
+
+        note.sources.append({"url": "https://later"})
+        assert nm.get_all_notes()[0].sources == []
+
+    def test_saved_note_is_served_without_reparse(self, nm, monkeypatch):
+        """Test that listings after a save reuse the note that was written."""
+        filename = nm.create_note("Cached", "Content")
+        nm.update_note_content(filename, "Renamed", "New content")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("note file was parsed again")
+
+        monkeypatch.setattr(Note, "from_markdown_file", fail)
+        assert [(n.title, n.body) for n in nm.get_all_notes()] == [("Renamed", "New content")]
+
+    def test_many_cold_files_load_in_parallel(self, nm):
+        """Test that a large cold load returns every note, same as serial."""
+        with nm.batch():
+            for i in range(40):
+                nm.create_note(f"Bulk {i}", "Content")
+        (nm.notes_dir / "broken.md").write_text("---\ntitle: [unclosed\n---\nBody")
+
+        fresh = NoteManager(nm.notes_dir)
+        titles = [n.title for n in fresh.get_all_notes()]
+        assert sorted(titles) == sorted(f"Bulk {i}" for i in range(40))
+        assert [n.title for n in fresh.get_all_notes()] == titles
+
+    def test_writes_and_external_edits_are_picked_up(self, nm, temp_notes_dir):
+        """Test that saves, outside edits and deletions invalidate the cache."""
+        filename = nm.create_note("Cached", "Content")
+        nm.get_all_notes()
+
+        nm.update_note_content(filename, "Renamed", "Content")
+        assert nm.get_all_notes()[0].title == "Renamed"
+
+        path = temp_notes_dir / filename
+        path.write_text(path.read_text().replace("Renamed", "Edited outside"))
+        assert nm.get_all_notes()[0].title == "Edited outside"
+
+        path.unlink()
+        assert nm.get_all_notes() == []
+
+    def test_iter_all_notes_streams_without_caching(self, nm):
+        """Test that iter_all_notes yields full notes and leaves the cache alone."""
+        filenames = {nm.create_note(f"Stream {i}", f"Body {i}") for i in range(3)}
+        nm._note_cache.clear()
+
+        notes = list(nm.iter_all_notes())
+
+        assert {n.filename for n in notes} == filenames
+        assert all(n.body.startswith("Body") for n in notes)
+        assert nm._note_cache == {}
+
+    def test_directory_named_like_note_is_skipped(self, nm, caplog):
+        """Test that a directory ending in .md is not loaded as a note."""
+        nm.create_note("Real", "Content")
+        (nm.notes_dir / "folder.md").mkdir()
+
+        notes = nm.get_all_notes()
+
+        assert [n.filename for n in notes] == ["real.md"]
+        assert "folder.md" not in caplog.text
+
+
+class TestReadmeBatch:
+    """Test deferring README rebuilds across several mutations."""
+
+    def test_batch_rebuilds_readme_once_on_exit(self, nm, monkeypatch):
+        """Test that mutations inside batch() trigger a single README rebuild."""
+        calls = []
+        rebuild = nm.update_readme_index
+        monkeypatch.setattr(nm, "update_readme_index", lambda: (calls.append(1), rebuild()))
+
+        with nm.batch():
+            with nm.batch():
+                first = nm.create_note("First", "Content")
+            nm.create_note("Second", "Content")
+            nm.delete_note(first)
+            assert calls == []
+
+        assert calls == [1]
+        readme = nm.readme_path.read_text()
+        assert "second.md" in readme
+        assert "first.md" not in readme
+
+    def test_bulk_question_update_leaves_readme_alone(self, nm, monkeypatch):
+        """Test that question score updates neither rebuild nor dirty the README."""
+        filename = nm.create_note("Scores", "Content")
+        monkeypatch.setattr(nm, "update_readme_index", lambda: pytest.fail("README rebuilt"))
+
+        with nm.batch():
+            nm.bulk_update_question_performance(filename, [("q1", 1.0)])
+            assert not nm._readme_dirty
+
+    def test_lazy_readme_waits_for_flush(self, nm, monkeypatch):
+        """Test that a lazy manager rebuilds the README only on flush()."""
+        registered = []
+        monkeypatch.setattr("atexit.register", registered.append)
+        lazy = NoteManager(nm.notes_dir, lazy_readme=True)
+        assert registered == [lazy.flush]
+
+        lazy.create_note("Deferred", "Content")
+        assert "deferred.md" not in lazy.readme_path.read_text()
+
+        lazy.flush()
+        assert "deferred.md" in lazy.readme_path.read_text()
+
+    def test_batched_writes_save_each_note_once(self, nm, monkeypatch):
+        """Test that batched updates to one note are written once, in full."""
+        filename = nm.create_note("Batched", "Content")
+        writes = []
+        write_note = nm._write_note
+
+        def counting_write(note, path):
+            writes.append(path.name)
+            write_note(note, path)
+
+        monkeypatch.setattr(nm, "_write_note", counting_write)
+
+        with nm.batched_writes():
+            nm.bulk_update_question_performance(filename, [("q1", 1.0)])
+            nm.update_priority_requests(filename, [{"topic": "GIL"}], [], "s1")
+            assert writes == []
+
+        assert writes == [filename]
+        note = nm.get_note(filename)
+        assert "q1" in note.question_performance
+        assert note.priority_requests[0]["topic"] == "GIL"
+
+    def test_batched_writes_keep_going_after_a_failed_note(self, nm, monkeypatch):
+        """Test that one failing write is reported without losing the other notes."""
+        filenames = [nm.create_note(f"Batched {i}", "Content") for i in range(3)]
+        write_note = nm._write_note
+
+        def failing_write(note, path):
+            if path.name == filenames[1]:
+                raise IOError(f"Failed to save note {path.name}: disk full")
+            write_note(note, path)
+
+        monkeypatch.setattr(nm, "_write_note", failing_write)
+
+        with pytest.raises(IOError, match=f"1 of 3 batched notes: {filenames[1]}"):
+            with nm.batched_writes():
+                for filename in filenames:
+                    nm.update_note_content(filename, "Updated", f"New {filename}")
+
+        assert nm._pending_notes is None
+        assert nm.get_note(filenames[0]).body == f"New {filenames[0]}"
+        assert nm.get_note(filenames[1]).body == "Content"
+        assert nm.get_note(filenames[2]).body == f"New {filenames[2]}"
+
+
+class TestLimitedQueries:
+    """Test that limited queries return the first notes in sort order."""
+
+    def test_due_notes_limit_keeps_earliest(self, nm):
+        """Test that a limit picks the most overdue notes, oldest first."""
+        filenames = [nm.create_note(f"Due {i}", "Content") for i in range(5)]
+        for days, filename in zip((3, 9, 1, 7, 5), filenames):
+            note = nm.get_note(filename)
+            note.next_review = datetime(2026, 1, 1) + timedelta(days=days)
+            nm._save_note(note, nm.notes_dir / filename)
+
+        due = nm.get_due_notes(limit=3)
+        assert [n.next_review.day for n in due] == [2, 4, 6]
+        assert len(nm.get_due_notes()) == 5
+
+
+class TestSessionHistory:
+    """Test the append-only session history log."""
+
+    def test_sessions_append_and_legacy_file_is_migrated(self, nm, tmp_path):
+        """Test that old .json history is kept and later sessions are appended."""
+        import json
+
+        nm.history_dir = tmp_path / "history"
+        nm.history_dir.mkdir()
+        legacy = nm.history_dir / "note.json"
+        legacy.write_text(json.dumps({"note_filename": "note.md", "sessions": [{"id": 1}]}))
+
+        nm.save_session_history("note.md", {"id": 2, "summary": "line\nbreak"})
+        nm.save_session_history("note.md", {"id": 3})
+
+        assert not legacy.exists()
+        assert len((nm.history_dir / "note.jsonl").read_text().splitlines()) == 3
+        history = nm.load_history("note.md")
+        assert history["note_filename"] == "note.md"
+        assert history["sessions"] == [{"id": 1}, {"id": 2, "summary": "line\nbreak"}, {"id": 3}]
+
+
+class TestReadmeChangeDetection:
+    """Test that the README is only rewritten when its index changes."""
+
+    def test_unchanged_index_is_not_rewritten(self, nm):
+        """Test that a rebuild with nothing new keeps the README untouched."""
+        nm.create_note("Stable", "Content")
+        readme = nm.readme_path.read_text()
+        stale = readme.replace(readme.split("Last updated: ")[1].split("\n")[0], "2000-01-01 00:00:00")
+        nm.readme_path.write_text(stale)
+        nm._readme_digest = None
+
+        nm.update_readme_index()
+        assert nm.readme_path.read_text() == stale
+
+        nm.create_note("Another", "Content")
+        assert "another.md" in nm.readme_path.read_text()
+        assert "2000-01-01 00:00:00" not in nm.readme_path.read_text()
+
+        nm.readme_path.unlink()
+        nm.update_readme_index()
+        assert nm.readme_path.exists()
+
+
+class TestAtomicWrites:
+    """Test the temp-file-and-rename note writer."""
+
+    def test_existing_file_mode_is_preserved(self, nm):
+        """Test that rewriting a note keeps its permission bits."""
+        filename = nm.create_note("Private", "Content")
+        filepath = nm.notes_dir / filename
+        filepath.chmod(0o600)
+
+        nm.update_note_content(filename, "Private", "New content")
+
+        assert filepath.stat().st_mode & 0o777 == 0o600
+        assert "New content" in filepath.read_text()
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_new_file_mode_follows_current_umask(self, nm, monkeypatch):
+        """Test that new notes get the umask in effect when written, not at import."""
+        previous = os.umask(0o077)
+        try:
+            # The writer must never touch the process-wide umask itself
+            with monkeypatch.context() as m:
+                m.setattr(os, "umask", lambda mask: pytest.fail("umask changed"))
+                filename = nm.create_note("Umask", "Content")
+        finally:
+            os.umask(previous)
+
+        assert (nm.notes_dir / filename).stat().st_mode & 0o777 == 0o600
+
+    def test_no_temp_files_left_behind(self, nm):
+        """Test that saves leave only the note files in the directory."""
+        filename = nm.create_note("Tidy", "Content")
+        nm.update_note_content(filename, "Tidy", "New content")
+
+        assert sorted(p.name for p in nm.notes_dir.iterdir()) == ["README.md", filename]
+
+    def test_stale_temp_files_are_removed_on_startup(self, temp_notes_dir):
+        """Test that temp files from a crashed write are cleaned up, recent ones kept."""
+        stale = temp_notes_dir / ".note.md.abc123.tmp"
+        recent = temp_notes_dir / ".note.md.def456.tmp"
+        stale.write_text("partial")
+        recent.write_text("partial")
+        os.utime(stale, (0, 0))
+
+        NoteManager(temp_notes_dir)
+
+        assert not stale.exists()
+        assert recent.exists()
@@ -0,0 +1,384 @@
+"""Tests for RAGManager that run without a vector store installed."""
+
+import atexit
+import gc
+import json
+import sys
+import threading
+import types
+import weakref
+from concurrent.futures import Future
+
+import pytest
+
+from learnbase.core import rag_manager as rag_module
+from learnbase.core.note_manager import NoteManager
+from learnbase.core.rag_manager import RAGManager
+
+
+@pytest.fixture
+def nm(tmp_path):
+    """Create a NoteManager on a temporary notes directory."""
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    return NoteManager(notes_dir)
+
+
+@pytest.fixture
+def make_rag(nm, tmp_path, monkeypatch):
+    """Build RAGManagers that skip opening a real store."""
+    monkeypatch.setattr(rag_module, "CHROMADB_AVAILABLE", False)
+    managers = []
+
+    def make(**kwargs):
+        rag = RAGManager(nm, vector_db_dir=tmp_path / "vector_db", **kwargs)
+        managers.append(rag)
+        return rag
+
+    yield make
+    for rag in managers:
+        rag.shutdown()
+
+
+class StubCollection:
+    """In-memory stand-in for a Chroma collection."""
+
+    def __init__(self):
+        self.records = {}
+        self.writes = []
+
+    def count(self):
+        return len(self.records)
+
+    def get(self, ids=None, include=None):
+        ids = list(self.records) if ids is None else [i for i in ids if i in self.records]
+        return {"ids": ids, "metadatas": [self.records[i][1] for i in ids]}
+
+    def upsert(self, ids, documents, metadatas):
+        self.writes.append(("upsert", threading.current_thread().name, list(ids)))
+        for i, document, metadata in zip(ids, documents, metadatas):
+            self.records[i] = (document, metadata)
+
+    def update(self, ids, metadatas):
+        self.writes.append(("update", threading.current_thread().name, list(ids)))
+        for i, metadata in zip(ids, metadatas):
+            self.records[i] = (self.records[i][0], metadata)
+
+    def delete(self, ids):
+        self.writes.append(("delete", threading.current_thread().name, list(ids)))
+        for i in ids:
+            self.records.pop(i, None)
+
+    def reset(self):
+        self.records.clear()
+
+    def query(self, query_texts, n_results=10, where=None):
+        ids = list(self.records)[:n_results]
+        return {
+            "ids": [ids],
+            "metadatas": [[self.records[i][1] for i in ids]],
+            "distances": [[0.0] * len(ids)],
+        }
+
+    def flush(self):
+        self.writes.append(("flush", threading.current_thread().name, []))
+
+
+@pytest.fixture
+def stub_rag(make_rag):
+    """A RAGManager writing to a StubCollection."""
+    rag = make_rag(backend="faiss")
+    rag.collection = StubCollection()
+    rag._available = True
+    return rag
+
+
+@pytest.fixture
+def fake_embedding_functions(monkeypatch):
+    """Install a stand-in chromadb.utils.embedding_functions and count constructions."""
+    created = []
+
+    class FakeEmbeddingFunction:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            created.append(self)
+
+    embedding_functions = types.SimpleNamespace(
+        SentenceTransformerEmbeddingFunction=FakeEmbeddingFunction,
+        OpenAIEmbeddingFunction=FakeEmbeddingFunction,
+    )
+    utils = types.ModuleType("chromadb.utils")
+    utils.embedding_functions = embedding_functions
+    chromadb = types.ModuleType("chromadb")
+    chromadb.utils = utils
+
+    monkeypatch.setitem(sys.modules, "chromadb", chromadb)
+    monkeypatch.setitem(sys.modules, "chromadb.utils", utils)
+    monkeypatch.setattr(rag_module, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(rag_module, "_EMBED_FN_CACHE", {})
+    return created
+
+
+class TestEmbeddingFunctionCache:
+    """Test that embedding functions are built once per (provider, model)."""
+
+    def test_sentence_transformers_function_is_shared(self, make_rag, fake_embedding_functions):
+        """Test that two managers on the same model share one function."""
+        first = make_rag()._create_sentence_transformer_embedding_function()
+        second = make_rag()._create_sentence_transformer_embedding_function()
+        other = make_rag(embedding_model="other-model")._create_sentence_transformer_embedding_function()
+
+        assert first is second
+        assert other is not first
+        assert len(fake_embedding_functions) == 2
+        assert first.kwargs["model_name"] == RAGManager.DEFAULT_EMBEDDING_MODEL
+
+    def test_openai_function_is_shared(self, make_rag, fake_embedding_functions, monkeypatch):
+        """Test that the OpenAI function is cached separately from sentence-transformers."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        first = make_rag(embedding_provider="openai")._create_openai_embedding_function()
+        second = make_rag(embedding_provider="openai")._create_openai_embedding_function()
+        local = make_rag()._create_sentence_transformer_embedding_function()
+
+        assert first is second
+        assert local is not first
+        assert len(fake_embedding_functions) == 2
+
+
+class TestSentenceTransformerDevice:
+    """Test the device chosen for sentence-transformers."""
+
+    def test_falls_back_to_cpu_without_torch(self, monkeypatch):
+        """Test that a missing torch means CPU."""
+        monkeypatch.setitem(sys.modules, "torch", None)
+        assert rag_module._sentence_transformer_device() == "cpu"
+
+    @pytest.mark.parametrize("cuda, expected", [(True, "cuda"), (False, "cpu")])
+    def test_uses_cuda_when_torch_sees_a_gpu(self, monkeypatch, cuda, expected):
+        """Test that CUDA is picked only when torch reports it."""
+        torch = types.ModuleType("torch")
+        torch.cuda = types.SimpleNamespace(is_available=lambda: cuda)
+        monkeypatch.setitem(sys.modules, "torch", torch)
+        assert rag_module._sentence_transformer_device() == expected
+
+    def test_device_is_passed_to_embedding_function(self, make_rag, fake_embedding_functions, monkeypatch):
+        """Test that the chosen device reaches the sentence-transformers function."""
+        monkeypatch.setitem(sys.modules, "torch", None)
+        function = make_rag()._create_sentence_transformer_embedding_function()
+        assert function.kwargs["device"] == "cpu"
+
+
+class TestBackgroundIndexing:
+    """Test that index writes run on the worker and notes are read on the caller."""
+
+    def test_index_note_async_returns_future(self, stub_rag, nm):
+        """Test that the async variant queues the write and resolves to True."""
+        filename = nm.create_note("Async", "Content")
+
+        future = stub_rag.index_note_async(filename)
+
+        assert isinstance(future, Future)
+        assert future.result() is True
+        assert filename in stub_rag.collection.records
+        assert stub_rag.collection.writes[0][1].startswith("rag-index")
+
+    def test_index_note_is_synchronous(self, stub_rag, nm):
+        """Test that index_note returns a bool once the write is done."""
+        filename = nm.create_note("Sync", "Content")
+
+        assert stub_rag.index_note(filename) is True
+        assert stub_rag.collection.count() == 1
+        assert stub_rag.index_note("missing.md") is False
+
+    def test_notes_are_read_on_calling_thread(self, stub_rag, nm, monkeypatch):
+        """Test that NoteManager is never touched from the index worker."""
+        filenames = [nm.create_note(f"Note {i}", "Content") for i in range(3)]
+        readers = set()
+        get_note = nm.get_note
+        iter_all_notes = nm.iter_all_notes
+
+        def recording_get_note(filename):
+            readers.add(threading.current_thread().name)
+            return get_note(filename)
+
+        def recording_iter_all_notes():
+            for note in iter_all_notes():
+                readers.add(threading.current_thread().name)
+                yield note
+
+        monkeypatch.setattr(nm, "get_note", recording_get_note)
+        monkeypatch.setattr(nm, "iter_all_notes", recording_iter_all_notes)
+
+        stub_rag.index_note(filenames[0])
+        stats = stub_rag.reindex_all_notes()
+
+        assert readers == {threading.current_thread().name}
+        assert stats == {"total": 3, "indexed": 3, "failed": 0}
+        assert sorted(stub_rag.collection.records) == sorted(filenames)
+
+    def test_reindex_saves_store_once(self, stub_rag, nm):
+        """Test that a rebuild flushes the store after the last batch only."""
+        with nm.batch():
+            for i in range(5):
+                nm.create_note(f"Note {i}", "Content")
+        stub_rag.INDEX_BATCH_SIZE = 2
+
+        stub_rag.reindex_all_notes()
+
+        ops = [op for op, _, _ in stub_rag.collection.writes]
+        assert ops == ["upsert", "upsert", "upsert", "flush"]
+
+    def test_search_waits_for_queued_writes(self, stub_rag, nm, monkeypatch):
+        """Test that a note queued for indexing is visible to the next search."""
+        filename = nm.create_note("Fresh", "Content")
+        release = threading.Event()
+        upsert = stub_rag.collection.upsert
+
+        def slow_upsert(**kwargs):
+            release.wait(5)
+            upsert(**kwargs)
+
+        monkeypatch.setattr(stub_rag.collection, "upsert", slow_upsert)
+        stub_rag.index_note_async(filename)
+        threading.Timer(0.05, release.set).start()
+
+        results = stub_rag.search_notes("fresh")
+
+        assert [r["filename"] for r in results] == [filename]
+        assert results[0]["title"] == "Fresh"
+
+    def test_shutdown_unregisters_exit_hook(self, stub_rag, nm, monkeypatch):
+        """Test that the exit hook is registered with the worker and dropped on shutdown."""
+        unregistered = []
+        monkeypatch.setattr(atexit, "unregister", unregistered.append)
+        stub_rag.index_note(nm.create_note("Hook", "Content"))
+        hook = stub_rag._atexit_hook
+        assert hook is not None
+
+        stub_rag.shutdown()
+
+        assert unregistered == [hook]
+        assert stub_rag._atexit_hook is None
+
+    def test_exit_hook_does_not_keep_manager_alive(self, nm, tmp_path, monkeypatch):
+        """Test that a manager dropped without shutdown() can be collected."""
+        monkeypatch.setattr(rag_module, "CHROMADB_AVAILABLE", False)
+        rag = RAGManager(nm, vector_db_dir=tmp_path / "vector_db")
+        rag.collection = StubCollection()
+        rag._available = True
+        rag.index_note(nm.create_note("Hook", "Content"))
+        hook = rag._atexit_hook
+
+        ref = weakref.ref(rag)
+        del rag
+        gc.collect()
+
+        assert ref() is None
+        hook()  # a no-op once the manager is gone
+        atexit.unregister(hook)
+
+
+def saved_hashes(rag):
+    """Filenames recorded in the sidecar on disk."""
+    return set(json.loads(rag._index_hashes_path.read_text())["hashes"])
+
+
+class TestIndexHashCache:
+    """Test the content-hash sidecar that lets unchanged notes skip the store."""
+
+    def test_single_writes_are_saved_on_shutdown(self, stub_rag, nm):
+        """Test that single-note writes do not save the store and sidecar each time."""
+        first = nm.create_note("First", "Content")
+        second = nm.create_note("Second", "Content")
+
+        stub_rag.index_note(first)
+        stub_rag.index_note(second)
+        stub_rag.remove_from_index(first)
+        assert "flush" not in [op for op, _, _ in stub_rag.collection.writes]
+        assert not stub_rag._index_hashes_path.exists()
+
+        stub_rag.shutdown()
+
+        assert [op for op, _, _ in stub_rag.collection.writes][-1] == "flush"
+        assert saved_hashes(stub_rag) == {second}
+
+    def test_single_writes_save_once_per_interval(self, stub_rag, nm):
+        """Test that a write after FLUSH_INTERVAL_SECONDS saves both files."""
+        filename = nm.create_note("First", "Content")
+        stub_rag._last_flush -= stub_rag.FLUSH_INTERVAL_SECONDS
+
+        stub_rag.index_note(filename)
+        stub_rag.remove_from_index(filename)
+
+        assert [op for op, _, _ in stub_rag.collection.writes] == ["upsert", "flush", "delete"]
+        assert saved_hashes(stub_rag) == {filename}
+
+    def test_sidecar_with_matching_ids_is_trusted(self, stub_rag, nm):
+        """Test that a fresh manager skips notes recorded in a matching sidecar."""
+        filename = nm.create_note("Cached", "Content")
+        stub_rag.index_note(filename)
+        stub_rag.shutdown()
+        stub_rag._index_hashes = {}
+
+        stub_rag._load_index_hashes()
+        writes = len(stub_rag.collection.writes)
+
+        assert set(stub_rag._index_hashes) == {filename}
+        assert stub_rag.index_note(filename) is True
+        assert len(stub_rag.collection.writes) == writes
+
+    def test_sidecar_with_same_count_but_other_ids_is_ignored(self, stub_rag, nm):
+        """Test that a stale sidecar is not trusted just because the count matches."""
+        filename = nm.create_note("Indexed", "Content")
+        stub_rag.index_note(filename)
+        stub_rag._index_hashes_path.parent.mkdir(parents=True, exist_ok=True)
+        stub_rag._index_hashes_path.write_text(json.dumps(
+            {**stub_rag._index_identity, "hashes": {"other.md": "stale"}}
+        ))
+        stub_rag._index_hashes = {}
+
+        stub_rag._load_index_hashes()
+
+        assert stub_rag.collection.count() == 1
+        assert stub_rag._index_hashes == {}
+
+    def test_sidecar_lives_next_to_its_store(self, make_rag, tmp_path):
+        """Test that the chroma and faiss backends keep separate sidecars."""
+        chroma = make_rag()
+        faiss = make_rag(backend="faiss")
+
+        assert chroma._index_hashes_path == tmp_path / "vector_db" / "chroma_content_hashes.json"
+        assert faiss._index_hashes_path == tmp_path / "vector_db" / "faiss" / "content_hashes.json"
+
+    @pytest.mark.parametrize("setting, value", [
+        ("backend", "chroma"),
+        ("embedding_provider", "openai"),
+        ("embedding_model", "other-model"),
+    ])
+    def test_sidecar_from_other_settings_is_ignored(self, stub_rag, nm, setting, value):
+        """Test that digests recorded under another backend or model are dropped."""
+        filename = nm.create_note("Indexed", "Content")
+        stub_rag.index_note(filename)
+        stub_rag.shutdown()
+        sidecar = json.loads(stub_rag._index_hashes_path.read_text())
+        sidecar[setting] = value
+        stub_rag._index_hashes_path.write_text(json.dumps(sidecar))
+        stub_rag._index_hashes = {}
+
+        stub_rag._load_index_hashes()
+
+        assert stub_rag._index_hashes == {}
+
+    def test_model_change_re_embeds_unchanged_text(self, stub_rag, nm):
+        """Test that stored vectors from another model are replaced, not kept."""
+        filename = nm.create_note("Indexed", "Content")
+        stub_rag.index_note(filename)
+        stub_rag._index_hashes = {}
+        stub_rag.embedding_model = "other-model"
+
+        assert stub_rag.index_note(filename) is True
+
+        assert [op for op, _, _ in stub_rag.collection.writes] == ["upsert", "upsert"]
+        stored = stub_rag.collection.records[filename][1]
+        assert stored["embedding_model"] == "sentence-transformers:other-model"
@@ -0,0 +1,58 @@
+"""Tests for the SM-2 spaced repetition schedule (review notes)."""
+
+from datetime import datetime
+
+import pytest
+
+from src.learnbase.core.spaced_rep import (
+    calculate_next_review,
+    EASE_FACTOR_MIN,
+    EASE_FACTOR_MAX,
+    EASE_DECREASE_POOR,
+    EASE_DECREASE_FAIR,
+    EASE_INCREASE_EXCELLENT,
+)
+
+
+NOW = datetime(2026, 1, 1)
+
+
+def ease_after(rating, ease_factor):
+    _, new_ease, _ = calculate_next_review(
+        rating=rating, current_interval=5, ease_factor=ease_factor, review_count=3, now=NOW
+    )
+    return new_ease
+
+
+class TestEaseFactorBounds:
+    @pytest.mark.parametrize("rating,expected", [
+        (1, EASE_FACTOR_MIN),
+        (2, EASE_FACTOR_MIN),
+        (3, EASE_FACTOR_MIN),
+        (4, EASE_FACTOR_MIN + EASE_INCREASE_EXCELLENT),
+    ])
+    def test_at_minimum(self, rating, expected):
+        assert ease_after(rating, EASE_FACTOR_MIN) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("rating,expected", [
+        (1, EASE_FACTOR_MAX - EASE_DECREASE_POOR),
+        (2, EASE_FACTOR_MAX - EASE_DECREASE_FAIR),
+        (3, EASE_FACTOR_MAX),
+        (4, EASE_FACTOR_MAX),
+    ])
+    def test_at_maximum(self, rating, expected):
+        assert ease_after(rating, EASE_FACTOR_MAX) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("rating,expected", [
+        (1, EASE_FACTOR_MAX + 0.5 - EASE_DECREASE_POOR),
+        (2, EASE_FACTOR_MAX + 0.5 - EASE_DECREASE_FAIR),
+        (3, EASE_FACTOR_MAX + 0.5),
+        (4, EASE_FACTOR_MAX),
+    ])
+    def test_out_of_range_ease_is_clamped_only_toward_moved_bound(self, rating, expected):
+        """Test that a hand-edited ease above the max is only clamped by rating 4."""
+        assert ease_after(rating, EASE_FACTOR_MAX + 0.5) == pytest.approx(expected)
+
+    def test_below_minimum_is_kept_by_good_rating(self):
+        assert ease_after(3, 1.0) == 1.0
+        assert ease_after(1, 1.0) == EASE_FACTOR_MIN
@@ -0,0 +1,84 @@
+"""Tests for ToLearnManager (to_learn.md topics)."""
+
+import pytest
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+from src.learnbase.core.to_learn_manager import ToLearnManager
+
+
+@pytest.fixture
+def tlm():
+    """Create a ToLearnManager on a temporary file."""
+    with TemporaryDirectory() as tmpdir:
+        yield ToLearnManager(Path(tmpdir) / "to_learn.md")
+
+
+class TestParseCache:
+    """Test that parses are reused until the file changes."""
+
+    def test_unchanged_file_is_not_reread(self, tlm, monkeypatch):
+        """Test that repeat reads of an unchanged file skip parsing."""
+        tlm.add_topic("TLS", context="security")
+        monkeypatch.setattr(tlm, "_parse_content", lambda content: pytest.fail("file re-parsed"))
+
+        assert tlm.get_topic("tls")["context"] == "security"
+        assert [t["topic"] for t in tlm.list_topics()] == ["TLS"]
+
+    def test_returned_topics_are_read_only(self, tlm):
+        """Test that callers cannot modify the cached topics."""
+        tlm.add_topic("TLS")
+        with pytest.raises(TypeError):
+            tlm.get_topic("TLS")["context"] = "changed"
+        with pytest.raises(TypeError):
+            tlm.list_topics()[0]["context"] = "changed"
+        tlm.list_topics().clear()
+
+        assert tlm.get_topic("TLS")["context"] == ""
+        assert len(tlm.list_topics()) == 1
+
+    def test_external_edit_is_picked_up(self, tlm):
+        """Test that a file rewritten behind the manager's back is re-parsed."""
+        tlm.add_topic("TLS")
+        content = tlm.file_path.read_text(encoding="utf-8")
+        tlm.file_path.write_text(content.replace("| TLS |", "| QUIC |"), encoding="utf-8")
+
+        assert tlm.get_topic("TLS") is None
+        assert tlm.get_topic("QUIC") is not None
+
+
+class TestParsing:
+    """Test reading topics back from to_learn.md."""
+
+    def test_metadata_value_containing_label_round_trips(self, tlm):
+        """Test that only the leading label is stripped from a metadata line."""
+        tlm.add_topic("TLS", context="see **Context:** RFC 8446", detailed=True)
+
+        assert tlm.get_topic("TLS")["context"] == "see **Context:** RFC 8446"
+
+
+class TestMigration:
+    """Test migrating topics from the old one-file-per-topic layout."""
+
+    def test_migration_writes_once_and_skips_duplicates(self, tlm, monkeypatch):
+        """Test that all topics land in one write and case-insensitive duplicates fail."""
+        tlm.add_topic("TLS")
+        old_dir = tlm.learnbase_dir / "old"
+        old_dir.mkdir()
+        for name, body in [("QUIC", "Transport"), ("tls", "Dup"), ("quic", "Dup")]:
+            (old_dir / f"{name}.md").write_text(body, encoding="utf-8")
+
+        writes = []
+        write_file = tlm._write_file
+
+        def counting_write(data):
+            writes.append(data)
+            write_file(data)
+
+        monkeypatch.setattr(tlm, "_write_file", counting_write)
+        summary = tlm.migrate_from_old_files(old_dir, sorted(old_dir.glob("*.md")))
+
+        assert len(writes) == 1
+        assert summary["migrated_files"] == ["QUIC.md"]
+        assert sorted(f["file"] for f in summary["failed_files"]) == ["quic.md", "tls.md"]
+        assert tlm.get_topic("quic")["notes"] == "Transport"